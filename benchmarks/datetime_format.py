@@ -0,0 +1,52 @@
+"""Benchmarks `parse_format` against `datetime.strptime`, and `DateTime(format=...)` against
+`DateTime(map_before=...)` with `strptime`.
+
+Run from the root of the repository with `python -m benchmarks.datetime_format`.
+"""
+import timeit
+from datetime import datetime
+
+import expyct as exp
+from expyct import parse_format
+
+CASES = [
+    ("%d/%m/%Y %H:%M", "02/01/2020 03:04"),
+    ("%Y%m%dT%H%M%S", "20200102T030405"),
+    ("%Y-%m-%d", "2020-01-02"),
+    # Not zero-padded, so parsed by strptime after all
+    ("%d/%m/%Y", "2/1/2020"),
+    # Cannot be compiled, so always parsed by strptime
+    ("%b %d %Y", "Jan 02 2020"),
+]
+
+NUMBER = 100_000
+
+
+def bench(name: str, statement: str, **namespace) -> float:
+    seconds = min(timeit.repeat(statement, globals=namespace, number=NUMBER, repeat=5))
+    print(f"  {name:<32} {seconds / NUMBER * 1e9:8.0f} ns")
+    return seconds
+
+
+def main():
+    for format, dt in CASES:
+        print(f"{format!r} {dt!r}")
+        strptime = bench(
+            "datetime.strptime",
+            "strptime(dt, format)",
+            **{"strptime": datetime.strptime, "dt": dt, "format": format},
+        )
+        compiled = bench(
+            "parse_format",
+            "parse_format(dt, format)",
+            **{"parse_format": parse_format, "dt": dt, "format": format},
+        )
+        print(f"  {'speedup':<32} {strptime / compiled:8.1f}x")
+
+        mapped = exp.DateTime(map_before=lambda s: datetime.strptime(s, format))
+        bench("DateTime(map_before=strptime)", "matcher == dt", matcher=mapped, dt=dt)
+        bench("DateTime(format=...)", "matcher == dt", matcher=exp.DateTime(format=format), dt=dt)
+
+
+if __name__ == "__main__":
+    main()
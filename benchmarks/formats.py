@@ -0,0 +1,80 @@
+"""Benchmarks the matchers of `expyct.formats` against the equivalent `String(regex=...)`
+matchers, on valid and invalid strings.
+
+Run from the root of the repository with `python -m benchmarks.formats`.
+"""
+import re
+import timeit
+
+import expyct as exp
+from expyct.formats import ANY_UUID_ANY_VERSION
+
+HEX = "[0-9a-fA-F]"
+IPV4_PART = "(25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+
+CASES = [
+    (
+        "UUID",
+        ANY_UUID_ANY_VERSION,
+        exp.String(regex=re.compile(f"{HEX}{{8}}-{HEX}{{4}}-{HEX}{{4}}-{HEX}{{4}}-{HEX}{{12}}")),
+        ["2f8b1a9e-6c1d-4b7e-9a3f-0c5d2e4f6a7b", "2f8b1a9e-6c1d-4b7e-9a3f-0c5d2e4f6a7"],
+    ),
+    (
+        "hex",
+        exp.ANY_HEX,
+        exp.String(regex=re.compile(f"{HEX}+")),
+        ["d41d8cd98f00b204e9800998ecf8427e", "d41d8cd98f00b204e9800998ecf8427g"],
+    ),
+    (
+        "IPv4",
+        exp.ANY_IPV4,
+        exp.String(regex=re.compile(rf"{IPV4_PART}(\.{IPV4_PART}){{3}}")),
+        ["192.168.100.254", "192.168.100.256"],
+    ),
+    (
+        "IPv6",
+        exp.ANY_IPV6,
+        # Only the full form, since a regex for all forms is unwieldy
+        exp.String(regex=re.compile(f"{HEX}{{1,4}}(:{HEX}{{1,4}}){{7}}")),
+        ["2001:db8:0:0:0:ff00:42:8329", "2001:db8:0:0:0:ff00:42:832g"],
+    ),
+    (
+        "base64",
+        exp.ANY_BASE64,
+        exp.String(regex=re.compile("([A-Za-z0-9+/]{4})*([A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?")),
+        ["aGVsbG8gd29ybGQsIGhlbGxvIHdvcmxkIQ==", "aGVsbG8gd29ybGQsIGhlbGxvIHdvcmxkIQ="],
+    ),
+    (
+        "ULID",
+        exp.ANY_ULID,
+        exp.String(regex=re.compile("[0-7][0-9A-HJKMNP-TV-Za-hjkmnp-tv-z]{25}")),
+        ["01ARZ3NDEKTSV4RRFFQ69G5FAV", "01ARZ3NDEKTSV4RRFFQ69G5FAU"],
+    ),
+    (
+        "alphanumeric",
+        exp.ANY_ALPHANUMERIC_STRING,
+        exp.String(regex=re.compile("[a-zA-Z0-9_]*")),
+        ["some_identifier_123", "some-identifier-123"],
+    ),
+]
+
+NUMBER = 100_000
+
+
+def bench(matcher, value) -> float:
+    seconds = min(timeit.repeat("matcher == value", globals=locals(), number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1e9
+
+
+def main():
+    print(f"{'':<14} {'':<8} {'formats':>10} {'regex':>10} {'speedup':>8}")
+    for name, matcher, regex, values in CASES:
+        for value, validity in zip(values, ["valid", "invalid"]):
+            fast = bench(matcher, value)
+            slow = bench(regex, value)
+            assert (matcher == value) == (regex == value), (name, value)
+            print(f"{name:<14} {validity:<8} {fast:8.0f}ns {slow:8.0f}ns {slow / fast:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
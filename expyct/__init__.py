@@ -1,70 +1,249 @@
 # flake8: noqa
 
-from ._patch import patch_pytest_assert_comp_order
-from .any import Any, AnyValue, AnyType, ANY, ANY_VALUE, ANY_TYPE
-from .base import MapBefore, Satisfies, Instance, Type, Equals, Vars, Optional
-from .collection import (
-    Collection,
-    Length,
-    List,
-    Tuple,
-    Set,
-    Dict,
-    ANY_COLLECTION,
-    ANY_NONEMPTY_COLLECTION,
-    ANY_LIST,
-    ANY_NONEMPTY_LIST,
-    ANY_TUPLE,
-    ANY_NONEMPTY_TUPLE,
-    ANY_SET,
-    ANY_NONEMPTY_SET,
-    ANY_DICT,
-    ANY_NONEMPTY_DICT,
-)
-from .combination import OneOf
-from .datetime import (
-    DateTime,
-    DateTimeTz,
-    Date,
-    Time,
-    parse_isoformat,
-    ANY_DATETIME,
-    ANY_DATE,
-    ANY_TIME,
-    ANY_DATETIME_ISO,
-    ANY_DATE_ISO,
-    ANY_TIME_ISO,
-    LAST_SECOND,
-    LAST_MINUTE,
-    LAST_HOUR,
-    LAST_DAY,
-    LAST_WEEK,
-    LAST_YEAR,
-    LAST_SECOND_ISO,
-    LAST_MINUTE_ISO,
-    LAST_HOUR_ISO,
-    LAST_DAY_ISO,
-    LAST_WEEK_ISO,
-    LAST_YEAR_ISO,
-    THIS_SECOND,
-    THIS_MINUTE,
-    THIS_HOUR,
-    THIS_DAY,
-    TODAY,
-    THIS_DAY_ISO,
-    TODAY_ISO,
-)
-from .number import (
-    MinMax,
-    MinMaxStrict,
-    CloseTo,
-    Number,
-    Int,
-    Float,
-    ANY_NUMBER,
-    ANY_INT,
-    ANY_FLOAT,
-)
-from .string import String, ANY_STRING, ANY_NONEMPTY_STRING, ANY_ALPHANUMERIC_STRING, ANY_UUID
+# Submodules and their public names are only imported on first access (PEP 562), which keeps
+# `import expyct` cheap for short-lived processes.
 
-__all__ = dir()
+import sys
+
+_ATTRIBUTES = {
+    "_patch": ["patch_pytest_assert_comp_order"],
+    "any": ["Any", "AnyValue", "AnyType", "ANY", "ANY_VALUE", "ANY_TYPE"],
+    "base": [
+        "MapBefore",
+        "Satisfies",
+        "Instance",
+        "Type",
+        "Equals",
+        "Vars",
+        "Attrs",
+        "Optional",
+        "AsyncSatisfies",
+        "amatch",
+    ],
+    "binary": ["Bytes", "Struct", "ANY_BYTES", "ANY_NONEMPTY_BYTES"],
+    "collection": [
+        "Collection",
+        "Length",
+        "List",
+        "Tuple",
+        "Set",
+        "Dict",
+        "Iterable",
+        "AsyncIterable",
+        "ANY_COLLECTION",
+        "ANY_NONEMPTY_COLLECTION",
+        "ANY_LIST",
+        "ANY_NONEMPTY_LIST",
+        "ANY_TUPLE",
+        "ANY_NONEMPTY_TUPLE",
+        "ANY_SET",
+        "ANY_NONEMPTY_SET",
+        "ANY_DICT",
+        "ANY_NONEMPTY_DICT",
+    ],
+    "combination": ["OneOf", "AllOf"],
+    "datetime": [
+        "DateTime",
+        "DateTimeTz",
+        "Date",
+        "Time",
+        "parse_isoformat",
+        "parse_format",
+        "ANY_DATETIME",
+        "ANY_DATE",
+        "ANY_TIME",
+        "ANY_DATETIME_ISO",
+        "ANY_DATE_ISO",
+        "ANY_TIME_ISO",
+        "LAST_SECOND",
+        "LAST_MINUTE",
+        "LAST_HOUR",
+        "LAST_DAY",
+        "LAST_WEEK",
+        "LAST_YEAR",
+        "LAST_SECOND_ISO",
+        "LAST_MINUTE_ISO",
+        "LAST_HOUR_ISO",
+        "LAST_DAY_ISO",
+        "LAST_WEEK_ISO",
+        "LAST_YEAR_ISO",
+        "THIS_SECOND",
+        "THIS_MINUTE",
+        "THIS_HOUR",
+        "THIS_DAY",
+        "TODAY",
+        "THIS_DAY_ISO",
+        "TODAY_ISO",
+    ],
+    "formats": [
+        "Uuid",
+        "Hex",
+        "IPv4",
+        "IPv6",
+        "Base64",
+        "Ulid",
+        "ANY_UUID_ANY_VERSION",
+        "ANY_UUID4",
+        "ANY_HEX",
+        "ANY_IPV4",
+        "ANY_IPV6",
+        "ANY_BASE64",
+        "ANY_ULID",
+    ],
+    "frame": ["Frame"],
+    "hints": ["from_type"],
+    "io": [],
+    "json": ["Json"],
+    "number": [
+        "MinMax",
+        "MinMaxStrict",
+        "CloseTo",
+        "Number",
+        "Int",
+        "Float",
+        "ANY_NUMBER",
+        "ANY_INT",
+        "ANY_FLOAT",
+    ],
+    "path": ["At", "Paths"],
+    "polling": ["Eventually"],
+    "string": [
+        "String",
+        "ANY_STRING",
+        "ANY_NONEMPTY_STRING",
+        "ANY_ALPHANUMERIC_STRING",
+        "ANY_UUID",
+    ],
+}
+
+_MODULE_OF = {name: module for module, names in _ATTRIBUTES.items() for name in names}
+
+__all__ = [name for names in _ATTRIBUTES.values() for name in names]
+
+TYPE_CHECKING = False
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    # Type checkers need the real imports, and module `__getattr__` is only supported from 3.7
+    from ._patch import patch_pytest_assert_comp_order
+    from .any import Any, AnyValue, AnyType, ANY, ANY_VALUE, ANY_TYPE
+    from .base import (
+        MapBefore,
+        Satisfies,
+        Instance,
+        Type,
+        Equals,
+        Vars,
+        Attrs,
+        Optional,
+        AsyncSatisfies,
+        amatch,
+    )
+    from .binary import Bytes, Struct, ANY_BYTES, ANY_NONEMPTY_BYTES
+    from .collection import (
+        Collection,
+        Length,
+        List,
+        Tuple,
+        Set,
+        Dict,
+        Iterable,
+        AsyncIterable,
+        ANY_COLLECTION,
+        ANY_NONEMPTY_COLLECTION,
+        ANY_LIST,
+        ANY_NONEMPTY_LIST,
+        ANY_TUPLE,
+        ANY_NONEMPTY_TUPLE,
+        ANY_SET,
+        ANY_NONEMPTY_SET,
+        ANY_DICT,
+        ANY_NONEMPTY_DICT,
+    )
+    from .combination import OneOf, AllOf
+    from .datetime import (
+        DateTime,
+        DateTimeTz,
+        Date,
+        Time,
+        parse_isoformat,
+        parse_format,
+        ANY_DATETIME,
+        ANY_DATE,
+        ANY_TIME,
+        ANY_DATETIME_ISO,
+        ANY_DATE_ISO,
+        ANY_TIME_ISO,
+        LAST_SECOND,
+        LAST_MINUTE,
+        LAST_HOUR,
+        LAST_DAY,
+        LAST_WEEK,
+        LAST_YEAR,
+        LAST_SECOND_ISO,
+        LAST_MINUTE_ISO,
+        LAST_HOUR_ISO,
+        LAST_DAY_ISO,
+        LAST_WEEK_ISO,
+        LAST_YEAR_ISO,
+        THIS_SECOND,
+        THIS_MINUTE,
+        THIS_HOUR,
+        THIS_DAY,
+        TODAY,
+        THIS_DAY_ISO,
+        TODAY_ISO,
+    )
+    from .formats import (
+        Uuid,
+        Hex,
+        IPv4,
+        IPv6,
+        Base64,
+        Ulid,
+        ANY_UUID_ANY_VERSION,
+        ANY_UUID4,
+        ANY_HEX,
+        ANY_IPV4,
+        ANY_IPV6,
+        ANY_BASE64,
+        ANY_ULID,
+    )
+    from .frame import Frame
+    from .hints import from_type
+    from .json import Json
+    from .number import (
+        MinMax,
+        MinMaxStrict,
+        CloseTo,
+        Number,
+        Int,
+        Float,
+        ANY_NUMBER,
+        ANY_INT,
+        ANY_FLOAT,
+    )
+    from .path import At, Paths
+    from .polling import Eventually
+    from .string import String, ANY_STRING, ANY_NONEMPTY_STRING, ANY_ALPHANUMERIC_STRING, ANY_UUID
+
+
+def _import_submodule(module):
+    # __import__ rather than importlib, so that the import shows up in `python -X importtime`
+    __import__(f"{__name__}.{module}")
+    return sys.modules[f"{__name__}.{module}"]
+
+
+def __getattr__(name):
+    if name in _ATTRIBUTES:
+        return _import_submodule(name)
+    try:
+        module = _MODULE_OF[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_import_submodule(module), name)
+    # Cache, so the next access does not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_ATTRIBUTES))
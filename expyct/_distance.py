@@ -0,0 +1,92 @@
+"""Bit-parallel edit distance (Myers' algorithm, in the formulation of Hyyrö).
+
+The columns of the dynamic programming matrix are represented as bit vectors of vertical
+differences, with one bit per character of the pattern. Python integers have arbitrary size, so
+patterns of any length need only a single "block".
+
+See: H. Hyyrö, "A bit-vector algorithm for computing Levenshtein and Damerau edit distances",
+Nordic Journal of Computing, 2003.
+"""
+import functools
+import typing
+
+
+@functools.lru_cache(maxsize=256)
+def _pattern_masks(pattern: typing.Sequence) -> typing.Dict[typing.Any, int]:
+    """Returns, for every character of the pattern, the bit vector of its positions."""
+    masks: typing.Dict[typing.Any, int] = {}
+    for i, c in enumerate(pattern):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def distance(
+    pattern: typing.Sequence,
+    text: typing.Sequence,
+    max_distance: typing.Optional[int] = None,
+    transpositions: bool = False,
+) -> int:
+    """Returns the Levenshtein distance between `pattern` and `text`, or the optimal string
+    alignment distance if `transpositions` (a transposition of two adjacent characters counts as
+    one edit). Stops early and returns `max_distance + 1` as soon as the distance is known to
+    exceed `max_distance`."""
+    m, n = len(pattern), len(text)
+    limit = max(m, n) if max_distance is None else max_distance
+    if abs(m - n) > limit:
+        return limit + 1
+    if m == 0:
+        return n
+    return _run(pattern, text, limit, transpositions, search=False)
+
+
+def search(
+    pattern: typing.Sequence,
+    text: typing.Sequence,
+    max_distance: int,
+    transpositions: bool = False,
+) -> bool:
+    """Returns whether `text` contains a substring within `max_distance` edits of `pattern`.
+    Stops as soon as one is found."""
+    m = len(pattern)
+    if m <= max_distance:
+        # Deleting the whole pattern is enough
+        return True
+    return _run(pattern, text, max_distance, transpositions, search=True) <= max_distance
+
+
+def _run(
+    pattern: typing.Sequence, text: typing.Sequence, limit: int, transpositions: bool, search: bool
+) -> int:
+    masks = _pattern_masks(pattern)
+    m, n = len(pattern), len(text)
+    ones = (1 << m) - 1
+    last = 1 << (m - 1)
+    # Global distance starts with one insertion per column in the first row, search with none
+    carry = 0 if search else 1
+    vp, vn = ones, 0
+    d0, previous_mask = 0, 0
+    score = m
+    for j, c in enumerate(text, 1):
+        mask = masks.get(c, 0)
+        if transpositions:
+            # Uses the diagonal zeros of the previous column
+            d0 = ((((~d0) & mask) << 1) & previous_mask) | (((mask & vp) + vp) ^ vp) | mask | vn
+            previous_mask = mask
+        else:
+            d0 = (((mask & vp) + vp) ^ vp) | mask | vn
+        hp = vn | ~(d0 | vp)
+        hn = d0 & vp
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        x = (hp << 1) | carry
+        vn = x & d0 & ones
+        vp = ((hn << 1) | ~(x | d0)) & ones
+        if search:
+            if score <= limit:
+                return score
+        elif score - (n - j) > limit:
+            # Every remaining column lowers the score by at most 1
+            return limit + 1
+    return score if search or score <= limit else limit + 1
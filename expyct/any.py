@@ -3,11 +3,12 @@ import typing
 
 from dataclasses import dataclass
 
-from expyct.base import MapBefore, Satisfies, Instance, Type, Equals, Vars, Optional, BaseMatcher
+from expyct.base import MapBefore, Satisfies, Instance, Type, Equals, Vars, Attrs, Optional
+from expyct.base import BaseMatcher
 
 
 @dataclass(repr=False, eq=False)
-class Any(Instance, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, BaseMatcher):
+class Any(Instance, Satisfies, Vars, Attrs, Equals[typing.Any], Optional, MapBefore, BaseMatcher):
     """Match any object.
 
     Args:
@@ -19,6 +20,7 @@ class Any(Instance, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, Ba
         satisfies : object must satisfy predicate
         type : type of object must equal to given type
         instance_of : object must be an instance of given type
+        attrs : mapping from attribute names to what the attribute must equal
     """
 
     def __init__(
@@ -30,6 +32,7 @@ class Any(Instance, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, Ba
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
         type: typing.Optional[typing.Type] = None,
         instance_of: typing.Optional[typing.Type] = None,
+        attrs: typing.Optional[typing.Mapping[str, typing.Any]] = None,
     ):
         self.map_before = map_before
         self.optional = optional
@@ -38,6 +41,7 @@ class Any(Instance, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, Ba
         self.satisfies = satisfies
         self.type = type
         self.instance_of = instance_of
+        self.attrs = attrs
 
     def _eq(self, other):
         try:
@@ -50,6 +54,8 @@ class Any(Instance, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, Ba
             return False
         if not Vars._eq(self, other):
             return False
+        if not Attrs._eq(self, other):
+            return False
         if not Satisfies._eq(self, other):
             return False
         if not Instance._eq(self, other):
@@ -62,6 +68,7 @@ class AnyValue(
     Instance,
     Satisfies,
     Vars,
+    Attrs,
     Equals[typing.Any],
     Optional,
     MapBefore,
@@ -78,6 +85,7 @@ class AnyValue(
         satisfies : object must satisfy predicate
         type : type of object must equal to given type
         instance_of : object must be an instance of given type
+        attrs : mapping from attribute names to what the attribute must equal
     """
 
     def __init__(
@@ -89,6 +97,7 @@ class AnyValue(
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
         type: typing.Optional[typing.Type] = None,
         instance_of: typing.Optional[typing.Type] = None,
+        attrs: typing.Optional[typing.Mapping[str, typing.Any]] = None,
     ):
         self.map_before = map_before
         self.optional = optional
@@ -97,6 +106,7 @@ class AnyValue(
         self.satisfies = satisfies
         self.type = type
         self.instance_of = instance_of
+        self.attrs = attrs
 
     def _eq(self, other):
         try:
@@ -117,6 +127,8 @@ class AnyValue(
             return False
         if not Vars._eq(self, other):
             return False
+        if not Attrs._eq(self, other):
+            return False
         if not Satisfies._eq(self, other):
             return False
         if not Instance._eq(self, other):
@@ -125,7 +137,7 @@ class AnyValue(
 
 
 @dataclass(repr=False, eq=False)
-class AnyType(Type, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, BaseMatcher):
+class AnyType(Type, Satisfies, Vars, Attrs, Equals[typing.Any], Optional, MapBefore, BaseMatcher):
     """Match any class.
 
     Args:
@@ -137,6 +149,7 @@ class AnyType(Type, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, Ba
         satisfies : object must satisfy predicate
         superclass_of : class must be superclass of given type
         subclass_of : class must be subclass of given type
+        attrs : mapping from attribute names to what the attribute must equal
     """
 
     def __init__(
@@ -148,6 +161,7 @@ class AnyType(Type, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, Ba
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
         superclass_of: typing.Optional[typing.Type] = None,
         subclass_of: typing.Optional[typing.Type] = None,
+        attrs: typing.Optional[typing.Mapping[str, typing.Any]] = None,
     ):
         self.map_before = map_before
         self.optional = optional
@@ -156,6 +170,7 @@ class AnyType(Type, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, Ba
         self.satisfies = satisfies
         self.superclass_of = superclass_of
         self.subclass_of = subclass_of
+        self.attrs = attrs
 
     def _eq(self, other):
         try:
@@ -168,6 +183,8 @@ class AnyType(Type, Satisfies, Vars, Equals[typing.Any], Optional, MapBefore, Ba
             return False
         if not Vars._eq(self, other):
             return False
+        if not Attrs._eq(self, other):
+            return False
         if not Satisfies._eq(self, other):
             return False
         if not Type._eq(self, other):
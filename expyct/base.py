@@ -1,28 +1,59 @@
 import abc
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import operator
 import typing
 
 from dataclasses import dataclass
 
 T = typing.TypeVar("T")
 
+#: Scratch space shared by all matchers taking part in one top-level evaluation
+_evaluation_cache: "contextvars.ContextVar[typing.Optional[dict]]" = contextvars.ContextVar(
+    "expyct_evaluation_cache", default=None
+)
+
 
 class BaseMatcher(abc.ABC):
     """Abstract base class from which all matchers inherit."""
 
     def __repr__(self):
         name = self._get_name()
-        args = ", ".join(f"{k}={repr(v)}" for k, v in vars(self).items() if v is not None)
+        args = ", ".join(f"{k}={repr(v)}" for k, v in self._get_args().items() if v is not None)
         return f"expyct.{name}({args})"
 
     def __str__(self):
         name = self._get_name()
-        args = ", ".join(f"{k}={v}" for k, v in vars(self).items() if v is not None)
+        args = ", ".join(f"{k}={v}" for k, v in self._get_args().items() if v is not None)
         return f"{name}({args})"
 
     def __eq__(self, other):
         if isinstance(other, type(self)):
-            return vars(other) == vars(self)
-        return self._eq(other)
+            return other._get_args() == self._get_args()
+        if _evaluation_cache.get() is not None:
+            return self._eq(other)
+        # This is a top-level evaluation, so nested matchers will share a fresh scratch cache
+        token = _evaluation_cache.set({})
+        try:
+            return self._eq(other)
+        finally:
+            _evaluation_cache.reset(token)
+
+    async def amatch(self, other) -> bool:
+        """Asynchronous variant of `==`, for use with `await`.
+
+        Awaitables are matched on their resolved value.
+        """
+        if inspect.isawaitable(other):
+            other = await other
+        return self == other
+
+    def _is_async(self) -> bool:
+        # Whether this matcher can only be evaluated with `amatch`
+        return False
 
     @abc.abstractmethod
     def _eq(self, other):
@@ -35,10 +66,54 @@ class BaseMatcher(abc.ABC):
         except AttributeError:
             return self.__class__.__name__
 
+    def _get_args(self) -> typing.Dict[str, typing.Any]:
+        # Attributes starting with an underscore hold internal state (like caches), not arguments
+        return {k: v for k, v in vars(self).items() if not k.startswith("_")}
+
+
+@contextlib.contextmanager
+def _evaluation() -> typing.Iterator[dict]:
+    """Context manager that starts a top-level evaluation (see `BaseMatcher.__eq__`), unless one is
+    already running, and returns its scratch cache."""
+    cache = _evaluation_cache.get()
+    if cache is not None:
+        yield cache
+        return
+    cache = {}
+    token = _evaluation_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _evaluation_cache.reset(token)
+
+
+def _is_async(obj: typing.Any) -> bool:
+    return isinstance(obj, BaseMatcher) and obj._is_async()
+
+
+async def amatch(expected: typing.Any, actual: typing.Any) -> bool:
+    """Match `actual` against `expected` using `expected.amatch` if it is a matcher, and `==`
+    otherwise.
+
+    Args:
+        expected : the matcher or object to match against
+        actual : the object to match
+    """
+    if isinstance(expected, BaseMatcher):
+        return await expected.amatch(actual)
+    if inspect.isawaitable(actual):
+        actual = await actual
+    return actual == expected
+
 
 class MapBefore:
     """Mixin for applying a function before checking equality.
 
+    Within one evaluation, the result (or exception) of applying a function to an object is
+    cached. So sibling matchers with the same `map_before`, like in
+    `OneOf([DateTime(map_before=parse_isoformat), Date(map_before=parse_isoformat)])`, only
+    apply it once.
+
     Args:
         map_before : the mapping function to apply
     """
@@ -50,7 +125,27 @@ class MapBefore:
 
     def map(self, other):
         if self.map_before:
-            return self.map_before(other)
+            cache = _evaluation_cache.get()
+            if cache is None:
+                return self.map_before(other)
+            key = (id(self.map_before), id(other))
+            try:
+                _, _, result, error = cache[key]
+            except KeyError:
+                try:
+                    result, error = self.map_before(other), None
+                except Exception as e:
+                    result, error = None, e
+                if isinstance(result, typing.Iterator):
+                    # Consumed by the first matcher, so every matcher must get its own
+                    return result
+                # Both objects are kept alive, so their ids cannot be reused during the evaluation
+                cache[key] = (self.map_before, other, result, error)
+            if error is not None:
+                # Without the traceback of the previous raise, which would grow with every raise
+                # and keep its frames alive
+                raise error.with_traceback(None)
+            return result
         else:
             return other
 
@@ -120,6 +215,50 @@ class Vars(BaseMatcher):
         return True
 
 
+@dataclass(repr=False, eq=False)
+class Attrs(BaseMatcher):
+    """Mixin for checking specific object attributes.
+
+    Unlike `Vars`, only the named attributes are read, with one `operator.attrgetter`. So this
+    also works on objects without a `__dict__`, like those of classes with `__slots__` and named
+    tuples. Dotted names, like `"owner.name"`, read nested attributes.
+
+    Args:
+        attrs : mapping from attribute names to what the attribute must equal
+    """
+
+    attrs: typing.Optional[typing.Mapping[str, typing.Any]] = None
+    _attrs_getter: typing.Any = None
+
+    def __init__(self, attrs: typing.Optional[typing.Mapping[str, typing.Any]] = None):
+        self.attrs = attrs
+
+    def _eq(self, other):
+        if self.attrs is not None:
+            # Compared by identity, since comparing the mapping takes as long as preparing it
+            if self._attrs_getter is None or self._attrs_getter[0] is not self.attrs:
+                names = tuple(self.attrs)
+                expected = tuple(self.attrs.values())
+                self._attrs_getter = (self.attrs, _attrgetter(names), expected, len(names))
+            _, getter, expected, count = self._attrs_getter
+            try:
+                values = getter(other)
+            except AttributeError:
+                return False
+            if count == 1:
+                # attrgetter returns the value itself, not a tuple, for a single name
+                values = (values,)
+            for value, e in zip(values, expected):
+                if not value == e:
+                    return False
+        return True
+
+
+@functools.lru_cache(maxsize=256)
+def _attrgetter(names: typing.Tuple[str, ...]) -> typing.Callable[[typing.Any], typing.Any]:
+    return operator.attrgetter(*names) if names else lambda obj: ()
+
+
 @dataclass(repr=False, eq=False)
 class Optional(BaseMatcher):
     """Mixin for matching with `None`.
@@ -218,3 +357,58 @@ class Type(BaseMatcher):
         if self.subclass_of and not issubclass(other, self.subclass_of):
             return False
         return True
+
+
+@dataclass(repr=False, eq=False)
+class AsyncSatisfies(BaseMatcher):
+    """Match any object that satisfies an asynchronous predicate, like a lookup in a data store.
+
+    It must be matched with `await matcher.amatch(value)`. When it is used for the members of a
+    collection, like in `List(all=AsyncSatisfies(exists))`, the members are checked concurrently,
+    at most `max_concurrency` at a time. The remaining checks are cancelled as soon as the result
+    is known. Within one evaluation, the predicate is called only once per (hashable) value.
+
+    Args:
+        satisfies : object must satisfy asynchronous predicate
+        max_concurrency : maximum number of concurrent predicate calls [default: 10]
+    """
+
+    satisfies: typing.Callable[[typing.Any], typing.Awaitable[bool]]
+    max_concurrency: int = 10
+
+    def __init__(
+        self,
+        satisfies: typing.Callable[[typing.Any], typing.Awaitable[bool]],
+        max_concurrency: int = 10,
+    ):
+        self.satisfies = satisfies
+        self.max_concurrency = max_concurrency
+
+    def _eq(self, other):
+        raise TypeError("AsyncSatisfies must be matched with `await matcher.amatch()`")
+
+    def _is_async(self) -> bool:
+        return True
+
+    async def amatch(self, other) -> bool:
+        if inspect.isawaitable(other):
+            other = await other
+        with _evaluation() as cache:
+            key = (AsyncSatisfies, id(self.satisfies), type(other), other)
+            try:
+                _, future = cache.get(key, (None, None))
+            except TypeError:
+                # Unhashable values are not cached
+                return await self._call(other)
+            # A cached call may have been cancelled, when its result was no longer needed
+            if future is None or future.cancelled():
+                future = asyncio.ensure_future(self._call(other))
+                # The predicate is kept alive, so its id cannot be reused during the evaluation
+                cache[key] = (self.satisfies, future)
+            return await future
+
+    async def _call(self, other) -> bool:
+        try:
+            return bool(await self.satisfies(other))
+        except Exception:
+            return False
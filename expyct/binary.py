@@ -0,0 +1,254 @@
+import re
+import struct
+import typing
+
+from dataclasses import dataclass
+
+from expyct.base import Equals, MapBefore, Satisfies, Optional, BaseMatcher
+
+
+@dataclass(repr=False, eq=False)
+class Bytes(Satisfies, Equals[bytes], Optional, MapBefore, BaseMatcher):
+    """Match any object that supports the buffer protocol, like `bytes`, `bytearray`,
+    `memoryview`, `array.array` and `mmap.mmap`.
+
+    The checks work directly on a `memoryview` of the object, so large buffers and memory-mapped
+    files are never copied into `bytes`. The length is measured in bytes.
+
+    Args:
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed [default: `False`]
+        equals : object must equal exactly. This is useful together with
+            `map_before` to check a value after applying a function
+        satisfies : object must satisfy predicate
+        length : object length in bytes must be exactly
+        min_length : object length in bytes must be at least
+        max_length : object length in bytes must be at most
+        non_empty : object must have at least one byte [default: `False`]
+        starts_with : object must start with given bytes
+        ends_with : object must end with given bytes
+        contains : object must contain given bytes
+        regex : object must fully match bytes pattern
+    """
+
+    length: typing.Optional[int] = None
+    min_length: typing.Optional[int] = None
+    max_length: typing.Optional[int] = None
+    non_empty: bool = False
+    starts_with: typing.Optional[bytes] = None
+    ends_with: typing.Optional[bytes] = None
+    contains: typing.Optional[bytes] = None
+    regex: typing.Optional[typing.Union[bytes, typing.Pattern]] = None
+
+    def __init__(
+        self,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+        equals: typing.Optional[typing.Any] = None,
+        satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
+        length: typing.Optional[int] = None,
+        min_length: typing.Optional[int] = None,
+        max_length: typing.Optional[int] = None,
+        non_empty: bool = False,
+        starts_with: typing.Optional[bytes] = None,
+        ends_with: typing.Optional[bytes] = None,
+        contains: typing.Optional[bytes] = None,
+        regex: typing.Optional[typing.Union[bytes, typing.Pattern]] = None,
+    ):
+        self.map_before = map_before
+        self.optional = optional
+        self.equals = equals
+        self.satisfies = satisfies
+        self.length = length
+        self.min_length = min_length
+        self.max_length = max_length
+        self.non_empty = non_empty
+        self.starts_with = starts_with
+        self.ends_with = ends_with
+        self.contains = contains
+        self.regex = regex
+
+    def _eq(self, other):
+        try:
+            other = MapBefore.map(self, other)
+        except Exception:
+            return False
+        if other is None:
+            return Optional._eq(self, other)
+        try:
+            view = memoryview(other)
+        except TypeError:
+            return False
+        # The view is released afterwards, because an mmap cannot be closed while it is exported
+        with view:
+            try:
+                with view.cast("B") as data:
+                    if not self._eq_buffer(other, data):
+                        return False
+            except TypeError:
+                # Not C-contiguous
+                return False
+        if not Satisfies._eq(self, other):
+            return False
+        return True
+
+    def _eq_buffer(self, other, data: memoryview) -> bool:
+        size = data.nbytes
+        if self.length is not None and not size == self.length:
+            return False
+        if self.min_length is not None and not size >= self.min_length:
+            return False
+        if self.max_length is not None and not size <= self.max_length:
+            return False
+        if self.non_empty and not size > 0:
+            return False
+        if self.equals is not None and not data == self.equals:
+            return False
+        if self.starts_with is not None:
+            if not data[: len(self.starts_with)] == self.starts_with:
+                return False
+        if self.ends_with is not None:
+            if len(self.ends_with) > size:
+                return False
+            if not data[size - len(self.ends_with) :] == self.ends_with:
+                return False
+        if self.contains is not None:
+            find = getattr(other, "find", None)
+            if find is not None:
+                # bytes, bytearray and mmap can search directly. The start is needed for mmap,
+                # which otherwise searches from its current position
+                if find(self.contains, 0) == -1:
+                    return False
+            elif not re.search(re.escape(self.contains), data):
+                return False
+        if self.regex is not None:
+            try:
+                if isinstance(self.regex, (str, bytes)):
+                    if not re.fullmatch(self.regex, data):
+                        return False
+                elif not self.regex.fullmatch(data):
+                    return False
+            except TypeError:
+                # A str pattern cannot match bytes
+                return False
+        return True
+
+
+@dataclass(repr=False, eq=False)
+class Struct(Satisfies, Optional, MapBefore, BaseMatcher):
+    """Match any object that supports the buffer protocol by the fields of a fixed binary layout,
+    as described by a `struct` format string. For example:
+
+    .. code-block:: python
+
+        expyct.Struct(format="<IHHq", fields={0: expyct.Int(min=1), 3: 0})
+
+    The fields are read with `struct.unpack_from` directly from a `memoryview` of the object,
+    without slicing it. With `repeated`, the object (after `offset`) must be an array of
+    records, which are unpacked in one batch with `struct.iter_unpack`, and the fields of every
+    record must match.
+
+    Args:
+        format : the `struct` format string of a record
+        fields : mapping from field index to what the field must equal
+        offset : byte offset at which the (first) record starts [default: 0]
+        repeated : whether the object is an array of records [default: `False`]
+        count : number of records must be exactly. Requires `repeated`
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed [default: `False`]
+        satisfies : object must satisfy predicate
+
+    Raises:
+        ValueError : if a field index is out of range for the format
+    """
+
+    format: str = ""
+    fields: typing.Optional[typing.Mapping[int, typing.Any]] = None
+    offset: int = 0
+    repeated: bool = False
+    count: typing.Optional[int] = None
+
+    def __init__(
+        self,
+        format: str,
+        fields: typing.Optional[typing.Mapping[int, typing.Any]] = None,
+        offset: int = 0,
+        repeated: bool = False,
+        count: typing.Optional[int] = None,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+        satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
+    ):
+        self.format = format
+        self.fields = fields
+        self.offset = offset
+        self.repeated = repeated
+        self.count = count
+        self.map_before = map_before
+        self.optional = optional
+        self.satisfies = satisfies
+        self._struct = struct.Struct(format)
+        # Unpacking zeros is the simplest way to count the fields, given padding and `s`
+        field_count = len(self._struct.unpack(bytes(self._struct.size)))
+        for i in fields or {}:
+            if not isinstance(i, int) or not -field_count <= i < field_count:
+                raise ValueError(f"format {format!r} has no field {i!r}")
+
+    def _eq(self, other):
+        try:
+            other = MapBefore.map(self, other)
+        except Exception:
+            return False
+        if other is None:
+            return Optional._eq(self, other)
+        try:
+            view = memoryview(other)
+        except TypeError:
+            return False
+        with view:
+            try:
+                with view.cast("B") as data:
+                    if self.repeated:
+                        if not self._eq_records(data):
+                            return False
+                    elif not self._eq_record(data):
+                        return False
+            except TypeError:
+                # Not C-contiguous
+                return False
+        if not Satisfies._eq(self, other):
+            return False
+        return True
+
+    def _eq_record(self, data: memoryview) -> bool:
+        if self.offset < 0 or data.nbytes < self.offset + self._struct.size:
+            return False
+        record = self._struct.unpack_from(data, self.offset)
+        for i, expected in (self.fields or {}).items():
+            if not record[i] == expected:
+                return False
+        return True
+
+    def _eq_records(self, data: memoryview) -> bool:
+        if self.offset < 0 or self.offset > data.nbytes:
+            return False
+        count, remainder = divmod(data.nbytes - self.offset, self._struct.size)
+        if remainder:
+            return False
+        if self.count is not None and not count == self.count:
+            return False
+        fields = list((self.fields or {}).items())
+        if not fields:
+            return True
+        with data[self.offset :] as records:
+            for record in self._struct.iter_unpack(records):
+                for i, expected in fields:
+                    if not record[i] == expected:
+                        return False
+        return True
+
+
+#: Any object supporting the buffer protocol
+ANY_BYTES = Bytes()
+#: Any object supporting the buffer protocol with length more than 0
+ANY_NONEMPTY_BYTES = Bytes(non_empty=True)
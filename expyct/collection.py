@@ -1,10 +1,14 @@
+import asyncio
+import copy
+import inspect
+import itertools
 import typing
 from collections import Counter
 
 from dataclasses import dataclass
 
 from expyct.base import Equals, MapBefore, Satisfies, Optional, BaseMatcher
-from expyct.base import Instance
+from expyct.base import Instance, amatch, _evaluation, _evaluation_cache, _is_async
 
 
 @dataclass(repr=False, eq=False)
@@ -40,6 +44,227 @@ class AllOrAny(BaseMatcher):
                 return False
         return True
 
+    def _is_async(self) -> bool:
+        return _is_async(self.all) or _is_async(self.any)
+
+    async def amatch(self, other) -> bool:
+        if inspect.isawaitable(other):
+            other = await other
+        if not self._is_async():
+            return self == other
+        with _evaluation():
+            # Everything but the members is checked synchronously first
+            rest = copy.copy(self)
+            rest.all = None
+            rest.any = None
+            if not rest == other:
+                return False
+            other = MapBefore.map(self, other)  # type: ignore
+            if other is None:
+                return True
+            if self.all is not None:
+                if not await AllOrAny._amatch_members(self.all, other, True):
+                    return False
+            if self.any is not None:
+                if not await AllOrAny._amatch_members(self.any, other, False):
+                    return False
+        return True
+
+    @staticmethod
+    async def _amatch_members(expected: typing.Any, members: typing.Iterable, all: bool) -> bool:
+        """Matches the members concurrently, with the concurrency limited by the
+        `max_concurrency` of `expected` (if any). Stops and cancels the remaining checks as soon
+        as one member decides the result: a mismatch for `all`, or a match for `any`."""
+        iterator = iter(members)
+
+        async def worker() -> bool:
+            for x in iterator:
+                if await amatch(expected, x) is not all:
+                    return True
+            return False
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(getattr(expected, "max_concurrency", 1))
+        ]
+        try:
+            pending = set(workers)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.result() for task in done):
+                    return not all
+            return all
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+@dataclass(repr=False, eq=False)
+class Aggregate(AllOrAny):
+    """Mixin for matching a collection object by aggregates of its members, in addition to `all`
+    and `any`.
+
+    All of these are checked in a single pass over the members, which stops as soon as the
+    result is known: on the first member that breaks one of them, or when all of them are known
+    to hold.
+
+    Args:
+        all : all members of collection must equal
+        any : any member of collection must equal
+        count_matching : tuple of `(matcher, min, max)`. The number of members equal to `matcher`
+            must be at least `min` and at most `max`. Either can be `None`
+        unique : whether all members must be distinct [default: `False`]
+        sorted : whether the members must be in ascending order [default: `False`]
+        sorted_by : the members must be in ascending order of the result of this function
+        sum_min : sum of the members must be at least. The members can be anything that can be
+            added, like `timedelta` objects
+        sum_max : sum of the members must be at most
+        sum_by : function to apply to each member before summing it
+    """
+
+    count_matching: typing.Optional[
+        typing.Tuple[typing.Any, typing.Optional[int], typing.Optional[int]]
+    ] = None
+    unique: bool = False
+    sorted: bool = False
+    sorted_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None
+    sum_min: typing.Optional[typing.Any] = None
+    sum_max: typing.Optional[typing.Any] = None
+    sum_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None
+
+    def __init__(
+        self,
+        all: typing.Optional[typing.Any] = None,
+        any: typing.Optional[typing.Any] = None,
+        count_matching: typing.Optional[
+            typing.Tuple[typing.Any, typing.Optional[int], typing.Optional[int]]
+        ] = None,
+        unique: bool = False,
+        sorted: bool = False,
+        sorted_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+        sum_min: typing.Optional[typing.Any] = None,
+        sum_max: typing.Optional[typing.Any] = None,
+        sum_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+    ):
+        self.all = all
+        self.any = any
+        self.count_matching = count_matching
+        self.unique = unique
+        self.sorted = sorted
+        self.sorted_by = sorted_by
+        self.sum_min = sum_min
+        self.sum_max = sum_max
+        self.sum_by = sum_by
+
+    def _eq(self, other):
+        if (
+            self.count_matching is None
+            and not self.unique
+            and not self.sorted
+            and self.sorted_by is None
+            and self.sum_min is None
+            and self.sum_max is None
+        ):
+            return AllOrAny._eq(self, other)
+
+        match_all = self.all is not None
+        match_any = self.any is not None
+        count_expected, count_min, count_max = self.count_matching or (None, None, None)
+        count = 0
+        # Whether counting can still change the result
+        counting = count_max is not None or bool(count_min)
+        unique = self.unique
+        seen = set()
+        unhashable = []
+        sort_key = self.sorted_by
+        if sort_key is None and self.sorted:
+            sort_key = _identity
+        previous = _MISSING
+        summing = self.sum_min is not None or self.sum_max is not None
+        sum_key = self.sum_by or _identity
+        # Starts from the first summed value rather than 0, so anything that can be added to
+        # itself, like `timedelta`, can be summed
+        total = _MISSING
+        # Only `any` and the minimum of `count_matching` can be known to hold before the end
+        until_end = match_all or unique or sort_key is not None or summing or count_max is not None
+
+        for x in other:
+            if match_all and not x == self.all:
+                return False
+            if match_any and x == self.any:
+                match_any = False
+            if counting and x == count_expected:
+                count += 1
+                if count_max is not None:
+                    if count > count_max:
+                        return False
+                elif count >= count_min:
+                    counting = False
+            if unique:
+                try:
+                    if x in seen:
+                        return False
+                    seen.add(x)
+                except TypeError:
+                    unhashable.append(x)
+            try:
+                if sort_key is not None:
+                    key = sort_key(x)
+                    if previous is not _MISSING and key < previous:
+                        return False
+                    previous = key
+                if summing:
+                    value = sum_key(x)
+                    total = value if total is _MISSING else total + value
+            except Exception:
+                # Members that cannot be ordered or summed
+                return False
+            if not (until_end or match_any or counting):
+                return True
+
+        if match_any:
+            return False
+        if counting and count_min is not None and count < count_min:
+            return False
+        if unhashable and not _is_unique(unhashable):
+            return False
+        if summing:
+            if total is _MISSING:
+                total = _zero_like(self.sum_min if self.sum_min is not None else self.sum_max)
+            try:
+                if self.sum_min is not None and not total >= self.sum_min:
+                    return False
+                if self.sum_max is not None and not total <= self.sum_max:
+                    return False
+            except TypeError:
+                # Sums that cannot be compared with the bounds
+                return False
+        return True
+
+
+_MISSING = object()
+
+
+def _zero_like(bound: typing.Any) -> typing.Any:
+    """Returns the sum of no members, as the zero of the type of the bound if it has one."""
+    try:
+        return type(bound)()
+    except Exception:
+        return 0
+
+
+def _identity(x: typing.Any) -> typing.Any:
+    return x
+
+
+def _is_unique(members: typing.List[typing.Any]) -> bool:
+    """Returns whether the (unhashable) members are distinct, by sorting them if possible."""
+    try:
+        ordered = sorted(members)
+    except TypeError:
+        return not any(a == b for i, a in enumerate(members) for b in members[i + 1 :])
+    return not any(a == b for a, b in zip(ordered, ordered[1:]))
+
 
 @dataclass(repr=False, eq=False)
 class Length(BaseMatcher):
@@ -70,17 +295,22 @@ class Length(BaseMatcher):
         self.non_empty = non_empty
 
     def _eq(self, other):
+        if self.length is None and self.min_length is None and self.max_length is None:
+            if self.non_empty:
+                return len(other) > 0
+            return True
+        length = len(other)
         if self.length is not None:
-            if not len(other) == self.length:
+            if not length == self.length:
                 return False
         if self.min_length is not None:
-            if not len(other) >= self.min_length:
+            if not length >= self.min_length:
                 return False
         if self.max_length is not None:
-            if not len(other) <= self.max_length:
+            if not length <= self.max_length:
                 return False
         if self.non_empty:
-            if not len(other) > 0:
+            if not length > 0:
                 return False
         return True
 
@@ -124,6 +354,191 @@ class Contains(BaseMatcher):
         return True
 
 
+@dataclass(repr=False, eq=False)
+class Ordered(BaseMatcher):
+    """Mixin for matching a sequence object by members that occur in a given order.
+
+    Members of `contains_in_order` are found with a single greedy pass, which takes the first
+    member that equals the next expected one. A `contains_run` of only `int`, `str`, `bytes`
+    and `None` values is found with the Knuth-Morris-Pratt algorithm, so both take linear time
+    in the length of the object. Any other `contains_run`, like one with matchers, is tried at
+    every position.
+
+    Args:
+        contains_in_order : object must contain members equal to these, in this order, possibly
+            with other members in between
+        contains_run : object must contain consecutive members equal to these, in this order
+    """
+
+    contains_in_order: typing.Optional[typing.Sequence] = None
+    contains_run: typing.Optional[typing.Sequence] = None
+    _run_table: typing.Any = None
+
+    def __init__(
+        self,
+        contains_in_order: typing.Optional[typing.Sequence] = None,
+        contains_run: typing.Optional[typing.Sequence] = None,
+    ):
+        self.contains_in_order = contains_in_order
+        self.contains_run = contains_run
+
+    def _eq(self, other):
+        if self.contains_in_order is not None:
+            if not _contains_in_order(other, self.contains_in_order):
+                return False
+        if self.contains_run is not None:
+            if not self._contains_run(other):
+                return False
+        return True
+
+    def _contains_run(self, other: typing.Sequence) -> bool:
+        run = self.contains_run
+        # Compared by identity, since comparing the run takes as long as building the table
+        if self._run_table is None or self._run_table[0] is not run:
+            # The failure table relies on `==` being transitive, which only holds for plain values,
+            # not for containers that may hold matchers
+            if all(type(x) in _SCALAR_TYPES for x in run):  # type: ignore
+                table = _failure_table(run)  # type: ignore
+            else:
+                table = None
+            self._run_table = (run, table)
+        table = self._run_table[1]
+        if table is None:
+            return _contains_run_naive(other, run)  # type: ignore
+        return _contains_run_kmp(other, run, table)  # type: ignore
+
+
+#: Types of which `==` is transitive, so a run of these can be found with Knuth-Morris-Pratt
+_SCALAR_TYPES = frozenset({int, bool, str, bytes, type(None)})
+
+
+def _contains_in_order(other: typing.Iterable, expected: typing.Sequence) -> bool:
+    if not expected:
+        return True
+    i = 0
+    for x in other:
+        if x == expected[i]:
+            i += 1
+            if i == len(expected):
+                return True
+    return False
+
+
+def _failure_table(run: typing.Sequence) -> typing.List[int]:
+    """Returns, for every prefix of `run`, the length of its longest proper prefix that is also a
+    suffix."""
+    table = [0] * len(run)
+    k = 0
+    for i in range(1, len(run)):
+        while k > 0 and not run[i] == run[k]:
+            k = table[k - 1]
+        if run[i] == run[k]:
+            k += 1
+        table[i] = k
+    return table
+
+
+def _contains_run_kmp(
+    other: typing.Iterable, run: typing.Sequence, table: typing.List[int]
+) -> bool:
+    if not run:
+        return True
+    k = 0
+    for x in other:
+        while k > 0 and not x == run[k]:
+            k = table[k - 1]
+        if x == run[k]:
+            k += 1
+            if k == len(run):
+                return True
+    return False
+
+
+def _contains_run_naive(other: typing.Sequence, run: typing.Sequence) -> bool:
+    for start in range(len(other) - len(run) + 1):
+        if all(other[start + i] == expected for i, expected in enumerate(run)):
+            return True
+    return False
+
+
+@dataclass(repr=False, eq=False)
+class Items(BaseMatcher):
+    """Mixin for matching a sequence object by its members at each position.
+
+    The number of members is checked first. Members are then checked directly with the `_eq` of
+    their matcher, without going through `==` and its reflected dispatch.
+
+    Args:
+        items : members must equal these, by position. The object must have as many members,
+            unless `rest` is given
+        rest : all members after those of `items` must equal
+    """
+
+    items: typing.Optional[typing.Sequence] = None
+    rest: typing.Optional[typing.Any] = None
+    _item_checks: typing.Any = None
+
+    def __init__(
+        self,
+        items: typing.Optional[typing.Sequence] = None,
+        rest: typing.Optional[typing.Any] = None,
+    ):
+        self.items = items
+        self.rest = rest
+
+    def _eq(self, other):
+        if self.items is None and self.rest is None:
+            return True
+        checks, rest = self._get_item_checks()
+        if self.rest is None:
+            if not len(other) == len(checks):
+                return False
+        elif not len(other) >= len(checks):
+            return False
+        with _evaluation():
+            for x, (check, expected) in zip(other, checks):
+                if not _match_item(x, check, expected):
+                    return False
+            if self.rest is not None:
+                check, expected = rest
+                for x in itertools.islice(other, len(checks), None):
+                    if not _match_item(x, check, expected):
+                        return False
+        return True
+
+    def _get_item_checks(self) -> typing.Tuple[typing.List[typing.Tuple], typing.Tuple]:
+        """Returns a `(check, expected)` pair for each of `items` and for `rest`, where `check` is
+        the `_eq` of a matcher and `None` otherwise."""
+        # Compared by identity, since comparing the items takes as long as preparing them
+        if (
+            self._item_checks is None
+            or self._item_checks[0] is not self.items
+            or self._item_checks[1] is not self.rest
+        ):
+            self._item_checks = (
+                self.items,
+                self.rest,
+                [_item_check(expected) for expected in self.items or ()],
+                _item_check(self.rest),
+            )
+        return self._item_checks[2], self._item_checks[3]
+
+
+def _item_check(expected: typing.Any) -> typing.Tuple[typing.Optional[typing.Callable], typing.Any]:
+    if isinstance(expected, BaseMatcher):
+        return expected._eq, expected
+    return None, expected
+
+
+def _match_item(
+    x: typing.Any, check: typing.Optional[typing.Callable], expected: typing.Any
+) -> bool:
+    # A matcher compared with a matcher compares their arguments, which only `==` does
+    if check is None or isinstance(x, BaseMatcher):
+        return x == expected
+    return check(x)
+
+
 @dataclass(repr=False, eq=False)
 class Collection(
     Satisfies,
@@ -133,7 +548,7 @@ class Collection(
     Equals[typing.Collection],
     Optional,
     MapBefore,
-    AllOrAny,
+    Aggregate,
     BaseMatcher,
 ):
     """Match any object that is an instance of `typing.Collection`.
@@ -154,6 +569,14 @@ class Collection(
         superset_of : collection of which the object must be a superset
         subset_of : collection of which the object must be a subset
         satisfies : object must satisfy predicate
+        count_matching : tuple of `(matcher, min, max)`. The number of members equal to `matcher`
+            must be at least `min` and at most `max`. Either can be `None`
+        unique : whether all members must be distinct [default: `False`]
+        sorted : whether the members must be in ascending order [default: `False`]
+        sorted_by : the members must be in ascending order of the result of this function
+        sum_min : sum of the members must be at least
+        sum_max : sum of the members must be at most
+        sum_by : function to apply to each member before summing it
     """
 
     def __init__(
@@ -172,6 +595,15 @@ class Collection(
         superset_of: typing.Optional[typing.Collection] = None,
         subset_of: typing.Optional[typing.Collection] = None,
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
+        count_matching: typing.Optional[
+            typing.Tuple[typing.Any, typing.Optional[int], typing.Optional[int]]
+        ] = None,
+        unique: bool = False,
+        sorted: bool = False,
+        sorted_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+        sum_min: typing.Optional[typing.Any] = None,
+        sum_max: typing.Optional[typing.Any] = None,
+        sum_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
     ):
         self.all = all
         self.any = any
@@ -187,6 +619,13 @@ class Collection(
         self.superset_of = superset_of
         self.subset_of = subset_of
         self.satisfies = satisfies
+        self.count_matching = count_matching
+        self.unique = unique
+        self.sorted = sorted
+        self.sorted_by = sorted_by
+        self.sum_min = sum_min
+        self.sum_max = sum_max
+        self.sum_by = sum_by
 
     def _eq(self, other):
         try:
@@ -207,14 +646,24 @@ class Collection(
             return False
         if not Satisfies._eq(self, other):
             return False
-        if not AllOrAny._eq(self, other):
+        if not Aggregate._eq(self, other):
             return False
         return True
 
 
 @dataclass(repr=False, eq=False)
 class List(
-    Satisfies, Contains, Length, Equals[list], Optional, MapBefore, AllOrAny, BaseMatcher, list
+    Satisfies,
+    Items,
+    Ordered,
+    Contains,
+    Length,
+    Equals[list],
+    Optional,
+    MapBefore,
+    Aggregate,
+    BaseMatcher,
+    list,
 ):
     """Match any object that is an instance of `list`.
 
@@ -233,6 +682,20 @@ class List(
         subset_of : collection of which the object must be a subset
         satisfies : object must satisfy predicate
         ignore_order : whether to ignore order for `equals`
+        contains_in_order : object must contain members equal to these, in this order, possibly
+            with other members in between
+        contains_run : object must contain consecutive members equal to these, in this order
+        count_matching : tuple of `(matcher, min, max)`. The number of members equal to `matcher`
+            must be at least `min` and at most `max`. Either can be `None`
+        unique : whether all members must be distinct [default: `False`]
+        sorted : whether the members must be in ascending order [default: `False`]
+        sorted_by : the members must be in ascending order of the result of this function
+        sum_min : sum of the members must be at least
+        sum_max : sum of the members must be at most
+        sum_by : function to apply to each member before summing it
+        items : members must equal these, by position. The object must have as many members,
+            unless `rest` is given
+        rest : all members after those of `items` must equal
     """
 
     ignore_order: bool = False
@@ -255,6 +718,19 @@ class List(
         subset_of: typing.Optional[typing.Collection] = None,
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
         ignore_order: bool = False,
+        contains_in_order: typing.Optional[typing.Sequence] = None,
+        contains_run: typing.Optional[typing.Sequence] = None,
+        count_matching: typing.Optional[
+            typing.Tuple[typing.Any, typing.Optional[int], typing.Optional[int]]
+        ] = None,
+        unique: bool = False,
+        sorted: bool = False,
+        sorted_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+        sum_min: typing.Optional[typing.Any] = None,
+        sum_max: typing.Optional[typing.Any] = None,
+        sum_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+        items: typing.Optional[typing.Sequence] = None,
+        rest: typing.Optional[typing.Any] = None,
     ):
         self.all = all
         self.any = any
@@ -269,6 +745,17 @@ class List(
         self.subset_of = subset_of
         self.satisfies = satisfies
         self.ignore_order = ignore_order
+        self.contains_in_order = contains_in_order
+        self.contains_run = contains_run
+        self.count_matching = count_matching
+        self.unique = unique
+        self.sorted = sorted
+        self.sorted_by = sorted_by
+        self.sum_min = sum_min
+        self.sum_max = sum_max
+        self.sum_by = sum_by
+        self.items = items
+        self.rest = rest
 
     def _eq(self, other):
         try:
@@ -287,11 +774,15 @@ class List(
                 return False
         if not Length._eq(self, other):
             return False
+        if not Items._eq(self, other):
+            return False
         if not Contains._eq(self, other):
             return False
+        if not Ordered._eq(self, other):
+            return False
         if not Satisfies._eq(self, other):
             return False
-        if not AllOrAny._eq(self, other):
+        if not Aggregate._eq(self, other):
             return False
         return True
 
@@ -306,7 +797,17 @@ class List(
 
 @dataclass(repr=False, eq=False)
 class Tuple(
-    Satisfies, Contains, Length, Equals[tuple], Optional, MapBefore, AllOrAny, BaseMatcher, tuple
+    Satisfies,
+    Items,
+    Ordered,
+    Contains,
+    Length,
+    Equals[tuple],
+    Optional,
+    MapBefore,
+    Aggregate,
+    BaseMatcher,
+    tuple,
 ):
     """Match any object that is an instance of `tuple`.
 
@@ -326,6 +827,20 @@ class Tuple(
         superset_of : collection of which the object must be a superset
         subset_of : collection of which the object must be a subset
         satisfies : object must satisfy predicate
+        contains_in_order : object must contain members equal to these, in this order, possibly
+            with other members in between
+        contains_run : object must contain consecutive members equal to these, in this order
+        count_matching : tuple of `(matcher, min, max)`. The number of members equal to `matcher`
+            must be at least `min` and at most `max`. Either can be `None`
+        unique : whether all members must be distinct [default: `False`]
+        sorted : whether the members must be in ascending order [default: `False`]
+        sorted_by : the members must be in ascending order of the result of this function
+        sum_min : sum of the members must be at least
+        sum_max : sum of the members must be at most
+        sum_by : function to apply to each member before summing it
+        items : members must equal these, by position. The object must have as many members,
+            unless `rest` is given
+        rest : all members after those of `items` must equal
     """
 
     def __new__(cls, *args, **kwargs):
@@ -345,6 +860,19 @@ class Tuple(
         superset_of: typing.Optional[typing.Collection] = None,
         subset_of: typing.Optional[typing.Collection] = None,
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
+        contains_in_order: typing.Optional[typing.Sequence] = None,
+        contains_run: typing.Optional[typing.Sequence] = None,
+        count_matching: typing.Optional[
+            typing.Tuple[typing.Any, typing.Optional[int], typing.Optional[int]]
+        ] = None,
+        unique: bool = False,
+        sorted: bool = False,
+        sorted_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+        sum_min: typing.Optional[typing.Any] = None,
+        sum_max: typing.Optional[typing.Any] = None,
+        sum_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+        items: typing.Optional[typing.Sequence] = None,
+        rest: typing.Optional[typing.Any] = None,
     ):
         self.all = all
         self.any = any
@@ -358,6 +886,17 @@ class Tuple(
         self.superset_of = superset_of
         self.subset_of = subset_of
         self.satisfies = satisfies
+        self.contains_in_order = contains_in_order
+        self.contains_run = contains_run
+        self.count_matching = count_matching
+        self.unique = unique
+        self.sorted = sorted
+        self.sorted_by = sorted_by
+        self.sum_min = sum_min
+        self.sum_max = sum_max
+        self.sum_by = sum_by
+        self.items = items
+        self.rest = rest
 
     def _eq(self, other):
         try:
@@ -372,18 +911,22 @@ class Tuple(
             return False
         if not Length._eq(self, other):
             return False
+        if not Items._eq(self, other):
+            return False
         if not Contains._eq(self, other):
             return False
+        if not Ordered._eq(self, other):
+            return False
         if not Satisfies._eq(self, other):
             return False
-        if not AllOrAny._eq(self, other):
+        if not Aggregate._eq(self, other):
             return False
         return True
 
 
 @dataclass(repr=False, eq=False)
 class Set(
-    Satisfies, Contains, Length, Equals[set], Optional, MapBefore, AllOrAny, BaseMatcher, set
+    Satisfies, Contains, Length, Equals[set], Optional, MapBefore, Aggregate, BaseMatcher, set
 ):
     """Match any object that is an instance of `set`.
 
@@ -403,6 +946,12 @@ class Set(
         superset_of : collection of which the object must be a superset
         subset_of : collection of which the object must be a subset
         satisfies : object must satisfy predicate
+        count_matching : tuple of `(matcher, min, max)`. The number of members equal to `matcher`
+            must be at least `min` and at most `max`. Either can be `None`
+        unique : whether all members must be distinct [default: `False`]
+        sum_min : sum of the members must be at least
+        sum_max : sum of the members must be at most
+        sum_by : function to apply to each member before summing it
     """
 
     def __new__(cls, *args, **kwargs):
@@ -422,6 +971,13 @@ class Set(
         superset_of: typing.Optional[typing.Collection] = None,
         subset_of: typing.Optional[typing.Collection] = None,
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
+        count_matching: typing.Optional[
+            typing.Tuple[typing.Any, typing.Optional[int], typing.Optional[int]]
+        ] = None,
+        unique: bool = False,
+        sum_min: typing.Optional[typing.Any] = None,
+        sum_max: typing.Optional[typing.Any] = None,
+        sum_by: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
     ):
         self.all = all
         self.any = any
@@ -435,6 +991,11 @@ class Set(
         self.superset_of = superset_of
         self.subset_of = subset_of
         self.satisfies = satisfies
+        self.count_matching = count_matching
+        self.unique = unique
+        self.sum_min = sum_min
+        self.sum_max = sum_max
+        self.sum_by = sum_by
 
     def _eq(self, other):
         try:
@@ -453,11 +1014,292 @@ class Set(
             return False
         if not Satisfies._eq(self, other):
             return False
-        if not AllOrAny._eq(self, other):
+        if not Aggregate._eq(self, other):
             return False
         return True
 
 
+@dataclass(repr=False, eq=False)
+class Iterable(Optional, MapBefore, BaseMatcher):
+    """Match any iterable object, like a generator, file or database cursor.
+
+    Unlike the other collection matchers, the object is not materialized. It is consumed once and
+    its members are counted and checked on the fly, so memory use is constant. Consuming stops
+    as soon as the result is known, for example on the first member not equal to `all` or when
+    `max_length` is exceeded. If `all` or `any` is asynchronous, like `AsyncSatisfies`, the object
+    must be matched with `await matcher.amatch(value)`.
+
+    Because consuming a generator is destructive, `match_and_replay()` also returns an iterator
+    over all members of the object, including those that were not consumed. Alternatively, with
+    `tee`, `replay()` returns this iterator for the last object matched with `==`. As this is
+    kept on the matcher, it is not thread-safe.
+
+    Args:
+        all : all members of iterable must equal
+        any : any member of iterable must equal
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed
+        length : number of members must be exactly
+        min_length : number of members must be at least
+        max_length : number of members must be at most
+        non_empty : object must have at least one member [default: `False`]
+        tee : whether to keep the consumed members for `replay()` [default: `False`]
+    """
+
+    all: typing.Optional[typing.Any] = None
+    any: typing.Optional[typing.Any] = None
+    length: typing.Optional[int] = None
+    min_length: typing.Optional[int] = None
+    max_length: typing.Optional[int] = None
+    non_empty: bool = False
+    tee: bool = False
+
+    def __init__(
+        self,
+        all: typing.Optional[typing.Any] = None,
+        any: typing.Optional[typing.Any] = None,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+        length: typing.Optional[int] = None,
+        min_length: typing.Optional[int] = None,
+        max_length: typing.Optional[int] = None,
+        non_empty: bool = False,
+        tee: bool = False,
+    ):
+        self.all = all
+        self.any = any
+        self.map_before = map_before
+        self.optional = optional
+        self.length = length
+        self.min_length = min_length
+        self.max_length = max_length
+        self.non_empty = non_empty
+        self.tee = tee
+        self._replay: typing.Any = None
+
+    def _eq(self, other):
+        matched, replay = self._match(other, self.tee)
+        if self.tee:
+            self._replay = replay
+        return matched
+
+    def match_and_replay(self, other) -> typing.Tuple[bool, typing.Optional[typing.Iterator]]:
+        """Matches like `==`, and returns whether the object matched together with an iterator
+        over all its members, or `None` if it is not iterable. Unlike `replay()`, this does not
+        require `tee` and is thread-safe.
+
+        Args:
+            other : the object to match
+        """
+        return self._match(other, True)
+
+    def replay(self) -> typing.Iterator:
+        """Returns an iterator over all members of the last matched object. Requires `tee`."""
+        if not self.tee:
+            raise ValueError("replay requires tee=True")
+        if self._replay is None:
+            raise ValueError("no iterable object has been matched")
+        return self._replay
+
+    def _length_bounds(self) -> typing.Tuple[int, typing.Optional[int]]:
+        min_length = max(self.length or 0, self.min_length or 0, 1 if self.non_empty else 0)
+        max_bounds = [x for x in (self.length, self.max_length) if x is not None]
+        return min_length, min(max_bounds) if max_bounds else None
+
+    def _match(self, other, tee: bool) -> typing.Tuple[bool, typing.Optional[typing.Iterator]]:
+        try:
+            other = MapBefore.map(self, other)
+        except Exception:
+            return False, None
+        if other is None:
+            return Optional._eq(self, other), None
+        if not isinstance(other, typing.Iterable):
+            return False, None
+        iterator = iter(other)
+        if not tee:
+            return self._consume(iterator), None
+        consumed: typing.List = []
+        matched = self._consume(Iterable._record(iterator, consumed))
+        return matched, itertools.chain(consumed, iterator)
+
+    def _consume(self, iterator: typing.Iterator) -> bool:
+        min_length, max_length = self._length_bounds()
+        found_any = self.any is None
+        # Without `all` or `max_length`, the result is decided as soon as these are satisfied
+        open_ended = self.all is None and max_length is None
+
+        count = 0
+        if open_ended and found_any and min_length == 0:
+            return True
+        # Every member is a top-level evaluation, so the scratch cache does not grow with the stream
+        token = _evaluation_cache.set(None)
+        try:
+            for x in iterator:
+                count += 1
+                if max_length is not None and count > max_length:
+                    return False
+                if self.all is not None and not x == self.all:
+                    return False
+                if not found_any and x == self.any:
+                    found_any = True
+                if open_ended and found_any and count >= min_length:
+                    return True
+        finally:
+            _evaluation_cache.reset(token)
+        return found_any and count >= min_length
+
+    def _is_async(self) -> bool:
+        return _is_async(self.all) or _is_async(self.any)
+
+    async def amatch(self, other) -> bool:
+        matched, replay = await self._amatch(other, self.tee)
+        if self.tee:
+            self._replay = replay
+        return matched
+
+    async def amatch_and_replay(self, other) -> typing.Tuple[bool, typing.Any]:
+        """Asynchronous variant of `match_and_replay()`.
+
+        Args:
+            other : the object to match
+        """
+        return await self._amatch(other, True)
+
+    async def _amatch(self, other, tee: bool) -> typing.Tuple[bool, typing.Any]:
+        """Returns whether the object matched, and the replay if `tee`."""
+        if inspect.isawaitable(other):
+            other = await other
+        if not self._is_async():
+            with _evaluation():
+                return self._match(other, tee)
+        try:
+            other = MapBefore.map(self, other)
+        except Exception:
+            return False, None
+        if other is None:
+            return Optional._eq(self, other), None
+        if not isinstance(other, typing.Iterable):
+            return False, None
+        iterator = iter(other)
+        if not tee:
+            return await self._consume_async(Iterable._aiter(iterator)), None
+        consumed: typing.List = []
+        matched = await self._consume_async(Iterable._aiter(Iterable._record(iterator, consumed)))
+        return matched, itertools.chain(consumed, iterator)
+
+    async def _consume_async(self, iterator: typing.AsyncIterator) -> bool:
+        min_length, max_length = self._length_bounds()
+        found_any = self.any is None
+        # Without `all` or `max_length`, the result is decided as soon as these are satisfied
+        open_ended = self.all is None and max_length is None
+
+        count = 0
+        if open_ended and found_any and min_length == 0:
+            return True
+        # Every member is a top-level evaluation, so the scratch cache does not grow with the stream
+        token = _evaluation_cache.set(None)
+        try:
+            async for x in iterator:
+                count += 1
+                if max_length is not None and count > max_length:
+                    return False
+                if self.all is not None and not await amatch(self.all, x):
+                    return False
+                if not found_any and await amatch(self.any, x):
+                    found_any = True
+                if open_ended and found_any and count >= min_length:
+                    return True
+        finally:
+            _evaluation_cache.reset(token)
+        return found_any and count >= min_length
+
+    @staticmethod
+    def _record(iterator: typing.Iterator, consumed: typing.List) -> typing.Iterator:
+        for x in iterator:
+            consumed.append(x)
+            yield x
+
+    @staticmethod
+    async def _aiter(iterator: typing.Iterator) -> typing.AsyncIterator:
+        for x in iterator:
+            yield x
+
+
+@dataclass(repr=False, eq=False)
+class AsyncIterable(Iterable):
+    """Match any asynchronous iterable, like an async generator or a paginated API client.
+
+    The object must be matched with `await matcher.amatch(value)`. Like `Iterable`, it is consumed
+    once, in constant memory, and consuming stops as soon as the result is known. Members are
+    matched with `amatch` as well, so they can be matched by other asynchronous matchers.
+    Synchronous iterables are accepted too.
+
+    The iterators returned by `amatch_and_replay()` and, with `tee`, by `replay()` are
+    asynchronous.
+
+    Args:
+        all : all members of iterable must equal
+        any : any member of iterable must equal
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed
+        length : number of members must be exactly
+        min_length : number of members must be at least
+        max_length : number of members must be at most
+        non_empty : object must have at least one member [default: `False`]
+        tee : whether to keep the consumed members for `replay()` [default: `False`]
+    """
+
+    def _is_async(self) -> bool:
+        return True
+
+    def _eq(self, other):
+        if isinstance(other, typing.AsyncIterable) or inspect.isawaitable(other):
+            raise TypeError("asynchronous objects must be matched with `await matcher.amatch()`")
+        return Iterable._eq(self, other)
+
+    async def _amatch(self, other, tee: bool) -> typing.Tuple[bool, typing.Any]:
+        if inspect.isawaitable(other):
+            other = await other
+        try:
+            other = MapBefore.map(self, other)
+        except Exception:
+            return False, None
+        if other is None:
+            return Optional._eq(self, other), None
+        if isinstance(other, typing.AsyncIterable):
+            iterator = other.__aiter__()
+        elif isinstance(other, typing.Iterable):
+            # Consumed asynchronously as well, since the members may need to be
+            iterator = Iterable._aiter(iter(other))
+        else:
+            return False, None
+        if not tee:
+            return await self._consume_async(iterator), None
+        consumed: typing.List = []
+        matched = await self._consume_async(AsyncIterable._record_async(iterator, consumed))
+        return matched, AsyncIterable._chain(consumed, iterator)
+
+    def replay(self) -> typing.AsyncIterator:  # type: ignore
+        """Returns an asynchronous iterator over all members of the last matched object.
+        Requires `tee`."""
+        return super().replay()  # type: ignore
+
+    @staticmethod
+    async def _record_async(
+        iterator: typing.AsyncIterator, consumed: typing.List
+    ) -> typing.AsyncIterator:
+        async for x in iterator:
+            consumed.append(x)
+            yield x
+
+    @staticmethod
+    async def _chain(consumed: typing.List, iterator: typing.AsyncIterator) -> typing.AsyncIterator:
+        for x in consumed:
+            yield x
+        async for x in iterator:
+            yield x
+
+
 @dataclass(repr=False, eq=False)
 class Dict(Satisfies, Contains, Length, Equals[dict], Optional, MapBefore, BaseMatcher, dict):
     """Match any object that is an instance of `dict`.
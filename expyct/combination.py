@@ -28,4 +28,32 @@ class OneOf(BaseMatcher):
         self.options = options
 
     def _eq(self, other):
-        return any(option.__eq__(other) for option in self.options)
+        # `==` rather than `option.__eq__`, which returns the truthy `NotImplemented` for plain
+        # values of another type
+        return any(option == other for option in self.options)
+
+
+@dataclass(repr=False, eq=False)
+class AllOf(BaseMatcher):
+    """Object must equal all of the given options.
+
+    This can be used to combine matchers. For example:
+
+    .. code-block:: python
+
+        expyct.AllOf([
+            expyct.Int(min=0),
+            expyct.Any(satisfies=lambda x: x % 2 == 0),
+        ])
+
+    Args:
+            options: objects to compare to
+    """
+
+    options: typing.Collection
+
+    def __init__(self, options: typing.Collection):
+        self.options = options
+
+    def _eq(self, other):
+        return all(option == other for option in self.options)
@@ -1,3 +1,5 @@
+import functools
+import operator
 import sys
 import typing
 from dataclasses import dataclass
@@ -74,6 +76,92 @@ class AfterBeforeStrict(typing.Generic[T], BaseMatcher):
         return True
 
 
+class Datetime64:
+    """Mixin for matching `numpy.datetime64` scalars and arrays. An array matches when all its
+    values match, and `NaT` values are treated as `None`. The bounds are converted to
+    `numpy.datetime64` once and compared with vectorized operations.
+
+    `numpy` is not required: these objects can only exist when it has been imported.
+    """
+
+    # The bounds and their conversions, from the last evaluation
+    _bounds64: typing.Any = None
+
+    def _eq_datetime64(
+        self,
+        other: typing.Any,
+        bounds: typing.Tuple[typing.Any, ...],
+        convert: typing.Callable[[typing.Any], typing.Any],
+        unit: str,
+        tz: typing.Optional[timezone] = None,
+    ) -> bool:
+        """Matches `other` using the bounds `(after, before, after_strict, before_strict)`, which
+        are converted with `convert`. For `satisfies`, the values are converted to `unit` and
+        given timezone `tz`."""
+        numpy = sys.modules["numpy"]
+        if self._bounds64 is None or not self._bounds64[0] == bounds:
+            converted = tuple(None if bound is None else convert(bound) for bound in bounds)
+            self._bounds64 = (bounds, converted)
+        after, before, after_strict, before_strict = self._bounds64[1]
+
+        values = numpy.asarray(other)
+        missing = numpy.isnat(values)
+        if missing.any() and not self.optional:  # type: ignore
+            return False
+        values = values[~missing]
+        if after is not None and not (values >= after).all():
+            return False
+        if before is not None and not (values <= before).all():
+            return False
+        if after_strict is not None and not (values > after_strict).all():
+            return False
+        if before_strict is not None and not (values < before_strict).all():
+            return False
+        if self.equals is not None and not (values == convert(self.equals)).all():  # type: ignore
+            return False
+        if self.satisfies is not None:  # type: ignore
+            for value in values.astype(f"datetime64[{unit}]").tolist():
+                if tz is not None:
+                    value = value.replace(tzinfo=tz)
+                if not Satisfies._eq(self, value):  # type: ignore
+                    return False
+        return True
+
+
+def _datetime64_unit(obj: typing.Any) -> typing.Optional[str]:
+    """Returns the unit of a `numpy.datetime64` scalar or array, or `None` if it is not one."""
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return None
+    if isinstance(obj, numpy.datetime64) or (
+        isinstance(obj, numpy.ndarray) and obj.dtype.kind == "M"
+    ):
+        unit, _ = numpy.datetime_data(obj.dtype)
+        return unit
+    return None
+
+
+def _is_datetime64_datetime(obj: typing.Any) -> bool:
+    return _datetime64_unit(obj) in ("h", "m", "s", "ms", "us", "ns", "ps", "fs", "as")
+
+
+def _is_datetime64_date(obj: typing.Any) -> bool:
+    return _datetime64_unit(obj) == "D"
+
+
+def _is_timestamp(obj: typing.Any) -> bool:
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(obj, pandas.Timestamp)
+
+
+def _to_datetime64(obj: typing.Any) -> typing.Any:
+    return sys.modules["numpy"].datetime64(obj)
+
+
+def _to_utc_datetime64(obj: datetime) -> typing.Any:
+    return _to_datetime64(obj.astimezone(timezone.utc).replace(tzinfo=None))
+
+
 @dataclass(repr=False, eq=False)
 class DateTime(
     Satisfies,
@@ -82,10 +170,12 @@ class DateTime(
     Equals[datetime],
     Optional,
     MapBefore,
+    Datetime64,
     BaseMatcher,
     datetime,
 ):
-    """Match any object that is an instance of `datetime`.
+    """Match any object that is an instance of `datetime`, or a `pandas.Timestamp`. Also matches
+    `numpy.datetime64` scalars and arrays with a unit of hours or finer (see `Datetime64`).
 
     Args:
         map_before : apply function before checking equality
@@ -97,8 +187,11 @@ class DateTime(
         after_strict : object must occur after given
         before_strict : object must occur before given
         satisfies : object must satisfy predicate
+        format : parse strings with this `strptime` format (see `parse_format`)
     """
 
+    format: typing.Optional[str] = None
+
     def __new__(cls, *args, **kwargs):
         return datetime.__new__(cls, 1, 1, 1)
 
@@ -112,6 +205,7 @@ class DateTime(
         after_strict: typing.Optional[datetime] = None,
         before_strict: typing.Optional[datetime] = None,
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
+        format: typing.Optional[str] = None,
     ):
 
         self.map_before = map_before
@@ -122,15 +216,21 @@ class DateTime(
         self.after_strict = after_strict
         self.before_strict = before_strict
         self.satisfies = satisfies
+        self.format = format
 
     def _eq(self, other):
         try:
             other = MapBefore.map(self, other)
+            if self.format is not None and isinstance(other, str):
+                other = parse_format(other, self.format)
         except Exception:
             return False
         if other is None:
             return Optional._eq(self, other)
-        if not type(other) == datetime:
+        if _is_datetime64_datetime(other):
+            bounds = (self.after, self.before, self.after_strict, self.before_strict)
+            return self._eq_datetime64(other, bounds, _to_datetime64, "us")
+        if not (type(other) == datetime or _is_timestamp(other)):
             return False
         if not Equals._eq(self, other):
             return False
@@ -151,11 +251,13 @@ class DateTimeTz(
     Equals[datetime],
     Optional,
     MapBefore,
+    Datetime64,
     BaseMatcher,
     datetime,
 ):
     """Match any object that is an instance of `datetime` and has timezone information (`tzinfo`).
-    In other words, is a timestamp.
+    In other words, is a timestamp. Also matches `pandas.Timestamp` objects with a timezone, and
+    `numpy.datetime64` scalars and arrays with a unit of hours or finer, as UTC (see `Datetime64`).
 
     Args:
         map_before : apply function before checking equality
@@ -204,6 +306,9 @@ class DateTimeTz(
     after_strict: typing.Optional[typing.Union[datetime, timedelta]] = None  # type: ignore
     before_strict: typing.Optional[typing.Union[datetime, timedelta]] = None  # type: ignore
 
+    # The bounds and their conversions to epoch microseconds, from the last evaluation
+    _bounds_us: typing.Any = None
+
     def _eq(self, other):
         try:
             other = MapBefore.map(self, other)
@@ -211,7 +316,9 @@ class DateTimeTz(
             return False
         if other is None:
             return Optional._eq(self, other)
-        if not type(other) == datetime:
+        if _is_datetime64_datetime(other):
+            return self._eq_utc_datetime64(other)
+        if not (type(other) == datetime or _is_timestamp(other)):
             return False
         if other.tzinfo is None:
             return False
@@ -220,41 +327,89 @@ class DateTimeTz(
                 raise ValueError("equals is missing tzinfo")
         if not Equals._eq(self, other):
             return False
-        if self.before:
-            self.before = DateTimeTz._handle_timedelta(self.before)
-            if self.before.tzinfo is None:
-                raise ValueError("before is missing tzinfo")
-        if self.after:
-            self.after = DateTimeTz._handle_timedelta(self.after)
-            if self.after.tzinfo is None:
-                raise ValueError("after is missing tzinfo")
-        if not AfterBefore._eq(self, other):
+        after, before, after_strict, before_strict = self._epoch_bounds()
+        value = _epoch_us(other)
+        if after is not None and not value >= after:
             return False
-        if self.before_strict:
-            self.before_strict = DateTimeTz._handle_timedelta(self.before_strict)
-            if self.before_strict.tzinfo is None:
-                raise ValueError("before_strict is missing tzinfo")
-        if self.after_strict:
-            self.after_strict = DateTimeTz._handle_timedelta(self.after_strict)
-            if self.after_strict.tzinfo is None:
-                raise ValueError("after_strict is missing tzinfo")
-        if not AfterBeforeStrict._eq(self, other):
+        if before is not None and not value <= before:
+            return False
+        if after_strict is not None and not value > after_strict:
+            return False
+        if before_strict is not None and not value < before_strict:
             return False
         if not Satisfies._eq(self, other):
             return False
         return True
 
-    @staticmethod
-    def _handle_timedelta(
-        bound: typing.Union[datetime, date, time, timedelta]
-    ) -> typing.Union[datetime, date, time]:
-        """When timedelta is passed, it is used as a time relative to when the assertion is
-        executed."""
-
-        if isinstance(bound, timedelta):
-            return datetime.now().astimezone(timezone.utc) + bound
-        else:
-            return bound
+    def _eq_utc_datetime64(self, other) -> bool:
+        """`numpy.datetime64` values have no timezone, so they are matched as UTC."""
+        bounds = tuple(
+            None if bound is None else _EPOCH + timedelta(microseconds=bound)
+            for bound in self._epoch_bounds()
+        )
+        if self.equals and self.equals.tzinfo is None:
+            raise ValueError("equals is missing tzinfo")
+        return self._eq_datetime64(other, bounds, _to_utc_datetime64, "us", timezone.utc)
+
+    def _epoch_bounds(self) -> typing.Tuple[typing.Optional[int], ...]:
+        """Returns the bounds `(after, before, after_strict, before_strict)` as UTC epoch
+        microseconds. Fixed bounds are only converted once, and `timedelta` bounds are resolved
+        relative to the current time on every evaluation."""
+        bounds = (self.after, self.before, self.after_strict, self.before_strict)
+        if self._bounds_us is None or not self._bounds_us[0] == bounds:
+            converted: typing.List[typing.Any] = []
+            for name, bound in zip(("after", "before", "after_strict", "before_strict"), bounds):
+                if isinstance(bound, datetime):
+                    if bound.tzinfo is None:
+                        raise ValueError(f"{name} is missing tzinfo")
+                    converted.append(_epoch_us(bound))
+                else:
+                    converted.append(bound)
+            self._bounds_us = (bounds, tuple(converted))
+        epoch_bounds = self._bounds_us[1]
+        if any(isinstance(bound, timedelta) for bound in epoch_bounds):
+            now = _epoch_us(datetime.now(timezone.utc))
+            epoch_bounds = tuple(
+                now + bound // _MICROSECOND if isinstance(bound, timedelta) else bound
+                for bound in epoch_bounds
+            )
+        return epoch_bounds
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(dt: datetime) -> int:
+    """Returns the number of microseconds since the UTC epoch of a timezone-aware `datetime`. Only
+    integer arithmetic is used, with one (cached) lookup of the UTC offset."""
+    days = dt.toordinal() - _EPOCH_ORDINAL
+    seconds = days * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+    return seconds * 1_000_000 + dt.microsecond - _utcoffset_us(dt)
+
+
+def _utcoffset_us(dt: datetime) -> int:
+    try:
+        offset = _hour_utcoffset_us(dt.tzinfo, dt.toordinal(), dt.hour, dt.fold)
+    except TypeError:
+        # The tzinfo object is not hashable
+        offset = None
+    if offset is None:
+        return dt.utcoffset() // _MICROSECOND  # type: ignore
+    return offset
+
+
+@functools.lru_cache(maxsize=4096)
+def _hour_utcoffset_us(tz: typing.Any, ordinal: int, hour: int, fold: int) -> typing.Optional[int]:
+    """Returns the UTC offset in microseconds of `tz` during an hour (in local time), or `None` if
+    the offset changes during the hour, like in zones with transitions at half past."""
+    start = datetime.fromordinal(ordinal).replace(hour=hour, fold=fold, tzinfo=tz)
+    end = start.replace(minute=59, second=59, microsecond=999999)
+    offset = start.utcoffset()
+    if not end.utcoffset() == offset:
+        return None
+    return offset // _MICROSECOND  # type: ignore
 
 
 @dataclass(repr=False, eq=False)
@@ -265,10 +420,12 @@ class Date(
     Equals[date],
     Optional,
     MapBefore,
+    Datetime64,
     BaseMatcher,
     date,
 ):
-    """Match any object that is an instance of `date`.
+    """Match any object that is an instance of `date`. Also matches `numpy.datetime64` scalars and
+    arrays with a unit of days (see `Datetime64`).
 
     Args:
             map_before : apply function before checking equality
@@ -282,8 +439,11 @@ class Date(
             after_strict : object must occur after given
             before_strict : object must occur before given
             satisfies : object must satisfy predicate
+            format : parse strings with this `strptime` format (see `parse_format`)
     """
 
+    format: typing.Optional[str] = None
+
     def __new__(cls, *args, **kwargs):
         return date.__new__(cls, 1, 1, 1)
 
@@ -297,6 +457,7 @@ class Date(
         after_strict: typing.Optional[date] = None,
         before_strict: typing.Optional[date] = None,
         satisfies: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
+        format: typing.Optional[str] = None,
     ):
         self.map_before = map_before
         self.optional = optional
@@ -306,14 +467,20 @@ class Date(
         self.after_strict = after_strict
         self.before_strict = before_strict
         self.satisfies = satisfies
+        self.format = format
 
     def _eq(self, other):
         try:
             other = MapBefore.map(self, other)
+            if self.format is not None and isinstance(other, str):
+                other = parse_format(other, self.format).date()
         except Exception:
             return False
         if other is None:
             return Optional._eq(self, other)
+        if _is_datetime64_date(other):
+            bounds = (self.after, self.before, self.after_strict, self.before_strict)
+            return self._eq_datetime64(other, bounds, _to_datetime64, "D")
         if not type(other) == date:
             return False
         if not Equals._eq(self, other):
@@ -418,6 +585,110 @@ def parse_isoformat(dt: str) -> typing.Union[date, time, datetime]:
     raise ValueError("Only str is allowed as input")
 
 
+def parse_format(dt: str, format: str) -> datetime:
+    """Parse a string as `datetime` using a `strptime` format. This gives the same result as
+    `datetime.strptime(dt, format)`, but is much faster for formats consisting of only fixed-width
+    numeric directives (`%Y`, `%y`, `%m`, `%d`, `%H`, `%M`, `%S`) and literal characters, like
+    `%d/%m/%Y %H:%M` or `%Y%m%dT%H%M%S`.
+
+    Such a format is compiled once into a parser that slices the string at fixed positions.
+    Strings it cannot parse, like ones without zero-padding, are passed on to `strptime`. Other
+    formats always use `strptime`.
+
+    Args:
+        dt : the date/time string to parse
+        format : the `strptime` format
+    """
+    return _compile_format(format)(dt)
+
+
+#: Directives that can be parsed by slicing, with the position of their field in the arguments of
+#: `datetime` and their width
+_FIXED_WIDTH_DIRECTIVES = {
+    "Y": (0, 4),
+    "y": (0, 2),
+    "m": (1, 2),
+    "d": (2, 2),
+    "H": (3, 2),
+    "M": (4, 2),
+    "S": (5, 2),
+}
+
+
+#: Translation that replaces every ASCII digit with "0"
+_ZERO_DIGITS = str.maketrans("123456789", "000000000")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_format(format: str) -> typing.Callable[[str], datetime]:
+    def strptime(dt: str) -> datetime:
+        return datetime.strptime(dt, format)
+
+    # The format with every field replaced by zeros, which a string matches after translating it
+    # with `_ZERO_DIGITS` if it has ASCII digits where the fields are and the same literals
+    template: typing.List[str] = []
+    fields = []
+    two_digit_year = False
+    i = 0
+    while i < len(format):
+        if format[i] == "%":
+            directive = format[i + 1 : i + 2]
+            if directive in _FIXED_WIDTH_DIRECTIVES:
+                field, width = _FIXED_WIDTH_DIRECTIVES[directive]
+                fields.append((field, slice(len(template), len(template) + width)))
+                template.extend("0" * width)
+                two_digit_year = two_digit_year or directive == "y"
+            elif directive == "%":
+                template.append("%")
+            else:
+                return strptime
+            i += 2
+        elif format[i].isdigit():
+            # Would be indistinguishable from a field in the template
+            return strptime
+        else:
+            template.append(format[i])
+            i += 1
+    if len({field for field, _ in fields}) < len(fields):
+        # A repeated field, which strptime allows
+        return strptime
+
+    zeros = "".join(template)
+    # In the order of the arguments of `datetime`, so the year comes first
+    fields.sort()
+    slices = [s for _, s in fields]
+    get_fields: typing.Callable[[str], typing.Tuple[str, ...]]
+    if len(slices) > 1:
+        get_fields = operator.itemgetter(*slices)
+    elif slices:
+        # itemgetter only returns a tuple for multiple items
+        get_fields = lambda dt: (dt[slices[0]],)  # noqa: E731
+    else:
+        return strptime
+    # Whether the fields are the first arguments of `datetime`, so no defaults are needed
+    prefix = len(fields) >= 3 and [field for field, _ in fields] == list(range(len(fields)))
+
+    def parse(dt: str) -> datetime:
+        if dt.translate(_ZERO_DIGITS) == zeros:
+            values = list(map(int, get_fields(dt)))
+            if two_digit_year:
+                # The same pivot as strptime
+                values[0] += 1900 if values[0] >= 69 else 2000
+            if not prefix:
+                # The same defaults as strptime
+                arguments = [1900, 1, 1, 0, 0, 0]
+                for (field, _), value in zip(fields, values):
+                    arguments[field] = value
+                values = arguments
+            try:
+                return datetime(*values)  # type: ignore
+            except ValueError:
+                pass
+        return strptime(dt)
+
+    return parse
+
+
 #: Any instance of `datetime`
 ANY_DATETIME = DateTime()
 #: Any instance of `date`
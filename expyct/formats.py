@@ -0,0 +1,269 @@
+import abc
+import string
+import typing
+
+from dataclasses import dataclass
+
+from expyct.base import MapBefore, Optional, BaseMatcher
+
+# Translations that delete the characters of an alphabet, so a string only consists of these
+# characters if nothing remains after translating it. This is faster than a regex.
+_HEX = str.maketrans("", "", string.hexdigits)
+_BASE64 = str.maketrans("", "", string.ascii_letters + string.digits + "+/")
+_BASE64_URLSAFE = str.maketrans("", "", string.ascii_letters + string.digits + "-_")
+_CROCKFORD_BASE32 = str.maketrans("", "", "0123456789ABCDEFGHJKMNPQRSTVWXYZabcdefghjkmnpqrstvwxyz")
+
+
+@dataclass(repr=False, eq=False)
+class _Format(Optional, MapBefore, BaseMatcher, abc.ABC):
+    """Base class for matching strings in a specific format."""
+
+    def _eq(self, other):
+        try:
+            other = MapBefore.map(self, other)
+        except Exception:
+            return False
+        if other is None:
+            return Optional._eq(self, other)
+        if not isinstance(other, str):
+            return False
+        return self._is_valid(other)
+
+    @abc.abstractmethod
+    def _is_valid(self, other: str) -> bool:
+        # This method needs to be overriden by children
+        ...
+
+
+@dataclass(repr=False, eq=False)
+class Uuid(_Format):
+    """Match any string in the form of a UUID, like `"2f8b1a9e-6c1d-4b7e-9a3f-0c5d2e4f6a7b"`.
+    Both lowercase and uppercase hex digits are allowed.
+
+    Args:
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed [default: `False`]
+        version : UUID version (1-8) the string must have. This also requires the RFC 4122
+            variant
+    """
+
+    version: typing.Optional[int] = None
+
+    def __init__(
+        self,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+        version: typing.Optional[int] = None,
+    ):
+        self.map_before = map_before
+        self.optional = optional
+        self.version = version
+
+    def _is_valid(self, other: str) -> bool:
+        if not len(other) == 36:
+            return False
+        if not other[8] == other[13] == other[18] == other[23] == "-":
+            return False
+        # Only the four dashes may remain
+        if not other.translate(_HEX) == "----":
+            return False
+        if self.version is not None:
+            if not other[14] == str(self.version):
+                return False
+            if other[19] not in "89abAB":
+                return False
+        return True
+
+
+@dataclass(repr=False, eq=False)
+class Hex(_Format):
+    """Match any non-empty string of hex digits, like a hex digest. Both lowercase and uppercase
+    digits are allowed.
+
+    Args:
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed [default: `False`]
+        length : number of digits must equal
+    """
+
+    length: typing.Optional[int] = None
+
+    def __init__(
+        self,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+        length: typing.Optional[int] = None,
+    ):
+        self.map_before = map_before
+        self.optional = optional
+        self.length = length
+
+    def _is_valid(self, other: str) -> bool:
+        if self.length is not None and not len(other) == self.length:
+            return False
+        return bool(other) and not other.translate(_HEX)
+
+
+@dataclass(repr=False, eq=False)
+class IPv4(_Format):
+    """Match any string in the form of an IPv4 address, like `"192.168.0.1"`. Leading zeros are
+    not allowed, like in `ipaddress.IPv4Address`.
+
+    Args:
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed [default: `False`]
+    """
+
+    def __init__(
+        self,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+    ):
+        self.map_before = map_before
+        self.optional = optional
+
+    def _is_valid(self, other: str) -> bool:
+        return _is_ipv4(other)
+
+
+def _is_ipv4(other: str) -> bool:
+    parts = other.split(".")
+    if not len(parts) == 4:
+        return False
+    for part in parts:
+        # Only 1 to 3 ASCII digits
+        if not 0 < len(part) <= 3 or part.strip(string.digits):
+            return False
+        if part[0] == "0" and len(part) > 1:
+            return False
+        if int(part) > 255:
+            return False
+    return True
+
+
+@dataclass(repr=False, eq=False)
+class IPv6(_Format):
+    """Match any string in the form of an IPv6 address, like `"2001:db8::1"`, including ones ending
+    with an IPv4 address and ones with a scope, like in `ipaddress.IPv6Address`.
+
+    Args:
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed [default: `False`]
+    """
+
+    def __init__(
+        self,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+    ):
+        self.map_before = map_before
+        self.optional = optional
+
+    def _is_valid(self, other: str) -> bool:
+        address, percent, scope = other.partition("%")
+        if percent and (not scope or "%" in scope):
+            return False
+        if "." in address:
+            # The last 32 bits can be written as an IPv4 address, which counts as two groups
+            address, _, ipv4 = address.rpartition(":")
+            if not _is_ipv4(ipv4):
+                return False
+            address += ":0:0"
+        head, double_colon, tail = address.partition("::")
+        parts = head.split(":") if head else []
+        if double_colon:
+            parts += tail.split(":") if tail else []
+            if not len(parts) < 8:
+                return False
+        elif not len(parts) == 8:
+            return False
+        for part in parts:
+            if not 0 < len(part) <= 4 or part.translate(_HEX):
+                return False
+        return True
+
+
+@dataclass(repr=False, eq=False)
+class Base64(_Format):
+    """Match any string that is valid base64, like `"aGVsbG8="`.
+
+    Args:
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed [default: `False`]
+        urlsafe : whether to use the URL-safe alphabet, with `-` and `_` instead of `+` and `/`
+            [default: `False`]
+        padded : whether the string must be padded with `=` to a multiple of 4 characters. If not,
+            padding is not allowed [default: `True`]
+    """
+
+    urlsafe: bool = False
+    padded: bool = True
+
+    def __init__(
+        self,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+        urlsafe: bool = False,
+        padded: bool = True,
+    ):
+        self.map_before = map_before
+        self.optional = optional
+        self.urlsafe = urlsafe
+        self.padded = padded
+
+    def _is_valid(self, other: str) -> bool:
+        data = other.rstrip("=")
+        padding = len(other) - len(data)
+        if self.padded:
+            if not len(other) % 4 == 0 or padding > 2:
+                return False
+        elif padding:
+            return False
+        # A single character cannot encode a whole byte
+        if len(data) % 4 == 1:
+            return False
+        return not data.translate(_BASE64_URLSAFE if self.urlsafe else _BASE64)
+
+
+@dataclass(repr=False, eq=False)
+class Ulid(_Format):
+    """Match any string in the form of a ULID, like `"01ARZ3NDEKTSV4RRFFQ69G5FAV"`. Both
+    lowercase and uppercase characters are allowed.
+
+    Args:
+        map_before : apply function before checking equality
+        optional : whether `None` is allowed [default: `False`]
+    """
+
+    def __init__(
+        self,
+        map_before: typing.Optional[typing.Callable] = None,
+        optional: typing.Optional[bool] = None,
+    ):
+        self.map_before = map_before
+        self.optional = optional
+
+    def _is_valid(self, other: str) -> bool:
+        if not len(other) == 26:
+            return False
+        # The timestamp is 48 bits, so the first of its 10 characters is at most 7
+        if other[0] not in "01234567":
+            return False
+        return not other.translate(_CROCKFORD_BASE32)
+
+
+#: Any string in the form of a UUID, of any version. Unlike `expyct.ANY_UUID`, which only matches
+#: version 4 UUIDs
+ANY_UUID_ANY_VERSION = Uuid()
+#: Any string in the form of a version 4 (random) UUID
+ANY_UUID4 = Uuid(version=4)
+#: Any non-empty string of hex digits
+ANY_HEX = Hex()
+#: Any string in the form of an IPv4 address
+ANY_IPV4 = IPv4()
+#: Any string in the form of an IPv6 address
+ANY_IPV6 = IPv6()
+#: Any string that is valid (padded) base64
+ANY_BASE64 = Base64()
+#: Any string in the form of a ULID
+ANY_ULID = Ulid()
@@ -0,0 +1,176 @@
+import sys
+import typing
+
+from dataclasses import dataclass
+
+from expyct.base import Optional, BaseMatcher, _evaluation_cache
+from expyct.datetime import Datetime64
+from expyct.io import PathOrFile, _csv_chunks
+from expyct.number import Number, Int, Float
+
+#: Array kinds (see `numpy.dtype.kind`) whose values the number matchers accept. Like their
+#: values, boolean arrays are accepted by `Number` only
+_NUMBER_KINDS = {Number: "biuf", Int: "iu", Float: "f"}
+
+#: Attributes of the number matchers that cannot be checked on a whole array at once
+_ELEMENTWISE_ATTRIBUTES = ("map_before", "type", "instance_of", "equals", "satisfies", "close_to")
+
+# The names, length and a function to get a column by name of a columnar object
+_Columns = typing.Tuple[typing.Container, int, typing.Callable[[typing.Any], typing.Any]]
+
+
+@dataclass(repr=False, eq=False)
+class Frame(Optional, BaseMatcher):
+    """Match any columnar data set of which each given column has values that all equal the
+    matcher of the column. These are matched:
+
+    * a `pandas.DataFrame`
+    * a `numpy` record array (a one-dimensional array with named fields)
+    * a mapping (like a `dict`) from column names to sequences of the same length
+
+    Each column is evaluated once, as a whole. Columns of numbers are checked with vectorized
+    `numpy` operations when the matcher is a `Number`, `Int` or `Float` with only bounds, and so
+    are columns of `numpy.datetime64` values for `DateTime`, `DateTimeTz` and `Date`. Other
+    columns are checked value by value, evaluating each distinct value once. Missing values in a
+    `pandas.DataFrame` are matched as `None`. Neither `numpy` nor `pandas` is required.
+
+    To match a CSV file without reading it into memory at once, use `match_csv()`.
+
+    Args:
+        columns : mapping from column names to what all values of the column must equal
+        length : number of rows must equal
+        optional : whether `None` is allowed [default: `False`]
+    """
+
+    columns: typing.Optional[typing.Mapping[typing.Any, typing.Any]] = None
+    length: typing.Optional[int] = None
+
+    def __init__(
+        self,
+        columns: typing.Optional[typing.Mapping[typing.Any, typing.Any]] = None,
+        length: typing.Optional[int] = None,
+        optional: typing.Optional[bool] = None,
+    ):
+        self.columns = columns
+        self.length = length
+        self.optional = optional
+
+    def _eq(self, other):
+        if other is None:
+            return Optional._eq(self, other)
+        columns = _as_columns(other)
+        if columns is None:
+            return False
+        names, length, get = columns
+        if self.length is not None and not length == self.length:
+            return False
+        return self._match_columns(names, get)
+
+    def match_csv(self, file: PathOrFile, chunk_size: int = 10000) -> bool:
+        """Match a CSV file with a header row, reading `chunk_size` rows at a time. All values are
+        strings, so use matchers like `ANY_FLOAT_STRING`.
+
+        The file is read with `pandas.read_csv` when `pandas` is installed, and with the `csv`
+        module otherwise. Missing fields at the end of a row are read as empty strings, and a row
+        with more fields than the header raises a `ValueError`.
+
+        Args:
+            file : path or text file object to read from
+            chunk_size : number of rows to read at once [default: 10000]
+        """
+        total = 0
+        for chunk in _csv_chunks(file, chunk_size):
+            names, length, get = _as_columns(chunk)  # type: ignore
+            total += length
+            if self.length is not None and total > self.length:
+                return False
+            if not self._match_columns(names, get):
+                return False
+        return self.length is None or total == self.length
+
+    def _match_columns(self, names: typing.Container, get: typing.Callable) -> bool:
+        for name, expected in (self.columns or {}).items():
+            if name not in names:
+                return False
+            if not _match_column(expected, get(name)):
+                return False
+        return True
+
+
+def _as_columns(obj: typing.Any) -> typing.Optional[_Columns]:
+    # The optional dependencies are only used when the object comes from them, so they do not
+    # need to be imported here
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(obj, pandas.DataFrame):
+        return obj.columns, len(obj), lambda name: _series_values(obj[name])
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(obj, numpy.ndarray):
+        if obj.dtype.names is None or not obj.ndim == 1:
+            return None
+        return obj.dtype.names, len(obj), obj.__getitem__
+    if isinstance(obj, typing.Mapping):
+        try:
+            lengths = {len(column) for column in obj.values()}
+        except TypeError:
+            return None
+        if len(lengths) > 1:
+            return None
+        return obj, lengths.pop() if lengths else 0, obj.__getitem__
+    return None
+
+
+def _series_values(series: typing.Any) -> typing.Any:
+    numpy = sys.modules["numpy"]
+    if isinstance(series.dtype, numpy.dtype) and series.dtype.kind == "M":
+        # Missing values are `NaT`, which the temporal matchers handle
+        return series.to_numpy()
+    if series.isna().any():
+        return series.astype(object).where(series.notna(), None).tolist()
+    return series.to_numpy()
+
+
+def _match_column(expected: typing.Any, values: typing.Any) -> bool:
+    if hasattr(values, "dtype"):
+        matched = _match_array(expected, values)
+        if matched is not None:
+            return matched
+        values = values.tolist()
+    # Every value is a top-level evaluation, so the scratch cache does not grow with the column
+    token = _evaluation_cache.set(None)
+    try:
+        seen = set()
+        for value in values:
+            try:
+                key = (type(value), value)
+                if key in seen:
+                    continue
+            except TypeError:
+                key = None
+            if not value == expected:
+                return False
+            if key is not None:
+                seen.add(key)
+        return True
+    finally:
+        _evaluation_cache.reset(token)
+
+
+def _match_array(expected: typing.Any, array: typing.Any) -> typing.Optional[bool]:
+    """Matches a `numpy` array with vectorized operations, or returns `None` if that is not
+    possible for the matcher."""
+    if array.dtype.kind == "M" and isinstance(expected, Datetime64):
+        return expected.__eq__(array)
+    kinds = _NUMBER_KINDS.get(type(expected))
+    if kinds is None or array.dtype.kind not in kinds:
+        return None
+    if any(getattr(expected, name) is not None for name in _ELEMENTWISE_ATTRIBUTES):
+        return None
+    if expected.min is not None and not (array >= expected.min).all():
+        return False
+    if expected.max is not None and not (array <= expected.max).all():
+        return False
+    if expected.min_strict is not None and not (array > expected.min_strict).all():
+        return False
+    if expected.max_strict is not None and not (array < expected.max_strict).all():
+        return False
+    return True
@@ -0,0 +1,214 @@
+import collections.abc
+import dataclasses
+import types
+import typing
+
+from dataclasses import dataclass
+
+from expyct.any import Any
+from expyct.base import BaseMatcher
+from expyct.binary import Bytes
+from expyct.collection import Collection, Dict, List, Set, Tuple
+from expyct.combination import AllOf, OneOf
+from expyct.number import Float, Int
+from expyct.string import String
+
+#: Matchers derived from types, by type
+_matchers: typing.Dict[typing.Any, typing.Any] = {}
+
+#: Types of which the matcher is being derived, to detect recursive types
+_deriving: typing.Set[typing.Any] = set()
+
+_NoneType = type(None)
+_UnionType = getattr(types, "UnionType", ())
+
+
+def from_type(tp: typing.Any) -> typing.Any:
+    """Derive a matcher from a type (hint). Matchers are derived once per type, so calling this
+    again with the same type returns the same matcher.
+
+    These are supported:
+
+    * `typing.Any` and `object`, which match anything, including `None`
+    * `None`, `bool`, `int`, `float` (which also matches `int`, like in type hints), `str`,
+      `bytes` and other classes, of which the object must be an instance
+    * `typing.Optional`, `typing.Union` and `typing.Literal`
+    * `typing.List`, `typing.Tuple` (with or without `...`), `typing.Set`, `typing.FrozenSet`,
+      `typing.Dict` and the abstract collections like `typing.Sequence`, as well as their
+      built-in counterparts like `list[int]`
+    * `typing.TypedDict` classes, of which the keys that are not required may be missing
+    * dataclasses and `typing.NamedTuple` classes, of which the fields are matched as
+      attributes. These can be nested and recursive.
+    * `typing.NewType`, matched as its supertype, and `typing.TypeVar`, matched as its bound
+    * `typing.Annotated`, of which the metadata that are matchers must also be equal. For
+      example, `Annotated[int, expyct.Int(min=0)]`.
+
+    Args:
+        tp : the type to derive a matcher from
+
+    Raises:
+        TypeError : if the type is not supported, like a string forward reference
+    """
+    try:
+        return _matchers[tp]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable, like a `Literal` of a list, so it cannot be cached
+        return _derive(tp)
+    if tp in _deriving:
+        # The type refers to itself, so its matcher can only be looked up when matching
+        return _Deferred(tp)
+    _deriving.add(tp)
+    try:
+        matcher = _derive(tp)
+    finally:
+        _deriving.discard(tp)
+    _matchers[tp] = matcher
+    return matcher
+
+
+@dataclass(repr=False, eq=False)
+class _Deferred(BaseMatcher):
+    """Match with the matcher derived from a type that is still being derived."""
+
+    type: typing.Any
+
+    def __init__(self, type: typing.Any):
+        self.type = type
+
+    def _eq(self, other):
+        return from_type(self.type) == other
+
+
+def _derive(tp: typing.Any) -> typing.Any:
+    if tp is typing.Any or tp is object:
+        return Any(optional=True)
+    if tp is None or tp is _NoneType:
+        return None
+    metadata = getattr(tp, "__metadata__", None)
+    if metadata is not None:
+        # `Annotated`, of which the type is the origin
+        matcher = from_type(tp.__origin__)
+        constraints = [x for x in metadata if isinstance(x, BaseMatcher)]
+        return AllOf([matcher, *constraints]) if constraints else matcher
+    if isinstance(tp, typing.TypeVar):
+        return from_type(tp.__bound__ or typing.Any)
+    supertype = getattr(tp, "__supertype__", None)
+    if supertype is not None:
+        # `NewType`
+        return from_type(supertype)
+    if isinstance(tp, _UnionType):
+        # `X | Y`
+        return OneOf([from_type(arg) for arg in tp.__args__])
+    origin = getattr(tp, "__origin__", None)
+    if origin is not None:
+        return _derive_generic(tp, origin, getattr(tp, "__args__", None))
+    if isinstance(tp, type):
+        return _derive_class(tp)
+    raise TypeError(f"cannot derive a matcher from {tp!r}")
+
+
+def _derive_generic(
+    tp: typing.Any, origin: typing.Any, args: typing.Optional[typing.Tuple]
+) -> typing.Any:
+    """Derives a matcher from a generic type. `args` is `None` if it is not parameterized, like
+    `typing.List`."""
+    if origin is typing.Union:
+        return OneOf([from_type(arg) for arg in args or ()])
+    if origin is getattr(typing, "Literal", None):
+        return OneOf([_literal(arg) for arg in args or ()])
+    if origin is list:
+        return List(all=_members(args[0]) if args else None)
+    if origin is tuple:
+        if args is None:
+            return Tuple()
+        if len(args) == 2 and args[1] is Ellipsis:
+            return Tuple(all=_members(args[0]))
+        if args == ((),):
+            # `Tuple[()]` before Python 3.11
+            args = ()
+        return Tuple(items=[from_type(arg) for arg in args])
+    if origin is set:
+        return Set(all=_members(args[0]) if args else None)
+    if origin is dict:
+        if not args:
+            return Dict()
+        return Dict(keys_all=_members(args[0]), values_all=_members(args[1]))
+    if isinstance(origin, type) and issubclass(origin, collections.abc.Mapping):
+        return Any(instance_of=origin)
+    if isinstance(origin, type) and issubclass(origin, collections.abc.Collection):
+        return Collection(instance_of=origin, all=_members(args[0]) if args else None)
+    if isinstance(origin, type):
+        return Any(instance_of=origin)
+    raise TypeError(f"cannot derive a matcher from {tp!r}")
+
+
+def _derive_class(tp: type) -> typing.Any:
+    if tp is bool:
+        return Any(type=bool)
+    if tp is int:
+        return Int()
+    if tp is float:
+        return OneOf([Float(), Int()])
+    if tp is str:
+        # Not just `String()`, which also matches `bytes`
+        return String(instance_of=str)
+    if tp is bytes:
+        return Bytes()
+    if _is_typed_dict(tp):
+        hints = _type_hints(tp)
+        required = getattr(tp, "__required_keys__", hints if tp.__total__ else ())  # type: ignore
+        fields = {name: from_type(hint) for name, hint in hints.items()}
+        return Dict(
+            superset_of={name: fields[name] for name in required},
+            subset_of=fields,
+        )
+    if dataclasses.is_dataclass(tp):
+        names = [field.name for field in dataclasses.fields(tp)]
+    elif issubclass(tp, tuple) and hasattr(tp, "_fields"):
+        # `NamedTuple`
+        names = list(tp._fields)  # type: ignore
+    else:
+        return Any(instance_of=tp)
+    hints = _type_hints(tp)
+    # Not `instance_of`, since the `__eq__` of a dataclass compares the attributes of anything
+    # with the same `__class__`, which includes matchers with `instance_of`
+    return Any(
+        attrs={name: from_type(hints.get(name, typing.Any)) for name in names},
+        satisfies=_is_instance(tp),
+    )
+
+
+def _members(tp: typing.Any) -> typing.Any:
+    """Returns the matcher for the members of a collection, or `None` if they can be anything."""
+    if tp is typing.Any or tp is object:
+        return None
+    return from_type(tp)
+
+
+def _literal(value: typing.Any) -> typing.Any:
+    """Returns the matcher for a value of a `Literal`. The type must be the same as well, since
+    `Literal[1]` does not allow `True`, even though `1 == True`."""
+    if value is None:
+        return None
+    return Any(type=type(value), equals=value)
+
+
+def _is_instance(tp: type) -> typing.Callable[[typing.Any], bool]:
+    def is_instance(obj: typing.Any) -> bool:
+        return isinstance(obj, tp)
+
+    return is_instance
+
+
+def _is_typed_dict(tp: type) -> bool:
+    return issubclass(tp, dict) and hasattr(tp, "__total__")
+
+
+def _type_hints(tp: type) -> typing.Dict[str, typing.Any]:
+    try:
+        return typing.get_type_hints(tp, include_extras=True)  # type: ignore
+    except TypeError:
+        # `include_extras` is only supported from Python 3.9
+        return typing.get_type_hints(tp)
@@ -0,0 +1,183 @@
+import csv
+import itertools
+import json
+import os
+import typing
+
+from expyct.base import BaseMatcher
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+#: Size of the read buffer used when a path is given
+BUFFER_SIZE = 1 << 20
+
+PathOrFile = typing.Union[str, os.PathLike, typing.IO]
+
+
+def match_jsonl(
+    file: PathOrFile, matcher: typing.Any, max_failures: typing.Optional[int] = None
+) -> typing.Iterator[int]:
+    """Match every line of a JSON Lines file and yield the (1-based) numbers of the lines that
+    are not equal to `matcher`, including lines that are not valid JSON. Blank lines are skipped.
+
+    The file is read line by line with a large buffer, so memory use does not depend on the size
+    of the file. Lines are decoded with `orjson` when it is installed. To count the failing lines,
+    use `sum(1 for _ in match_jsonl(file, matcher))`.
+
+    Args:
+        file : path or (binary or text) file object to read from
+        matcher : every decoded line must equal
+        max_failures : stop after this many failing lines
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb", buffering=BUFFER_SIZE) as f:
+            yield from itertools.islice(_match_lines(f, matcher), max_failures)
+    else:
+        yield from itertools.islice(_match_lines(file, matcher), max_failures)
+
+
+def match_rows(
+    cursor: typing.Any,
+    matcher: typing.Any,
+    batch_size: int = 1000,
+    max_failures: typing.Optional[int] = None,
+) -> typing.Iterator[int]:
+    """Match every row of a DB-API cursor on which a query was executed, and yield the (0-based)
+    indices of the rows that do not match.
+
+    Rows are fetched with `fetchmany(batch_size)`, so the result is never materialized as a
+    whole. How rows are matched depends on `matcher`:
+
+    * a mapping (like a `dict`) from column names to what the column must equal. The names are
+      resolved to positions once, using `cursor.description`, so no `dict` is built per row.
+    * a `list` or `tuple` of what the columns must equal, by position. The row must have as
+      many columns.
+    * anything else, like `expyct.Tuple`, must equal the row itself.
+
+    Args:
+        cursor : DB-API cursor to fetch the rows from
+        matcher : every row must equal, as described above
+        batch_size : number of rows to fetch at once [default: 1000]
+        max_failures : stop after this many failing rows
+    """
+    matches = _row_matcher(cursor, matcher)
+
+    def failures() -> typing.Iterator[int]:
+        index = 0
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                if not matches(row):
+                    yield index
+                index += 1
+
+    yield from itertools.islice(failures(), max_failures)
+
+
+def _row_matcher(cursor: typing.Any, matcher: typing.Any) -> typing.Callable[[typing.Any], bool]:
+    if isinstance(matcher, typing.Mapping) and not isinstance(matcher, BaseMatcher):
+        names = [column[0] for column in cursor.description]
+        try:
+            columns = [(names.index(name), expected) for name, expected in matcher.items()]
+        except ValueError:
+            missing = set(matcher) - set(names)
+            raise ValueError(f"cursor has no columns {missing}") from None
+    elif isinstance(matcher, (list, tuple)) and not isinstance(matcher, BaseMatcher):
+        columns = list(enumerate(matcher))
+        length = len(columns)
+
+        def matches_positions(row) -> bool:
+            if not len(row) == length:
+                return False
+            for i, expected in columns:
+                if not row[i] == expected:
+                    return False
+            return True
+
+        return matches_positions
+    else:
+        return lambda row: row == matcher
+
+    def matches_columns(row) -> bool:
+        for i, expected in columns:
+            if not row[i] == expected:
+                return False
+        return True
+
+    return matches_columns
+
+
+def _match_lines(
+    lines: typing.Iterable[typing.AnyStr], matcher: typing.Any
+) -> typing.Iterator[int]:
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            value = loads(line)
+        except ValueError:
+            matched = False
+        else:
+            matched = value == matcher
+        if not matched:
+            yield number
+
+
+def _csv_chunks(file: PathOrFile, chunk_size: int) -> typing.Iterator[typing.Any]:
+    """Reads a CSV file with a header row in chunks of `chunk_size` rows, as `pandas.DataFrame`
+    objects when `pandas` is installed and as `dict` objects of columns otherwise. All values are
+    read as strings. Blank lines are skipped, missing fields at the end of a row are read as empty
+    strings and a row with more fields than the header raises a `ValueError`, like in
+    `pandas.read_csv`. At least one (possibly empty) chunk is returned."""
+    try:
+        import pandas
+    except ImportError:
+        pandas = None
+    if pandas is not None:
+        reader = pandas.read_csv(
+            file, dtype=str, keep_default_na=False, index_col=False, chunksize=chunk_size
+        )
+        with reader:
+            yield from reader
+    elif isinstance(file, (str, os.PathLike)):
+        with open(file, newline="", buffering=BUFFER_SIZE) as f:
+            yield from _csv_column_chunks(f, chunk_size)
+    else:
+        yield from _csv_column_chunks(file, chunk_size)
+
+
+def _csv_column_chunks(
+    file: typing.Iterable[str], chunk_size: int
+) -> typing.Iterator[typing.Dict[str, typing.Sequence[str]]]:
+    reader = csv.reader(file)
+    names = next(reader, [])
+    # Blank lines are read as empty rows
+    rows = (row for row in reader if row)
+    chunk = list(itertools.islice(rows, chunk_size))
+    while True:
+        for i, row in enumerate(chunk):
+            if len(row) > len(names):
+                raise ValueError(f"expected at most {len(names)} fields per row, got {len(row)}")
+            if len(row) < len(names):
+                chunk[i] = row + [""] * (len(names) - len(row))
+        columns = list(zip(*chunk)) if chunk else [()] * len(names)
+        yield dict(zip(names, columns))
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+
+
+def loads(data: typing.Union[str, bytes]) -> typing.Any:
+    """Decode a JSON document, using `orjson` when it is installed and `json` otherwise.
+
+    Args:
+        data : the JSON document
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,38 @@
+import typing
+
+from dataclasses import dataclass
+
+from expyct.base import Optional, BaseMatcher
+from expyct.io import loads
+
+
+@dataclass(repr=False, eq=False)
+class Json(Optional, BaseMatcher):
+    """Match any JSON document (a `str` or `bytes`) that, when decoded, equals `matcher`.
+
+    The document is decoded with `orjson` when it is installed, and with `json` otherwise.
+    Documents that are not valid JSON do not match.
+
+    Args:
+        matcher : the decoded document must equal
+        optional : whether `None` is allowed [default: `False`]
+    """
+
+    matcher: typing.Any = None
+
+    def __init__(self, matcher: typing.Any, optional: typing.Optional[bool] = None):
+        self.matcher = matcher
+        self.optional = optional
+
+    def _eq(self, other):
+        if other is None:
+            return Optional._eq(self, other)
+        if isinstance(other, (bytearray, memoryview)):
+            other = bytes(other)
+        if not isinstance(other, (str, bytes)):
+            return False
+        try:
+            value = loads(other)
+        except ValueError:
+            return False
+        return value == self.matcher
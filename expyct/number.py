@@ -228,7 +228,12 @@ class Int(Number, BaseMatcher, int):
         self.error = error
 
     def _eq(self, other):
-        if not isinstance(other, int):
+        try:
+            value = MapBefore.map(self, other)
+        except Exception:
+            return False
+        # The type is checked after mapping, so `map_before` can parse strings
+        if value is not None and not isinstance(value, int):
             return False
         if not Number._eq(self, other):
             return False
@@ -287,7 +292,12 @@ class Float(Number, BaseMatcher, float):
         self.error = error
 
     def _eq(self, other):
-        if not isinstance(other, float):
+        try:
+            value = MapBefore.map(self, other)
+        except Exception:
+            return False
+        # The type is checked after mapping, so `map_before` can parse strings
+        if value is not None and not isinstance(value, float):
             return False
         if not Number._eq(self, other):
             return False
@@ -0,0 +1,165 @@
+import collections.abc
+import functools
+import re
+import typing
+
+from dataclasses import dataclass
+
+from expyct.base import Optional, BaseMatcher
+
+# A dotted name, or a wildcard, index or quoted key in brackets
+_SEGMENT = re.compile(r"""(\.)?([^.\[\]]+)|\[(?:(\*)|(-?\d+)|'([^']*)'|"([^"]*)")\]""")
+
+#: Segment that selects all members of a collection
+_WILDCARD = object()
+
+# The matchers of the values at a node, and the child nodes by segment
+_Node = typing.Tuple[typing.List[typing.Any], typing.Dict[typing.Any, typing.Any]]
+
+
+@dataclass(repr=False, eq=False)
+class At(Optional, BaseMatcher):
+    """Match any object of which the value at `path` equals `matcher`. For example,
+    `At("orders[*].items[0].price", Int(min=0))`.
+
+    A path consists of these segments:
+
+    * `name` or `.name` selects the value of a key, like `value["name"]`
+    * `[0]` selects an item by index, like `value[0]`. Negative indices are allowed
+    * `['name']` or `["name"]` selects the value of a key that contains dots or brackets
+    * `[*]` or `.*` selects all members of a collection, or all values of a mapping, which must
+      then each match the rest of the path
+
+    The empty path selects the object itself. The path is parsed once, when the matcher is created,
+    into keys and indices that are looked up directly. Objects without the value at the path do
+    not match.
+
+    Args:
+        path : path of the value in the object
+        matcher : the value at the path must equal
+        optional : whether `None` is allowed [default: `False`]
+
+    Raises:
+        ValueError : if the path is not valid
+    """
+
+    path: str = ""
+    matcher: typing.Any = None
+    _trie: typing.Any = None
+
+    def __init__(self, path: str, matcher: typing.Any, optional: typing.Optional[bool] = None):
+        self.path = path
+        self.matcher = matcher
+        self.optional = optional
+        # Fails here for an invalid path, rather than inside an assertion
+        _parse(path)
+
+    def _eq(self, other):
+        if other is None:
+            return Optional._eq(self, other)
+        arguments = (self.path, self.matcher)
+        if self._trie is None or not all(a is b for a, b in zip(self._trie[0], arguments)):
+            self._trie = (arguments, _build_trie([arguments]))
+        return _match_node(self._trie[1], other)
+
+
+@dataclass(repr=False, eq=False)
+class Paths(Optional, BaseMatcher):
+    """Match any object of which the values at all given paths equal their matchers. For the
+    syntax of the paths, see `At`.
+
+    The paths are combined into a tree, so paths that share a prefix, like `"user.name"` and
+    `"user.email"`, look up the prefix only once.
+
+    Args:
+        paths : mapping from paths to what the value at the path must equal
+        optional : whether `None` is allowed [default: `False`]
+
+    Raises:
+        ValueError : if a path is not valid
+    """
+
+    paths: typing.Optional[typing.Mapping[str, typing.Any]] = None
+    _trie: typing.Any = None
+
+    def __init__(
+        self,
+        paths: typing.Mapping[str, typing.Any],
+        optional: typing.Optional[bool] = None,
+    ):
+        self.paths = paths
+        self.optional = optional
+        # Fails here for an invalid path, rather than inside an assertion
+        for path in paths:
+            _parse(path)
+
+    def _eq(self, other):
+        if other is None:
+            return Optional._eq(self, other)
+        # Compared by identity, since comparing the paths takes as long as building the tree
+        if self._trie is None or self._trie[0] is not self.paths:
+            self._trie = (self.paths, _build_trie(self.paths.items()))  # type: ignore
+        return _match_node(self._trie[1], other)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse(path: str) -> typing.Tuple[typing.Any, ...]:
+    """Returns the keys and indices of a path, and `_WILDCARD` for wildcards."""
+    segments: typing.List[typing.Any] = []
+    position = 0
+    while position < len(path):
+        match = _SEGMENT.match(path, position)
+        if match is None:
+            raise ValueError(f"invalid path {path!r} at position {position}")
+        dot, name, wildcard, index, single_quoted, double_quoted = match.groups()
+        if name is not None:
+            # Names after the first must follow a dot
+            if bool(dot) is not bool(position):
+                raise ValueError(f"invalid path {path!r} at position {position}")
+            segments.append(_WILDCARD if name == "*" else name)
+        elif wildcard is not None:
+            segments.append(_WILDCARD)
+        elif index is not None:
+            segments.append(int(index))
+        else:
+            segments.append(single_quoted if single_quoted is not None else double_quoted)
+        position = match.end()
+    return tuple(segments)
+
+
+def _build_trie(paths: typing.Iterable[typing.Tuple[str, typing.Any]]) -> _Node:
+    root: _Node = ([], {})
+    for path, matcher in paths:
+        node = root
+        for segment in _parse(path):
+            node = node[1].setdefault(segment, ([], {}))
+        node[0].append(matcher)
+    return root
+
+
+def _match_node(node: _Node, value: typing.Any) -> bool:
+    matchers, children = node
+    for matcher in matchers:
+        if not value == matcher:
+            return False
+    for segment, child in children.items():
+        if segment is _WILDCARD:
+            if isinstance(value, collections.abc.Mapping):
+                members: typing.Iterable = value.values()
+            elif isinstance(value, collections.abc.Collection) and not isinstance(
+                value, (str, bytes)
+            ):
+                members = value
+            else:
+                return False
+            for member in members:
+                if not _match_node(child, member):
+                    return False
+        else:
+            try:
+                member = value[segment]
+            except (LookupError, TypeError):
+                return False
+            if not _match_node(child, member):
+                return False
+    return True
@@ -0,0 +1,152 @@
+import asyncio
+import inspect
+import random
+import time
+import typing
+
+from dataclasses import dataclass
+
+from expyct.base import BaseMatcher, amatch, _evaluation_cache
+
+# Looked up through these names, so that they can be replaced for this module only, as in tests
+_monotonic = time.monotonic
+_sleep = time.sleep
+_async_sleep = asyncio.sleep
+
+
+@dataclass(repr=False, eq=False)
+class Eventually(BaseMatcher):
+    """Match a source (any function without arguments) that eventually returns a value equal to
+    `matcher`. This is useful for checking the state of an asynchronous system.
+
+    The source is called repeatedly until its value matches or `timeout` seconds have passed.
+    Between calls it sleeps, starting at `backoff` seconds and doubling up to `max_backoff`. Each
+    sleep is randomized by up to `jitter` (as a fraction), so that concurrent pollers do not
+    synchronize. For example:
+
+    .. code-block:: python
+
+        assert fetch_status == expyct.Eventually(expyct.Dict(superset_of={"state": "done"}))
+
+    Use `poll()` to get the last value of the source, which is the mismatch on timeout. Use
+    `await matcher.amatch(source)` or `await matcher.apoll()` for asynchronous sources, which may
+    return awaitables. These sleep with `asyncio.sleep`, so the event loop is never blocked.
+
+    Args:
+        matcher : the value of the source must eventually equal
+        source : function to call, if it is not given to `poll()`
+        timeout : maximum number of seconds to poll for [default: 5]
+        backoff : seconds to sleep after the first mismatch [default: 0.05]
+        max_backoff : maximum number of seconds to sleep between calls [default: 1]
+        jitter : maximum fraction by which each sleep is randomized [default: 0.1]
+    """
+
+    matcher: typing.Any
+    source: typing.Optional[typing.Callable[[], typing.Any]] = None
+    timeout: float = 5.0
+    backoff: float = 0.05
+    max_backoff: float = 1.0
+    jitter: float = 0.1
+
+    def __init__(
+        self,
+        matcher: typing.Any,
+        source: typing.Optional[typing.Callable[[], typing.Any]] = None,
+        timeout: float = 5.0,
+        backoff: float = 0.05,
+        max_backoff: float = 1.0,
+        jitter: float = 0.1,
+    ):
+        self.matcher = matcher
+        self.source = source
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def _eq(self, other):
+        if not callable(other):
+            return False
+        matched, _ = self._poll(other)
+        return matched
+
+    async def amatch(self, other) -> bool:
+        if not callable(other):
+            return False
+        matched, _ = await self._apoll(other)
+        return matched
+
+    def poll(self, source: typing.Optional[typing.Callable[[], typing.Any]] = None) -> typing.Any:
+        """Polls the source until its value matches or the timeout passes, and returns the last
+        value.
+
+        Args:
+            source : function to call instead of `self.source`
+        """
+        _, value = self._poll(self._get_source(source))
+        return value
+
+    async def apoll(
+        self, source: typing.Optional[typing.Callable[[], typing.Any]] = None
+    ) -> typing.Any:
+        """Asynchronous variant of `poll()`.
+
+        Args:
+            source : function to call instead of `self.source`
+        """
+        _, value = await self._apoll(self._get_source(source))
+        return value
+
+    def _poll(self, source: typing.Callable[[], typing.Any]) -> typing.Tuple[bool, typing.Any]:
+        deadline = _monotonic() + self.timeout
+        for delay in self._delays():
+            value = source()
+            # Every round is a top-level evaluation, since the source may return the same object
+            # with a different state, and the values of earlier rounds need not be kept
+            token = _evaluation_cache.set(None)
+            try:
+                matched = value == self.matcher
+            finally:
+                _evaluation_cache.reset(token)
+            if matched:
+                return True, value
+            remaining = deadline - _monotonic()
+            if remaining <= 0:
+                return False, value
+            _sleep(min(delay, remaining))
+        raise AssertionError("unreachable")
+
+    async def _apoll(
+        self, source: typing.Callable[[], typing.Any]
+    ) -> typing.Tuple[bool, typing.Any]:
+        deadline = _monotonic() + self.timeout
+        for delay in self._delays():
+            value = source()
+            if inspect.isawaitable(value):
+                value = await value
+            token = _evaluation_cache.set(None)
+            try:
+                matched = await amatch(self.matcher, value)
+            finally:
+                _evaluation_cache.reset(token)
+            if matched:
+                return True, value
+            remaining = deadline - _monotonic()
+            if remaining <= 0:
+                return False, value
+            await _async_sleep(min(delay, remaining))
+        raise AssertionError("unreachable")
+
+    def _delays(self) -> typing.Iterator[float]:
+        delay = self.backoff
+        while True:
+            yield delay * (1 + random.uniform(-self.jitter, self.jitter))
+            delay = min(delay * 2, self.max_backoff)
+
+    def _get_source(
+        self, source: typing.Optional[typing.Callable[[], typing.Any]]
+    ) -> typing.Callable[[], typing.Any]:
+        source = source or self.source
+        if source is None:
+            raise ValueError("no source to poll")
+        return source
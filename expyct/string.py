@@ -1,9 +1,11 @@
 import re
+import string
 import typing
 
 from dataclasses import dataclass
 
-from expyct.base import Equals, MapBefore, Instance, Satisfies, Optional, BaseMatcher
+from expyct import _distance
+from expyct.base import Equals, MapBefore, Instance, Satisfies, Optional, BaseMatcher, T
 from expyct.collection import Length, Contains
 
 
@@ -35,17 +37,39 @@ class String(
         non_empty : object must have at least one member [default: `False`]
         superset_of : collection of which the object must be a superset
         subset_of : collection of which the object must be a subset
-        starts_with : string must start with given
-        ends_with : string must end with given
+        starts_with : string must start with given, or with any of a collection of prefixes
+        ends_with : string must end with given, or with any of a collection of suffixes
         regex : string must fully match predicate
-        ignore_case : whether to ignore case for starts_with, ends_with,
+        ignore_case : whether to ignore case for starts_with, ends_with, one_of,
         equality and regex matching [default: `False`]
+        one_of : string must be one of the given collection
+        close_to : string must be within `max_distance` edits of given (Levenshtein distance)
+        contains_approx : string must contain a substring within `max_distance` edits of given
+        max_distance : maximum number of edits for close_to and contains_approx [default: 1]
+        transpositions : whether swapping two adjacent characters counts as one edit for
+        close_to and contains_approx [default: `False`]
+
+    A large `one_of` is looked up in a `frozenset`, and large collections of prefixes or suffixes
+    in sets grouped by length, so the time it takes does not depend on the size of the
+    collection. They are built on the first evaluation. With `ignore_case`, strings are compared
+    case-folded (see `str.casefold`).
+
+    The edit distance for `close_to` and `contains_approx` is computed with a bit-parallel
+    algorithm, which stops as soon as the distance is known to exceed `max_distance`.
     """
 
-    starts_with: typing.Optional[str] = None
-    ends_with: typing.Optional[str] = None
+    starts_with: typing.Optional[typing.Union[str, typing.Collection[str]]] = None
+    ends_with: typing.Optional[typing.Union[str, typing.Collection[str]]] = None
     regex: typing.Optional[typing.Union[str, bytes, typing.Pattern]] = None
     ignore_case: bool = False
+    one_of: typing.Optional[typing.Collection[str]] = None
+    close_to: typing.Optional[str] = None
+    contains_approx: typing.Optional[str] = None
+    max_distance: int = 1
+    transpositions: bool = False
+
+    # The arguments and the lookups built from them, from the last evaluation
+    _lookups: typing.Any = None
 
     def __new__(cls, *args, **kwargs):
         return str.__new__(cls)
@@ -64,10 +88,15 @@ class String(
         non_empty: bool = False,
         superset_of: typing.Optional[typing.Collection] = None,
         subset_of: typing.Optional[typing.Collection] = None,
-        starts_with: typing.Optional[str] = None,
-        ends_with: typing.Optional[str] = None,
+        starts_with: typing.Optional[typing.Union[str, typing.Collection[str]]] = None,
+        ends_with: typing.Optional[typing.Union[str, typing.Collection[str]]] = None,
         regex: typing.Optional[typing.Union[str, bytes, typing.Pattern]] = None,
         ignore_case: bool = False,
+        one_of: typing.Optional[typing.Collection[str]] = None,
+        close_to: typing.Optional[str] = None,
+        contains_approx: typing.Optional[str] = None,
+        max_distance: int = 1,
+        transpositions: bool = False,
     ):
         self.map_before = map_before
         self.optional = optional
@@ -85,6 +114,11 @@ class String(
         self.ends_with = ends_with
         self.regex = regex
         self.ignore_case = ignore_case
+        self.one_of = one_of
+        self.close_to = close_to
+        self.contains_approx = contains_approx
+        self.max_distance = max_distance
+        self.transpositions = transpositions
 
     def _eq(self, other):
         try:
@@ -93,41 +127,84 @@ class String(
             return False
         if other is None:
             return Optional._eq(self, other)
-        if self.ignore_case:
-            other = other.lower()
-            if self.equals is not None:
-                self.equals = self.equals.lower()
-            if self.starts_with is not None:
-                self.starts_with = self.starts_with.lower()
-            if self.ends_with is not None:
-                self.ends_with = self.ends_with.lower()
         if not isinstance(other, (str, bytes)):
             return False
         if not Instance._eq(self, other):
             return False
-        if not Equals._eq(self, other):
-            return False
         if not Length._eq(self, other):
             return False
+        equals, one_of, starts_with, ends_with, close_to, contains_approx = self._get_lookups()
+        # The regex is matched on the original, since it has its own flag for ignoring case
+        original = other
+        if self.ignore_case:
+            other = _fold(other)
+        if equals is not None:
+            if not other == equals:
+                return False
         if not Contains._eq(self, other):
             return False
         if not Satisfies._eq(self, other):
             return False
-        if self.starts_with is not None:
-            if not other.startswith(self.starts_with):
+        if one_of is not None:
+            if other not in one_of:
+                return False
+        if starts_with is not None:
+            if not _starts_with(other, starts_with):
                 return False
-        if self.ends_with is not None:
-            if not other.endswith(self.ends_with):
+        if ends_with is not None:
+            if not _ends_with(other, ends_with):
+                return False
+        if close_to is not None:
+            d = _distance.distance(close_to, other, self.max_distance, self.transpositions)
+            if d > self.max_distance:
+                return False
+        if contains_approx is not None:
+            if not _distance.search(contains_approx, other, self.max_distance, self.transpositions):
                 return False
         if self.regex:
             if isinstance(self.regex, (str, bytes)) and not re.fullmatch(
-                self.regex, str(other), self.flags()
+                self.regex, str(original), self.flags()
             ):
                 return False
-            if isinstance(self.regex, typing.Pattern) and not self.regex.fullmatch(other):
-                return False
+            if isinstance(self.regex, typing.Pattern):
+                pattern = self.regex
+                if self.ignore_case and not pattern.flags & re.IGNORECASE:
+                    # Compiling is cached by `re`
+                    pattern = re.compile(pattern.pattern, pattern.flags | re.IGNORECASE)
+                if not pattern.fullmatch(original):
+                    return False
         return True
 
+    def _get_lookups(self) -> typing.Tuple[typing.Any, ...]:
+        """Returns `equals`, `one_of`, `starts_with`, `ends_with`, `close_to` and
+        `contains_approx`, prepared for fast lookups and case-folded if `ignore_case`."""
+        arguments = (
+            self.equals,
+            self.one_of,
+            self.starts_with,
+            self.ends_with,
+            self.close_to,
+            self.contains_approx,
+            self.ignore_case,
+        )
+        # Compared by identity, since comparing large collections takes as long as building them
+        if self._lookups is None or not all(a is b for a, b in zip(self._lookups[0], arguments)):
+            fold = _fold if self.ignore_case else _identity
+            equals = fold(self.equals) if isinstance(self.equals, (str, bytes)) else self.equals
+            one_of = None if self.one_of is None else frozenset(map(fold, self.one_of))
+            self._lookups = (
+                arguments,
+                (
+                    equals,
+                    one_of,
+                    _affixes(self.starts_with, fold),
+                    _affixes(self.ends_with, fold),
+                    None if self.close_to is None else fold(self.close_to),
+                    None if self.contains_approx is None else fold(self.contains_approx),
+                ),
+            )
+        return self._lookups[1]
+
     def flags(self):
         flags = 0
         if self.ignore_case:
@@ -139,9 +216,66 @@ class String(
 ANY_STRING = String()
 #: Any string with length more than 0
 ANY_NONEMPTY_STRING = String(non_empty=True)
+
+
+def _fold(obj: typing.AnyStr) -> typing.AnyStr:
+    if isinstance(obj, str):
+        return obj.casefold()
+    return obj.lower()
+
+
+def _identity(obj: T) -> T:
+    return obj
+
+
+def _affixes(affixes: typing.Any, fold: typing.Callable) -> typing.Any:
+    """Returns a single prefix or suffix as is, and a collection of them as a tuple of
+    `(length, frozenset)`, so that a string can be checked with one set lookup per length."""
+    if affixes is None or isinstance(affixes, (str, bytes)):
+        return None if affixes is None else fold(affixes)
+    by_length: typing.Dict[int, typing.Set] = {}
+    for affix in affixes:
+        affix = fold(affix)
+        by_length.setdefault(len(affix), set()).add(affix)
+    return tuple((length, frozenset(by_length[length])) for length in sorted(by_length))
+
+
+def _starts_with(obj: typing.Any, prefixes: typing.Any) -> bool:
+    if isinstance(prefixes, (str, bytes)):
+        return obj.startswith(prefixes)
+    for length, bucket in prefixes:
+        if length > len(obj):
+            return False
+        if obj[:length] in bucket:
+            return True
+    return False
+
+
+def _ends_with(obj: typing.Any, suffixes: typing.Any) -> bool:
+    if isinstance(suffixes, (str, bytes)):
+        return obj.endswith(suffixes)
+    for length, bucket in suffixes:
+        if length > len(obj):
+            return False
+        if obj[len(obj) - length :] in bucket:
+            return True
+    return False
+
+
+# Deletes the characters a-z, A-Z, 0-9 and _, which is faster than matching a regex
+_ALPHANUMERIC = str.maketrans("", "", string.ascii_letters + string.digits + "_")
+
+
+def _is_alphanumeric(obj: str) -> bool:
+    return not obj.translate(_ALPHANUMERIC)
+
+
 #: Any string only consisting of the characters a-z, A-Z, 0-9 and _
-ANY_ALPHANUMERIC_STRING = String(regex=re.compile("[a-zA-Z0-9_]*"))
-#: Any string in the form of a UUID
+ANY_ALPHANUMERIC_STRING = String(satisfies=_is_alphanumeric)
+#: Any string in the form of a version 4 UUID, with lowercase or uppercase hex digits. See
+#: `expyct.formats` for UUIDs of other versions
 ANY_UUID = String(
-    regex=re.compile("[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[89aAbB][a-f0-9]{3}-[a-f0-9]{12}")
+    regex=re.compile(
+        "[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}", re.IGNORECASE
+    )
 )
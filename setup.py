@@ -7,7 +7,12 @@ with open(Path(__file__).parent / "expyct" / "__version__.py") as file:
     VERSION = file.readline().split(" ")[2].rstrip().strip('"')
 
 if (3, 6) <= sys.version_info < (3, 7):
-    INSTALL_REQUIRES = ["dataclasses", "types-dataclasses", "backports-datetime-fromisoformat"]
+    INSTALL_REQUIRES = [
+        "dataclasses",
+        "types-dataclasses",
+        "backports-datetime-fromisoformat",
+        "contextvars",
+    ]
 else:
     INSTALL_REQUIRES = []
 
@@ -1,3 +1,4 @@
+import typing
 from collections.abc import Collection
 
 import pytest
@@ -18,6 +19,19 @@ class ABC:
         return vars(self) == vars(other)
 
 
+class Slotted:
+    __slots__ = ("name", "size")
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+
+class Point(typing.NamedTuple):
+    x: int
+    y: int
+
+
 @pytest.mark.parametrize(
     ["value", "expect", "result"],
     [
@@ -36,6 +50,16 @@ class ABC:
         # test vars
         (ABC(1, 2, 3), exp.Any(vars={"x": 4}), False),
         (ABC(1, 2, 3), exp.Any(vars=exp.Dict(length=3)), True),
+        # test attrs
+        (ABC(1, 2, 3), exp.Any(attrs={"a": 1, "c": exp.Int(min=3)}), True),
+        (ABC(1, 2, 3), exp.Any(attrs={"a": 1, "c": exp.Int(min=4)}), False),
+        (ABC(1, 2, 3), exp.Any(attrs={"x": 1}), False),
+        (ABC(1, 2, 3), exp.Any(attrs={"b": 2}), True),
+        (ABC(1, 2, 3), exp.Any(attrs={}), True),
+        (Slotted("a", 1), exp.Any(attrs={"name": "a", "size": exp.Int(min=0)}), True),
+        (Slotted("a", -1), exp.Any(attrs={"name": "a", "size": exp.Int(min=0)}), False),
+        (Point(1, 2), exp.Any(attrs={"x": 1, "y": 2}), True),
+        (Slotted("a", Point(1, 2)), exp.Any(attrs={"size.y": 2}), True),
         # test satisfies
         (1, exp.Any(satisfies=lambda x: x % 2 == 0), False),
         (2, exp.Any(satisfies=lambda x: x % 2 == 0), True),
@@ -78,6 +102,9 @@ def test_any(value, expect, result):
         # test vars
         (ABC(1, 2, 3), exp.AnyValue(vars={"x": 4}), False),
         (ABC(1, 2, 3), exp.AnyValue(vars=exp.Dict(length=3)), True),
+        # test attrs
+        (Point(1, 2), exp.AnyValue(attrs={"x": 1}), True),
+        (Point(1, 2), exp.AnyValue(attrs={"x": 2}), False),
         # test satisfies
         (1, exp.AnyValue(satisfies=lambda x: x % 2 == 0), False),
         (2, exp.AnyValue(satisfies=lambda x: x % 2 == 0), True),
@@ -111,6 +138,9 @@ def test_any_value(value, expect, result):
         # test vars
         (ABC, exp.AnyType(vars={"a": 1}), False),
         (ABC, exp.AnyType(vars=exp.Dict(superset_of={"a": 1})), True),
+        # test attrs
+        (Point, exp.AnyType(attrs={"_fields": ("x", "y")}), True),
+        (Point, exp.AnyType(attrs={"_fields": ("x",)}), False),
         # test satisfies
         (int, exp.AnyType(satisfies=lambda x: x == str), False),
         (str, exp.AnyType(satisfies=lambda x: x == str), True),
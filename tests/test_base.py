@@ -1,4 +1,10 @@
+import asyncio
+
+import pytest
+
 import expyct
+from expyct.base import _evaluation
+from tests.utils import run
 
 
 def test_instance_type_instanceof():
@@ -13,3 +19,166 @@ def test_instance_instance_of_instanceof():
     instance = expyct.Instance(instance_of=float)
     assert instance.__class__ == float
     assert isinstance(instance, float)
+
+
+def test_map_before_cached_within_evaluation():
+    """Tests that sibling matchers with the same `map_before` only apply it once."""
+    calls = []
+
+    def parse(value):
+        calls.append(value)
+        return expyct.parse_isoformat(value)
+
+    expect = expyct.OneOf(
+        [
+            expyct.DateTime(map_before=parse),
+            expyct.Date(map_before=parse),
+            expyct.Time(map_before=parse),
+        ]
+    )
+    assert "01:01:03" == expect
+    assert calls == ["01:01:03"]
+
+    # Every top-level evaluation starts with an empty cache
+    assert "01:01:03" == expect
+    assert calls == ["01:01:03", "01:01:03"]
+
+
+def test_map_before_cached_exception():
+    """Tests that an exception raised by `map_before` is cached as well."""
+    calls = []
+
+    def fail(value):
+        calls.append(value)
+        raise ValueError()
+
+    expect = expyct.OneOf([expyct.Number(map_before=fail), expyct.String(map_before=fail)])
+    assert not "abc" == expect
+    assert calls == ["abc"]
+
+
+def test_map_before_cached_exception_traceback():
+    """Tests that raising a cached exception again does not grow its traceback."""
+    matcher = expyct.Number(map_before=int)
+    depths = []
+    with _evaluation():
+        for _ in range(3):
+            try:
+                matcher.map("abc")
+            except ValueError as e:
+                tb, depth = e.__traceback__, 0
+                while tb is not None:
+                    tb, depth = tb.tb_next, depth + 1
+                depths.append(depth)
+    assert depths[1] == depths[2]
+
+
+def test_map_before_cache_distinguishes_inputs():
+    """Tests that the cache is keyed by input, so equal-looking but distinct inputs are mapped."""
+    calls = []
+
+    def length(value):
+        calls.append(value)
+        return len(value)
+
+    expect = expyct.List(all=expyct.Number(map_before=length, max=3))
+    assert [[1], [1, 2], [1, 2, 3]] == expect
+    assert calls == [[1], [1, 2], [1, 2, 3]]
+
+
+def test_map_before_iterator_not_cached():
+    """Tests that an iterator returned by `map_before` is not shared by sibling matchers, since
+    the first one consumes it."""
+
+    def parts(value):
+        return (part for part in value.split(","))
+
+    expect = expyct.OneOf(
+        [
+            expyct.Iterable(map_before=parts, max_length=1),
+            expyct.Iterable(map_before=parts, length=2),
+        ]
+    )
+    assert "a,b" == expect
+
+
+def test_amatch_awaitable():
+    """Tests that `amatch` matches awaitables on their resolved value."""
+
+    async def value():
+        return 3
+
+    assert run(expyct.Int(min=2).amatch(value()))
+    assert not run(expyct.Int(min=4).amatch(value()))
+    assert run(expyct.amatch(3, value()))
+
+
+class FakeStore:
+    """In-process stand-in for an asynchronous data store."""
+
+    def __init__(self, ids, delay=0.001):
+        self.ids = set(ids)
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    async def exists(self, id):
+        self.calls.append(id)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            return id in self.ids
+        finally:
+            self.running -= 1
+
+
+def test_async_satisfies():
+    store = FakeStore([1, 2, 3])
+    assert run(expyct.AsyncSatisfies(store.exists).amatch(1))
+    assert not run(expyct.AsyncSatisfies(store.exists).amatch(4))
+
+
+def test_async_satisfies_exception():
+    async def fail(value):
+        raise ValueError()
+
+    assert not run(expyct.AsyncSatisfies(fail).amatch(1))
+
+
+def test_async_satisfies_eq_raises():
+    with pytest.raises(TypeError):
+        1 == expyct.AsyncSatisfies(FakeStore([]).exists)
+
+
+def test_async_satisfies_concurrent():
+    """Tests that the members of a collection are checked concurrently, within the limit."""
+    store = FakeStore(range(20))
+    expect = expyct.List(all=expyct.AsyncSatisfies(store.exists, max_concurrency=4))
+    assert run(expect.amatch(list(range(20))))
+    assert sorted(store.calls) == list(range(20))
+    assert store.max_running == 4
+
+
+def test_async_satisfies_cancels_on_first_failure():
+    store = FakeStore(range(1, 100), delay=0.01)
+    expect = expyct.List(all=expyct.AsyncSatisfies(store.exists, max_concurrency=5))
+    assert not run(expect.amatch(list(range(100))))
+    assert len(store.calls) < 20
+    assert store.running == 0
+
+
+def test_async_satisfies_any():
+    store = FakeStore([7])
+    expect = expyct.Set(any=expyct.AsyncSatisfies(store.exists), min_length=3)
+    assert run(expect.amatch({1, 7, 9}))
+    assert not run(expect.amatch({1, 9}))
+    assert not run(expect.amatch({7}))
+
+
+def test_async_satisfies_cached_per_value():
+    store = FakeStore([1, 2])
+    expect = expyct.List(all=expyct.AsyncSatisfies(store.exists))
+    assert run(expect.amatch([1, 2, 1, 2, 1]))
+    assert sorted(store.calls) == [1, 2]
@@ -0,0 +1,148 @@
+import array
+import mmap
+import re
+import struct
+
+import pytest
+
+import expyct as exp
+
+
+def mapped(data: bytes) -> mmap.mmap:
+    """Returns an anonymous memory map containing `data`."""
+    m = mmap.mmap(-1, len(data))
+    m.write(data)
+    return m
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        # test type
+        (b"abc", exp.Bytes(), True),
+        (bytearray(b"abc"), exp.Bytes(), True),
+        (memoryview(b"abc"), exp.Bytes(), True),
+        (array.array("B", b"abc"), exp.Bytes(), True),
+        ("abc", exp.Bytes(), False),
+        (1, exp.Bytes(), False),
+        # test map before
+        ("abc", exp.Bytes(map_before=str.encode, equals=b"abc"), True),
+        # test optional
+        (None, exp.Bytes(), False),
+        (None, exp.Bytes(optional=True), True),
+        # test equals
+        (b"abc", exp.Bytes(equals=b"ab"), False),
+        (bytearray(b"abc"), exp.Bytes(equals=b"abc"), True),
+        # test length
+        (b"abc", exp.Bytes(length=2), False),
+        (memoryview(b"abc"), exp.Bytes(length=3), True),
+        (array.array("H", [1, 2]), exp.Bytes(length=4), True),
+        (b"ab", exp.Bytes(min_length=3), False),
+        (b"abc", exp.Bytes(min_length=3), True),
+        (b"abcd", exp.Bytes(max_length=3), False),
+        (b"abc", exp.Bytes(max_length=3), True),
+        (b"", exp.Bytes(non_empty=True), False),
+        (b"a", exp.Bytes(non_empty=True), True),
+        # test satisfies
+        (b"abc", exp.Bytes(satisfies=lambda x: len(x) == 10), False),
+        (b"abc", exp.Bytes(satisfies=lambda x: x[0] == ord("a")), True),
+        # test starts with
+        (b"abcd", exp.Bytes(starts_with=b"cd"), False),
+        (memoryview(b"abcd"), exp.Bytes(starts_with=b"ab"), True),
+        (b"ab", exp.Bytes(starts_with=b"abc"), False),
+        # test ends with
+        (b"abcd", exp.Bytes(ends_with=b"ab"), False),
+        (memoryview(b"abcd"), exp.Bytes(ends_with=b"cd"), True),
+        (b"cd", exp.Bytes(ends_with=b"bcd"), False),
+        # test contains
+        (b"abcd", exp.Bytes(contains=b"ca"), False),
+        (b"abcd", exp.Bytes(contains=b"bc"), True),
+        (memoryview(b"abcd"), exp.Bytes(contains=b"ca"), False),
+        (memoryview(b"a.cd"), exp.Bytes(contains=b"."), True),
+        (memoryview(b"abcd"), exp.Bytes(contains=b"."), False),
+        # test regex
+        (b"abc", exp.Bytes(regex=b"ab"), False),
+        (b"abc", exp.Bytes(regex=b"ab."), True),
+        (memoryview(b"abc"), exp.Bytes(regex=re.compile(b"[a-c]+")), True),
+        (b"abc", exp.Bytes(regex="abc"), False),
+    ],
+)
+def test_bytes_eq(value, expect, result):
+    assert (value == expect) == result
+
+
+def test_bytes_mmap():
+    m = mapped(b"HEADER" + bytes(1000) + b"TRAILER")
+    assert m == exp.Bytes(
+        length=1013, starts_with=b"HEADER", ends_with=b"TRAILER", contains=b"\x00" * 100
+    )
+    assert not m == exp.Bytes(contains=b"MISSING")
+    # The view on the mmap must have been released
+    m.close()
+
+
+def test_bytes_in_list():
+    """Tests that buffers compared with `==` from the left are still matched by Bytes."""
+    assert [memoryview(b"ab"), bytearray(b"abc")] == exp.List(all=exp.Bytes(starts_with=b"ab"))
+
+
+FRAME = struct.pack("<IHHq", 7, 1, 2, -5)
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        # test type
+        (FRAME, exp.Struct("<IHHq"), True),
+        (bytearray(FRAME), exp.Struct("<IHHq"), True),
+        (memoryview(FRAME), exp.Struct("<IHHq"), True),
+        ("abc", exp.Struct("<IHHq"), False),
+        (FRAME[:-1], exp.Struct("<IHHq"), False),
+        # test optional
+        (None, exp.Struct("<I"), False),
+        (None, exp.Struct("<I", optional=True), True),
+        # test fields
+        (FRAME, exp.Struct("<IHHq", fields={0: 7, 3: -5}), True),
+        (FRAME, exp.Struct("<IHHq", fields={0: exp.Int(min=1), 2: exp.Int(max=1)}), False),
+        (FRAME, exp.Struct("<IHHq", fields={0: exp.Int(min=1), 2: exp.Int(max=2)}), True),
+        # test offset
+        (b"xx" + FRAME, exp.Struct("<IHHq", fields={0: 7}, offset=2), True),
+        (b"xx" + FRAME, exp.Struct("<IHHq", fields={0: 7}), False),
+        (FRAME, exp.Struct("<IHHq", offset=1), False),
+        # test satisfies
+        (FRAME, exp.Struct("<I", satisfies=lambda x: len(x) == 16), True),
+    ],
+)
+def test_struct_eq(value, expect, result):
+    assert (value == expect) == result
+
+
+RECORDS = b"".join(struct.pack("<Ih", i, -i) for i in range(1, 101))
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        (RECORDS, exp.Struct("<Ih", repeated=True), True),
+        (b"", exp.Struct("<Ih", repeated=True), True),
+        (RECORDS[:-1], exp.Struct("<Ih", repeated=True), False),
+        (RECORDS, exp.Struct("<Ih", repeated=True, count=100), True),
+        (RECORDS, exp.Struct("<Ih", repeated=True, count=99), False),
+        (RECORDS, exp.Struct("<Ih", repeated=True, fields={0: exp.Int(min=1)}), True),
+        (RECORDS, exp.Struct("<Ih", repeated=True, fields={1: exp.Int(min=-99)}), False),
+        (b"hdr" + RECORDS, exp.Struct("<Ih", repeated=True, offset=3, count=100), True),
+        (mapped(RECORDS), exp.Struct("<Ih", repeated=True, fields={1: exp.Int(max=-1)}), True),
+    ],
+)
+def test_struct_repeated_eq(value, expect, result):
+    assert (value == expect) == result
+
+
+@pytest.mark.parametrize("fields", [{2: 0}, {-3: 0}, {"a": 0}])
+def test_struct_invalid_field(fields):
+    with pytest.raises(ValueError):
+        exp.Struct(format="<4sH", fields=fields)
+
+
+def test_struct_negative_field():
+    assert struct.pack("<HI", 1, 2) == exp.Struct(format="<HI", fields={-1: 2})
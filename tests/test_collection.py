@@ -1,9 +1,14 @@
+import itertools
+import tracemalloc
 import typing
 from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
 
 import pytest
 
 import expyct as exp
+from tests.utils import run
 
 
 @pytest.mark.parametrize(
@@ -60,12 +65,68 @@ import expyct as exp
         # test any
         ([1, 2, 3, 4], exp.Collection(any=5), False),
         ([2, 5, 2], exp.Collection(any=5), True),
+        # test count matching
+        ([1, 2, 3, 4], exp.Collection(count_matching=(exp.Int(min=3), 2, 2)), True),
+        ([1, 2, 3, 4], exp.Collection(count_matching=(exp.Int(min=3), 3, None)), False),
+        ([1, 2, 3, 4], exp.Collection(count_matching=(exp.Int(min=3), None, 1)), False),
+        ([1, 2, 3, 4], exp.Collection(count_matching=(exp.Int(min=3), 1, None)), True),
+        # test unique
+        ([1, 2, 3], exp.Collection(unique=True), True),
+        ([1, 2, 1], exp.Collection(unique=True), False),
+        ([[1], [2], [3]], exp.Collection(unique=True), True),
+        ([[1], [2], [1]], exp.Collection(unique=True), False),
+        ([{1: 1}, {2: 2}, {1: 1}], exp.Collection(unique=True), False),
+        ([{1: 1}, [1], {2: 2}], exp.Collection(unique=True), True),
+        # test sorted
+        ([1, 2, 2, 3], exp.Collection(sorted=True), True),
+        ([1, 3, 2], exp.Collection(sorted=True), False),
+        ([1, "a"], exp.Collection(sorted=True), False),
+        (["c", "bb", "aaa"], exp.Collection(sorted_by=len), True),
+        (["aaa", "bb", "c"], exp.Collection(sorted_by=len), False),
+        # test sum
+        ([1, 2, 3], exp.Collection(sum_min=6, sum_max=6), True),
+        ([1, 2, 3], exp.Collection(sum_min=7), False),
+        ([1, 2, 3], exp.Collection(sum_max=5), False),
+        (
+            [{"amount": 2}, {"amount": 3}],
+            exp.Collection(sum_max=5, sum_by=lambda x: x["amount"]),
+            True,
+        ),
+        ([{"amount": 2}, {}], exp.Collection(sum_max=5, sum_by=lambda x: x["amount"]), False),
+        ([1, "a"], exp.Collection(sum_max=5), False),
+        (
+            [timedelta(minutes=20), timedelta(minutes=30)],
+            exp.Collection(sum_min=timedelta(minutes=50), sum_max=timedelta(hours=1)),
+            True,
+        ),
+        ([timedelta(minutes=20)] * 4, exp.Collection(sum_max=timedelta(hours=1)), False),
+        ([], exp.Collection(sum_max=timedelta(hours=1)), True),
+        ([], exp.Collection(sum_min=timedelta(hours=1)), False),
+        (
+            [{"amount": Decimal("1.5")}, {"amount": Decimal("2.5")}],
+            exp.Collection(sum_min=Decimal(4), sum_by=lambda x: x["amount"]),
+            True,
+        ),
+        ([timedelta(minutes=1)], exp.Collection(sum_max=5), False),
+        # test combined with all and any
+        ([1, 2, 3], exp.Collection(all=exp.Int(), any=3, unique=True, sorted=True), True),
+        ([1, 2, 4], exp.Collection(all=exp.Int(), any=3, unique=True, sorted=True), False),
     ],
 )
 def test_collection_eq(value, expect, result):
     assert (value == expect) == result
 
 
+def test_collection_aggregate_stops_early():
+    calls = []
+    counted = exp.Any(satisfies=lambda x: calls.append(x) or True)
+    assert [1, 2, 3, 4] == exp.Collection(count_matching=(counted, 2, None))
+    assert calls == [1, 2]
+    calls.clear()
+    assert not [1, 2, 1, 3] == exp.Collection(all=counted, unique=True)
+    assert calls == [1, 2, 1]
+
+
 @pytest.mark.xfail  # TODO not yet implemented
 def test_collection_instance():
     obj: typing.Collection = exp.Collection()
@@ -143,6 +204,38 @@ def test_collection_instance():
         # test any
         ([1, 2, 3, 4], exp.List(any=5), False),
         ([2, 5, 2], exp.List(any=5), True),
+        # test aggregates
+        ([1, 2, 3], exp.List(sorted=True, unique=True, sum_max=6), True),
+        ([1, 2, 2], exp.List(unique=True), False),
+        # test items and rest
+        ([1, "a"], exp.List(items=[exp.Int(), exp.String()]), True),
+        ([1, "a", "b"], exp.List(items=[exp.Int()], rest=exp.String()), True),
+        ([1, "a", 2], exp.List(items=[exp.Int()], rest=exp.String()), False),
+        # test contains in order
+        ([1, 2, 3, 4], exp.List(contains_in_order=[1, 3]), True),
+        ([1, 2, 3, 4], exp.List(contains_in_order=[3, 1]), False),
+        ([1, 2, 3, 4], exp.List(contains_in_order=[]), True),
+        ([1, 2], exp.List(contains_in_order=[1, 2, 3]), False),
+        ([1, "a", 2], exp.List(contains_in_order=[exp.Int(), exp.Int()]), True),
+        ([1, "a"], exp.List(contains_in_order=[exp.Int(), exp.Int()]), False),
+        # test contains run
+        ([1, 2, 3, 4], exp.List(contains_run=[2, 3]), True),
+        ([1, 2, 3, 4], exp.List(contains_run=[1, 3]), False),
+        ([1, 2, 1, 2, 1, 3], exp.List(contains_run=[1, 2, 1, 3]), True),
+        ([1, 2], exp.List(contains_run=[]), True),
+        ([1, 2], exp.List(contains_run=[1, 2, 3]), False),
+        (["a", 1, 2], exp.List(contains_run=[exp.Int(), 2]), True),
+        ([1, "a", 2], exp.List(contains_run=[exp.Int(), 2]), False),
+        (
+            [{"v": 2}, {"v": 1}, {"v": 2}, {"v": 2}, {"v": 1}],
+            exp.List(contains_run=[{"v": 1}, {"v": exp.ANY}, {"v": 1}]),
+            False,
+        ),
+        (
+            [{"v": 2}, {"v": 1}, {"v": 2}, {"v": 1}],
+            exp.List(contains_run=[{"v": 1}, {"v": exp.ANY}, {"v": 1}]),
+            True,
+        ),
     ],
 )
 def test_list_eq(value, expect, result):
@@ -201,12 +294,46 @@ def test_list_instance():
         # test any
         ((1, 2, 3, 4), exp.Tuple(any=5), False),
         ((2, 5, 2), exp.Tuple(any=5), True),
+        # test aggregates
+        ((1, 2, 3), exp.Tuple(sorted=True, unique=True, sum_max=6), True),
+        ((1, 3, 2), exp.Tuple(sorted=True), False),
+        # test items
+        ((1, "a"), exp.Tuple(items=[exp.Int(), exp.String()]), True),
+        ((1, 2), exp.Tuple(items=[exp.Int(), exp.String()]), False),
+        ((1, "a", 3), exp.Tuple(items=[exp.Int(), exp.String()]), False),
+        ((1,), exp.Tuple(items=[exp.Int(), exp.String()]), False),
+        ((1, "a"), exp.Tuple(items=[1, "a"]), True),
+        ((1, "b"), exp.Tuple(items=[1, "a"]), False),
+        # test rest
+        ((1, 7, "x", "y"), exp.Tuple(items=[1, exp.Int()], rest=exp.String()), True),
+        ((1, 7), exp.Tuple(items=[1, exp.Int()], rest=exp.String()), True),
+        ((1, 7, "x", 2), exp.Tuple(items=[1, exp.Int()], rest=exp.String()), False),
+        ((1,), exp.Tuple(items=[1, exp.Int()], rest=exp.String()), False),
+        (("x", "y"), exp.Tuple(rest=exp.String()), True),
+        ((exp.Int(),), exp.Tuple(items=[exp.Int()]), True),
+        # test contains in order
+        ((1, 2, 3, 4), exp.Tuple(contains_in_order=(2, 4)), True),
+        ((1, 2, 3, 4), exp.Tuple(contains_in_order=(4, 2)), False),
+        # test contains run
+        ((1, 2, 3, 4), exp.Tuple(contains_run=(3, 4)), True),
+        ((1, 2, 3, 4), exp.Tuple(contains_run=(2, 4)), False),
     ],
 )
 def test_tuple_eq(value, expect, result):
     assert (value == expect) == result
 
 
+def test_contains_run_kmp():
+    # Compare with slicing on all short sequences of a small alphabet
+    for n in range(7):
+        for value in itertools.product("ab", repeat=n):
+            for m in range(1, 4):
+                for expected in itertools.product("ab", repeat=m):
+                    found = any(value[i : i + m] == expected for i in range(n - m + 1))
+                    matched = value == exp.Tuple(contains_run=expected)
+                    assert matched is found
+
+
 def test_tuple_instance():
     obj: tuple = exp.Tuple()
     assert isinstance(obj, tuple)
@@ -259,6 +386,9 @@ def test_tuple_instance():
         # test any
         ({1, 2, 3, 4}, exp.Set(any=5), False),
         ({2, 5, 2}, exp.Set(any=5), True),
+        # test aggregates
+        ({1, 2, 3}, exp.Set(count_matching=(exp.Int(max=2), 2, 2), sum_min=6), True),
+        ({1, 2, 3}, exp.Set(sum_max=5), False),
     ],
 )
 def test_set_eq(value, expect, result):
@@ -332,3 +462,211 @@ def test_dict_eq(value, expect, result):
 def test_dict_instance():
     obj: dict = exp.Dict()
     assert isinstance(obj, dict)
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        # test type
+        (iter([]), exp.Iterable(), True),
+        ((x for x in range(3)), exp.Iterable(), True),
+        ([1, 2], exp.Iterable(), True),
+        (1, exp.Iterable(), False),
+        # test map before
+        (3, exp.Iterable(map_before=range, length=3), True),
+        # test optional
+        (None, exp.Iterable(), False),
+        (None, exp.Iterable(optional=True), True),
+        # test length
+        (iter([1, 2, 3]), exp.Iterable(length=2), False),
+        (iter([1, 2, 3]), exp.Iterable(length=3), True),
+        # test min length
+        (iter([1, 2]), exp.Iterable(min_length=3), False),
+        (iter([1, 2, 3]), exp.Iterable(min_length=3), True),
+        # test max length
+        (iter([1, 2, 3, 4]), exp.Iterable(max_length=3), False),
+        (iter([1, 2, 3]), exp.Iterable(max_length=3), True),
+        # test non-empty
+        (iter([]), exp.Iterable(non_empty=True), False),
+        (iter([1]), exp.Iterable(non_empty=True), True),
+        # test all
+        (iter([1, 2, 3, 4]), exp.Iterable(all=2), False),
+        (iter([2, 2, 2]), exp.Iterable(all=2), True),
+        (iter([2, 3]), exp.Iterable(all=exp.Int(min=2)), True),
+        # test any
+        (iter([1, 2, 3, 4]), exp.Iterable(any=5), False),
+        (iter([2, 5, 2]), exp.Iterable(any=5), True),
+        (iter([2, 5, 2]), exp.Iterable(any=5, min_length=4), False),
+    ],
+)
+def test_iterable_eq(value, expect, result):
+    assert (value == expect) == result
+
+
+def test_iterable_stops_early():
+    """Tests that an iterable is consumed only as far as needed to know the result."""
+    consumed = []
+
+    def numbers():
+        for i in itertools.count():
+            consumed.append(i)
+            yield i
+
+    assert not numbers() == exp.Iterable(all=exp.Int(max=2))
+    assert consumed == [0, 1, 2, 3]
+
+    consumed.clear()
+    assert not numbers() == exp.Iterable(max_length=5)
+    assert consumed == [0, 1, 2, 3, 4, 5]
+
+    consumed.clear()
+    assert numbers() == exp.Iterable(any=3, min_length=2)
+    assert consumed == [0, 1, 2, 3]
+
+
+def test_iterable_memory_does_not_grow():
+    """Tests that the scratch cache of the members is not kept for the whole iterable."""
+    expect = exp.Iterable(all=exp.String(map_before=str.upper))
+
+    def peak(length):
+        tracemalloc.start()
+        try:
+            assert (str(i) for i in range(length)) == expect
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peak(10)
+    short, long = peak(1000), peak(20000)
+    assert long < 2 * short
+
+
+def test_iterable_tee_replay():
+    expect = exp.Iterable(all=exp.Int(max=2), tee=True)
+    assert not iter([1, 2, 3, 4]) == expect
+    assert list(expect.replay()) == [1, 2, 3, 4]
+
+
+def test_iterable_replay_requires_tee():
+    with pytest.raises(ValueError):
+        exp.Iterable().replay()
+
+
+def test_iterable_replay_cleared_by_next_match():
+    expect = exp.Iterable(tee=True)
+    assert iter([1, 2]) == expect
+    assert not 3 == expect
+    with pytest.raises(ValueError):
+        expect.replay()
+
+
+def test_iterable_match_and_replay():
+    expect = exp.Iterable(all=exp.Int(max=2))
+    matched, replay = expect.match_and_replay(iter([1, 2, 3, 4]))
+    assert not matched
+    assert list(replay) == [1, 2, 3, 4]
+    assert expect.match_and_replay(3) == (False, None)
+    # Nothing is kept on the matcher
+    with pytest.raises(ValueError):
+        expect.replay()
+
+
+async def agen(values, consumed=None):
+    for x in values:
+        if consumed is not None:
+            consumed.append(x)
+        yield x
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        # test type
+        (agen([]), exp.AsyncIterable(), True),
+        ([1, 2], exp.AsyncIterable(length=2), True),
+        (1, exp.AsyncIterable(), False),
+        # test optional
+        (None, exp.AsyncIterable(), False),
+        (None, exp.AsyncIterable(optional=True), True),
+        # test length
+        (agen([1, 2, 3]), exp.AsyncIterable(length=2), False),
+        (agen([1, 2, 3]), exp.AsyncIterable(length=3), True),
+        (agen([1, 2]), exp.AsyncIterable(min_length=3), False),
+        (agen([1, 2, 3, 4]), exp.AsyncIterable(max_length=3), False),
+        (agen([]), exp.AsyncIterable(non_empty=True), False),
+        # test all
+        (agen([1, 2, 3, 4]), exp.AsyncIterable(all=2), False),
+        (agen([2, 2, 2]), exp.AsyncIterable(all=2), True),
+        (agen([2, 3]), exp.AsyncIterable(all=exp.Int(min=2)), True),
+        (
+            agen([agen([1]), agen([])]),
+            exp.AsyncIterable(all=exp.AsyncIterable(non_empty=True)),
+            False,
+        ),
+        # test any
+        (agen([1, 2, 3, 4]), exp.AsyncIterable(any=5), False),
+        (agen([2, 5, 2]), exp.AsyncIterable(any=5), True),
+    ],
+)
+def test_async_iterable_amatch(value, expect, result):
+    assert run(expect.amatch(value)) == result
+
+
+def test_async_iterable_stops_early():
+    consumed = []
+    assert not run(exp.AsyncIterable(all=exp.Int(max=2)).amatch(agen(range(10), consumed)))
+    assert consumed == [0, 1, 2, 3]
+
+
+def test_async_iterable_awaitable():
+    async def fetch():
+        return agen([1, 2])
+
+    assert run(exp.AsyncIterable(length=2).amatch(fetch()))
+
+
+def test_async_iterable_tee_replay():
+    expect = exp.AsyncIterable(all=exp.Int(max=2), tee=True)
+    assert not run(expect.amatch(agen([1, 2, 3, 4])))
+
+    async def collect():
+        return [x async for x in expect.replay()]
+
+    assert run(collect()) == [1, 2, 3, 4]
+
+
+def test_async_iterable_async_members_of_sync_iterable():
+    async def is_even(x):
+        return x % 2 == 0
+
+    assert run(exp.AsyncIterable(all=exp.AsyncSatisfies(is_even)).amatch([2, 4]))
+    assert not run(exp.AsyncIterable(all=exp.AsyncSatisfies(is_even)).amatch([1, 2]))
+    assert run(exp.AsyncIterable(any=exp.AsyncSatisfies(is_even)).amatch(iter([1, 2])))
+
+
+def test_iterable_async_members():
+    async def is_even(x):
+        return x % 2 == 0
+
+    expect = exp.Iterable(all=exp.AsyncSatisfies(is_even), tee=True)
+    assert run(expect.amatch(x for x in [2, 4]))
+    assert list(expect.replay()) == [2, 4]
+    assert not run(expect.amatch(iter([2, 3, 4])))
+    assert run(exp.Iterable(any=exp.AsyncSatisfies(is_even)).amatch([1, 2]))
+    assert run(exp.List(all=exp.Iterable(all=exp.AsyncSatisfies(is_even))).amatch([[2], [4]]))
+    # Without asynchronous members, it is matched as with `==`
+    assert run(exp.Iterable(all=2).amatch([2, 2]))
+    assert not run(exp.Iterable(all=2).amatch(3))
+
+
+def test_async_iterable_amatch_and_replay():
+    async def main():
+        matched, replay = await exp.AsyncIterable(max_length=1).amatch_and_replay(agen([1, 2]))
+        return matched, [x async for x in replay]
+
+    assert run(main()) == (False, [1, 2])
+
+
+def test_async_iterable_eq_raises():
+    with pytest.raises(TypeError):
+        agen([]) == exp.AsyncIterable()
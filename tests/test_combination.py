@@ -15,7 +15,23 @@ import expyct as exp
         (2, exp.OneOf({1, 2, 3}), True),
         ("d", exp.OneOf("abc"), False),
         ("c", exp.OneOf("abc"), True),
+        ("a", exp.OneOf([1]), False),
+        (None, exp.OneOf([1, None]), True),
     ],
 )
 def test_one_of(value, expect, result):
     assert (value == expect) == result
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        (1, exp.AllOf([]), True),
+        (1, exp.AllOf([1]), True),
+        (1, exp.AllOf([exp.Int(min=0), exp.Int(max=2)]), True),
+        (3, exp.AllOf([exp.Int(min=0), exp.Int(max=2)]), False),
+        ("a", exp.AllOf([1]), False),
+    ],
+)
+def test_all_of(value, expect, result):
+    assert (value == expect) == result
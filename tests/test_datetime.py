@@ -3,7 +3,7 @@ from datetime import datetime, date, time, timedelta, timezone
 import pytest
 
 import expyct as exp
-from expyct import parse_isoformat
+from expyct import parse_isoformat, parse_format
 
 UTC = timezone.utc
 
@@ -387,3 +387,173 @@ def test_time_instance():
 )
 def test_parse_isoformat(dt, expect):
     assert parse_isoformat(dt) == expect
+
+
+def test_datetime_pandas_timestamp():
+    pandas = pytest.importorskip("pandas")
+    value = pandas.Timestamp(2020, 1, 2)
+    assert (exp.DateTime(after=datetime(2020, 1, 1)) == value) is True
+    assert (exp.DateTime(before=datetime(2020, 1, 1)) == value) is False
+    assert (exp.Date() == value) is False
+    assert (exp.DateTimeTz() == value) is False
+    assert (
+        exp.DateTimeTz(after=datetime(2020, 1, 1, tzinfo=UTC)) == value.tz_localize(UTC)
+    ) is True
+
+
+def datetime64_cases():
+    numpy = pytest.importorskip("numpy")
+    array = numpy.array(["2020-01-01T00:00", "2020-01-02T12:00", "2020-01-03T00:00"], "M8[ns]")
+    with_nat = numpy.array(["2020-01-01T00:00", "NaT"], "M8[s]")
+    days = numpy.array(["2020-01-01", "2020-01-03"], "M8[D]")
+    return [
+        (array, exp.DateTime(), True),
+        (array, exp.DateTime(after=datetime(2020, 1, 1), before=datetime(2020, 1, 3)), True),
+        (array, exp.DateTime(after_strict=datetime(2020, 1, 1)), False),
+        (array, exp.DateTime(before_strict=datetime(2020, 1, 3)), False),
+        (array[1], exp.DateTime(equals=datetime(2020, 1, 2, 12)), True),
+        (array[1], exp.DateTime(satisfies=lambda x: x.hour == 12), True),
+        (array, exp.DateTime(satisfies=lambda x: x.hour == 12), False),
+        (with_nat, exp.DateTime(), False),
+        (with_nat, exp.DateTime(optional=True, before=datetime(2020, 1, 1)), True),
+        (
+            array,
+            exp.DateTimeTz(after=datetime(2020, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))),
+            True,
+        ),
+        (array, exp.DateTimeTz(satisfies=lambda x: x.tzinfo == UTC), True),
+        (array, exp.Date(), False),
+        (days, exp.Date(after=date(2020, 1, 1), before_strict=date(2020, 1, 4)), True),
+        (days, exp.Date(satisfies=lambda x: type(x) is date), True),
+        (days, exp.Date(after=date(2020, 1, 2)), False),
+        (days, exp.DateTime(), False),
+        (numpy.array(["2020-01"], "M8[M]"), exp.Date(), False),
+    ]
+
+
+def test_datetime64():
+    for value, expect, result in datetime64_cases():
+        # Not inside the assert, where the comparison would be swapped to the numpy side
+        matched = expect == value
+        assert matched == result
+
+
+def test_datetime64_tz_missing():
+    numpy = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        exp.DateTimeTz(after=datetime(2020, 1, 1)) == numpy.datetime64("2020-01-01T00:00")
+
+
+def test_datetime64_frame():
+    numpy = pytest.importorskip("numpy")
+    columns = {"at": numpy.array(["2020-01-01T00:00", "2020-01-02T00:00"], "M8[us]")}
+    assert columns == exp.Frame(columns={"at": exp.DateTime(after=datetime(2020, 1, 1))})
+    assert not columns == exp.Frame(columns={"at": exp.DateTime(after=datetime(2020, 1, 2))})
+
+
+def test_datetimetz_different_timezones():
+    plus_two = timezone(timedelta(hours=2))
+    value = datetime(2020, 1, 1, 12, tzinfo=plus_two)
+    assert value == exp.DateTimeTz(after=datetime(2020, 1, 1, 10, tzinfo=UTC))
+    assert value == exp.DateTimeTz(before=datetime(2020, 1, 1, 10, tzinfo=UTC))
+    assert not value == exp.DateTimeTz(after_strict=datetime(2020, 1, 1, 10, tzinfo=UTC))
+    assert value == exp.DateTimeTz(before_strict=datetime(2020, 1, 1, 10, 0, 0, 1, tzinfo=UTC))
+
+
+def test_datetimetz_zoneinfo_fold():
+    zoneinfo = pytest.importorskip("zoneinfo")
+    amsterdam = zoneinfo.ZoneInfo("Europe/Amsterdam")
+    # 02:30 happens twice when DST ends, first at 00:30 and then at 01:30 UTC
+    first = datetime(2020, 10, 25, 2, 30, tzinfo=amsterdam)
+    second = datetime(2020, 10, 25, 2, 30, fold=1, tzinfo=amsterdam)
+    matcher = exp.DateTimeTz(before=datetime(2020, 10, 25, 1, tzinfo=UTC))
+    assert first == matcher
+    assert not second == matcher
+    assert datetime(2020, 7, 1, 2, tzinfo=amsterdam) == exp.DateTimeTz(
+        equals=datetime(2020, 7, 1, 0, tzinfo=UTC), after=datetime(2020, 7, 1, tzinfo=UTC)
+    )
+
+
+@pytest.mark.parametrize(
+    ["zone", "local", "fold"],
+    [
+        # DST ends at 02:00 and the clock goes back half an hour to 01:30
+        ("Australia/Lord_Howe", datetime(2023, 4, 2, 1, 45), 1),
+        ("Australia/Lord_Howe", datetime(2023, 4, 2, 1, 45), 0),
+        # The clock went back half an hour from 03:00 to 02:30
+        ("America/Caracas", datetime(2007, 12, 9, 2, 45), 1),
+        ("America/Caracas", datetime(2007, 12, 9, 2, 45), 0),
+    ],
+)
+def test_datetimetz_zoneinfo_offset_changes_within_hour(zone, local, fold):
+    zoneinfo = pytest.importorskip("zoneinfo")
+    value = local.replace(tzinfo=zoneinfo.ZoneInfo(zone), fold=fold)
+    instant = value.astimezone(UTC)
+    assert value == exp.DateTimeTz(after=instant, before=instant)
+    assert not value == exp.DateTimeTz(after_strict=instant)
+    assert not value == exp.DateTimeTz(before_strict=instant)
+
+
+def test_datetimetz_relative_bounds_are_not_frozen():
+    """Tests that a `timedelta` bound is resolved on every evaluation, not only the first."""
+    matcher = exp.DateTimeTz(after=timedelta(seconds=-10))
+    assert datetime.now(UTC) == matcher
+    assert matcher.after == timedelta(seconds=-10)
+    assert not datetime.now(UTC) - timedelta(seconds=20) == matcher
+
+
+def test_datetimetz_bounds_converted_once():
+    matcher = exp.DateTimeTz(after=datetime(2020, 1, 1, tzinfo=UTC))
+    assert datetime(2021, 1, 1, tzinfo=UTC) == matcher
+    bounds = matcher._bounds_us
+    assert datetime(2022, 1, 1, tzinfo=UTC) == matcher
+    assert matcher._bounds_us is bounds
+    matcher.after = datetime(2021, 6, 1, tzinfo=UTC)
+    assert not datetime(2021, 1, 1, tzinfo=UTC) == matcher
+
+
+@pytest.mark.parametrize(
+    ["dt", "format"],
+    [
+        ("01/02/2020 03:04", "%d/%m/%Y %H:%M"),
+        ("20200102T030405", "%Y%m%dT%H%M%S"),
+        ("20200102t030405", "%Y%m%dT%H%M%S"),
+        ("1/2/2020 3:04", "%d/%m/%Y %H:%M"),
+        ("99-01-02", "%y-%m-%d"),
+        ("68-01-02", "%y-%m-%d"),
+        ("12:30", "%H:%M"),
+        ("10%", "%d%%"),
+        ("2020-01-02 03:04:05.12", "%Y-%m-%d %H:%M:%S.%f"),
+        ("Jan 02 2020", "%b %d %Y"),
+    ],
+)
+def test_parse_format(dt, format):
+    assert parse_format(dt, format) == datetime.strptime(dt, format)
+
+
+@pytest.mark.parametrize(
+    ["dt", "format"],
+    [
+        ("2020-13-01", "%Y-%m-%d"),
+        ("2020-02-30", "%Y-%m-%d"),
+        ("2020-01-0x", "%Y-%m-%d"),
+        ("2020/01/01", "%Y-%m-%d"),
+        ("+1/02/2020", "%d/%m/%Y"),
+        ("\u0661\u0662/02/2020", "%d/%m/%Y"),
+    ],
+)
+def test_parse_format_invalid(dt, format):
+    with pytest.raises(ValueError):
+        parse_format(dt, format)
+
+
+def test_datetime_date_format():
+    assert "02/01/2020 03:04" == exp.DateTime(format="%d/%m/%Y %H:%M", after=datetime(2020, 1, 2))
+    assert not "02/01/2020 03:04" == exp.DateTime(
+        format="%d/%m/%Y %H:%M", before=datetime(2020, 1, 2)
+    )
+    assert not "2020-01-02" == exp.DateTime(format="%d/%m/%Y %H:%M")
+    assert datetime(2020, 1, 2) == exp.DateTime(format="%d/%m/%Y %H:%M")
+    assert "20200102" == exp.Date(format="%Y%m%d", equals=date(2020, 1, 2))
+    assert not "20200102" == exp.Date(format="%Y%m%d", after_strict=date(2020, 1, 2))
+    assert not "2020010" == exp.Date(format="%Y%m%d")
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from expyct._distance import distance, search
+
+
+def reference(pattern, text, transpositions=False, search=False):
+    """Computes the distance with the textbook dynamic programming algorithm."""
+    m, n = len(pattern), len(text)
+    d = [[0] * (n + 1) for _ in range(m + 1)]
+    for i in range(m + 1):
+        d[i][0] = i
+    for j in range(n + 1):
+        d[0][j] = 0 if search else j
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            d[i][j] = min(
+                d[i - 1][j] + 1,
+                d[i][j - 1] + 1,
+                d[i - 1][j - 1] + (pattern[i - 1] != text[j - 1]),
+            )
+            if transpositions and i > 1 and j > 1:
+                if pattern[i - 1] == text[j - 2] and pattern[i - 2] == text[j - 1]:
+                    d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return min(d[m]) if search else d[m][n]
+
+
+@pytest.mark.parametrize(
+    ["pattern", "text", "transpositions", "expect"],
+    [
+        ("", "", False, 0),
+        ("", "abc", False, 3),
+        ("abc", "", False, 3),
+        ("kitten", "sitting", False, 3),
+        ("flaw", "lawn", False, 2),
+        ("ab", "ba", False, 2),
+        ("ab", "ba", True, 1),
+        ("ca", "abc", True, 3),
+        ("a" * 100, "a" * 99 + "b", False, 1),
+    ],
+)
+def test_distance(pattern, text, transpositions, expect):
+    assert distance(pattern, text, transpositions=transpositions) == expect
+
+
+def test_distance_max_distance():
+    assert distance("kitten", "sitting", max_distance=3) == 3
+    assert distance("kitten", "sitting", max_distance=2) == 3
+    assert distance("abc", "abcdefgh", max_distance=1) == 2
+    assert distance("abcdefgh", "zyxwvuts", max_distance=0) == 1
+
+
+@pytest.mark.parametrize(
+    ["pattern", "text", "max_distance", "expect"],
+    [
+        ("needle", "haystack with a neadle in it", 1, True),
+        ("needle", "haystack with a nedle in it", 1, True),
+        ("needle", "haystack with a nadle in it", 1, False),
+        ("", "anything", 0, True),
+        ("ab", "", 1, False),
+        ("ab", "", 2, True),
+    ],
+)
+def test_search(pattern, text, max_distance, expect):
+    assert search(pattern, text, max_distance) == expect
+
+
+@pytest.mark.parametrize("transpositions", [False, True])
+def test_against_reference(transpositions):
+    rnd = random.Random(0)
+    for _ in range(2000):
+        pattern = "".join(rnd.choice("abc") for _ in range(rnd.randint(0, 8)))
+        text = "".join(rnd.choice("abc") for _ in range(rnd.randint(0, 10)))
+        k = rnd.randint(0, 3)
+        expect = reference(pattern, text, transpositions)
+        assert distance(pattern, text, transpositions=transpositions) == expect
+        assert distance(pattern, text, k, transpositions) == min(expect, k + 1)
+        within = reference(pattern, text, transpositions, search=True) <= k
+        assert search(pattern, text, k, transpositions) == within
@@ -0,0 +1,126 @@
+import pytest
+
+import expyct as exp
+from expyct.formats import ANY_UUID_ANY_VERSION
+
+UUID4 = "2f8b1a9e-6c1d-4b7e-9a3f-0c5d2e4f6a7b"
+UUID1 = "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        (UUID4, ANY_UUID_ANY_VERSION, True),
+        (UUID4.upper(), ANY_UUID_ANY_VERSION, True),
+        (UUID1, ANY_UUID_ANY_VERSION, True),
+        (UUID4[:-1], ANY_UUID_ANY_VERSION, False),
+        (UUID4[:-1] + "g", ANY_UUID_ANY_VERSION, False),
+        (UUID4.replace("-", ""), ANY_UUID_ANY_VERSION, False),
+        ("2f8b1a9e6-c1d-4b7e-9a3f-0c5d2e4f6a7b", ANY_UUID_ANY_VERSION, False),
+        ("2f8b1a9e-6c1d-4b7e-9a3f--c5d2e4f6a7b", ANY_UUID_ANY_VERSION, False),
+        (UUID4, exp.ANY_UUID4, True),
+        (UUID4.upper(), exp.ANY_UUID4, True),
+        (UUID1, exp.ANY_UUID4, False),
+        (UUID1, exp.Uuid(version=1), True),
+        ("2f8b1a9e-6c1d-4b7e-7a3f-0c5d2e4f6a7b", exp.ANY_UUID4, False),
+        (None, ANY_UUID_ANY_VERSION, False),
+        (None, exp.Uuid(optional=True), True),
+        (1, ANY_UUID_ANY_VERSION, False),
+        (UUID4.encode(), ANY_UUID_ANY_VERSION, False),
+        (" " + UUID4, exp.Uuid(map_before=str.strip), True),
+    ],
+)
+def test_uuid(value, expect, result):
+    assert (value == expect) == result
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        ("0123456789abcdefABCDEF", exp.ANY_HEX, True),
+        ("d41d8cd98f00b204e9800998ecf8427e", exp.Hex(length=32), True),
+        ("d41d8cd98f00b204e9800998ecf8427e", exp.Hex(length=40), False),
+        ("", exp.ANY_HEX, False),
+        ("0x1f", exp.ANY_HEX, False),
+        ("ab cd", exp.ANY_HEX, False),
+    ],
+)
+def test_hex(value, expect, result):
+    assert (value == expect) == result
+
+
+@pytest.mark.parametrize(
+    ["value", "result"],
+    [
+        ("192.168.0.1", True),
+        ("0.0.0.0", True),
+        ("255.255.255.255", True),
+        ("256.0.0.1", False),
+        ("1.2.3", False),
+        ("1.2.3.4.5", False),
+        ("1.2..4", False),
+        ("01.2.3.4", False),
+        ("1.2.3.+4", False),
+        ("1.2.3.4 ", False),
+        ("١.2.3.4", False),
+        ("::1", False),
+    ],
+)
+def test_ipv4(value, result):
+    assert (value == exp.ANY_IPV4) == result
+
+
+@pytest.mark.parametrize(
+    ["value", "result"],
+    [
+        ("::1", True),
+        ("2001:db8::1", True),
+        ("2001:0db8:0000:0000:0000:ff00:0042:8329", True),
+        ("::ffff:192.168.0.1", True),
+        ("2001:db8:::1", False),
+        ("2001:db8::g", False),
+        ("192.168.0.1", False),
+        ("", False),
+    ],
+)
+def test_ipv6(value, result):
+    assert (value == exp.ANY_IPV6) == result
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        ("aGVsbG8=", exp.ANY_BASE64, True),
+        ("aGVsbA==", exp.ANY_BASE64, True),
+        ("aGVs", exp.ANY_BASE64, True),
+        ("", exp.ANY_BASE64, True),
+        ("aGVsbG8", exp.ANY_BASE64, False),
+        ("aGVsb===", exp.ANY_BASE64, False),
+        ("aGV=bG8=", exp.ANY_BASE64, False),
+        ("a+/b", exp.ANY_BASE64, True),
+        ("a-_b", exp.ANY_BASE64, False),
+        ("a-_b", exp.Base64(urlsafe=True), True),
+        ("a+/b", exp.Base64(urlsafe=True), False),
+        ("aGVsbG8", exp.Base64(padded=False), True),
+        ("aGVsbG8=", exp.Base64(padded=False), False),
+        ("aGVsb", exp.Base64(padded=False), False),
+    ],
+)
+def test_base64(value, expect, result):
+    assert (value == expect) == result
+
+
+@pytest.mark.parametrize(
+    ["value", "result"],
+    [
+        ("01ARZ3NDEKTSV4RRFFQ69G5FAV", True),
+        ("01arz3ndektsv4rrffq69g5fav", True),
+        ("7ZZZZZZZZZZZZZZZZZZZZZZZZZ", True),
+        ("8ZZZZZZZZZZZZZZZZZZZZZZZZZ", False),
+        ("01ARZ3NDEKTSV4RRFFQ69G5FA", False),
+        ("01ARZ3NDEKTSV4RRFFQ69G5FAI", False),
+        ("01ARZ3NDEKTSV4RRFFQ69G5FAU", False),
+    ],
+)
+def test_ulid(value, result):
+    assert (value == exp.ANY_ULID) == result
@@ -0,0 +1,118 @@
+import io
+import sys
+
+import pytest
+
+import expyct as exp
+from expyct.number import ANY_FLOAT_STRING, ANY_INT_STRING
+
+COLUMNS = {
+    "id": [1, 2, 3, 4],
+    "name": ["a", "b", "b", "a"],
+    "price": [1.5, 2.0, 0.5, 3.25],
+}
+
+CSV = "id,name,price\n1,a,1.5\n2,b,2.0\n3,b,0.5\n4,a,3.25\n"
+
+
+def test_match_columns():
+    assert COLUMNS == exp.Frame(
+        columns={"id": exp.Int(min=1), "name": exp.String(regex="[ab]"), "price": exp.Float()}
+    )
+    assert COLUMNS == exp.Frame(columns={"id": exp.Int()}, length=4)
+
+
+def test_match_columns_wrong():
+    assert not COLUMNS == exp.Frame(columns={"id": exp.Int(min=2)})
+    assert not COLUMNS == exp.Frame(columns={"email": exp.ANY})
+    assert not COLUMNS == exp.Frame(length=3)
+
+
+def test_match_not_columnar():
+    assert not [1, 2] == exp.Frame()
+    assert not {"id": [1, 2], "name": ["a"]} == exp.Frame()
+    assert not {"id": 1} == exp.Frame()
+
+
+def test_match_optional():
+    assert None == exp.Frame(optional=True)  # noqa: E711
+    assert not None == exp.Frame()  # noqa: E711
+
+
+def test_match_columns_distinct_values_once():
+    """Tests that each distinct value of a column is only evaluated once."""
+    calls = []
+    matcher = exp.String(satisfies=lambda x: calls.append(x) or True)
+    assert COLUMNS == exp.Frame(columns={"name": matcher})
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_match_columns_distinct_types():
+    assert not {"n": [1, 1.0]} == exp.Frame(columns={"n": exp.Int()})
+
+
+def test_match_csv():
+    matcher = exp.Frame(columns={"id": ANY_INT_STRING, "price": ANY_FLOAT_STRING}, length=4)
+    assert matcher.match_csv(io.StringIO(CSV))
+    assert matcher.match_csv(io.StringIO(CSV), chunk_size=1)
+    assert not exp.Frame(length=3).match_csv(io.StringIO(CSV), chunk_size=1)
+    assert not exp.Frame(length=5).match_csv(io.StringIO(CSV), chunk_size=1)
+    assert not exp.Frame(columns={"name": ANY_INT_STRING}).match_csv(io.StringIO(CSV))
+
+
+def test_match_csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    assert exp.Frame(columns={"name": exp.String(regex="[ab]")}).match_csv(path)
+
+
+def test_match_csv_header_only():
+    assert exp.Frame(columns={"id": exp.Int()}, length=0).match_csv(io.StringIO("id,name\n"))
+    assert not exp.Frame(columns={"email": exp.ANY}).match_csv(io.StringIO("id,name\n"))
+
+
+@pytest.fixture(params=["pandas", "csv"])
+def csv_reader(request, monkeypatch):
+    """Reads CSV files with `pandas` if it is installed, and with the `csv` module."""
+    if request.param == "pandas":
+        pytest.importorskip("pandas")
+    else:
+        monkeypatch.setitem(sys.modules, "pandas", None)
+
+
+def test_match_csv_short_row(csv_reader):
+    data = "id,name\n1\n\n2,b\n"
+    assert exp.Frame(columns={"name": exp.OneOf(["", "b"])}, length=2).match_csv(io.StringIO(data))
+
+
+def test_match_csv_long_row(csv_reader):
+    with pytest.raises(ValueError):
+        exp.Frame().match_csv(io.StringIO("id,name\n1,a\n2,b,c\n"))
+
+
+def test_match_record_array():
+    numpy = pytest.importorskip("numpy")
+    array = numpy.array(
+        [(1, 1.5, "a"), (2, 2.0, "b")], dtype=[("id", "i8"), ("price", "f8"), ("name", "U1")]
+    )
+    assert array == exp.Frame(columns={"id": exp.Int(min=1, max=2), "name": exp.String()})
+    assert array == exp.Frame(columns={"price": exp.Float(min_strict=1)}, length=2)
+    assert not array == exp.Frame(columns={"id": exp.Float()})
+    assert not array == exp.Frame(columns={"id": exp.Int(max_strict=2)})
+    assert not numpy.arange(3) == exp.Frame()
+
+
+def test_match_record_array_bool():
+    """Tests that a boolean column is matched like its values, which are not `Int`."""
+    numpy = pytest.importorskip("numpy")
+    array = numpy.array([(True,), (False,)], dtype=[("flag", "?")])
+    assert not array == exp.Frame(columns={"flag": exp.Int()})
+    assert array == exp.Frame(columns={"flag": exp.Number()})
+
+
+def test_match_data_frame():
+    pandas = pytest.importorskip("pandas")
+    frame = pandas.DataFrame({"id": [1, 2, 3], "name": ["a", None, "c"]})
+    assert frame == exp.Frame(columns={"id": exp.Int(min=1), "name": exp.String(optional=True)})
+    assert not frame == exp.Frame(columns={"name": exp.String()})
+    assert not frame == exp.Frame(length=2)
@@ -0,0 +1,157 @@
+import sys
+import typing
+from dataclasses import dataclass
+
+import pytest
+
+import expyct as exp
+
+
+@dataclass
+class Address:
+    street: str
+    number: int
+
+
+@dataclass
+class Person:
+    name: str
+    age: typing.Optional[int]
+    address: Address
+    tags: typing.List[str]
+
+
+class Point(typing.NamedTuple):
+    x: int
+    y: float
+
+
+class Movie(typing.TypedDict):
+    title: str
+    year: int
+
+
+class PartialMovie(typing.TypedDict, total=False):
+    title: str
+    year: int
+
+
+@dataclass
+class Node:
+    value: int
+    next: typing.Optional["Node"]
+
+
+UserId = typing.NewType("UserId", int)
+Bounded = typing.TypeVar("Bounded", bound=str)
+
+
+@pytest.mark.parametrize(
+    ["value", "tp", "result"],
+    [
+        # test simple types
+        (None, typing.Any, True),
+        (1, object, True),
+        (None, None, True),
+        (1, None, False),
+        (True, bool, True),
+        (1, bool, False),
+        (1, int, True),
+        (1.5, float, True),
+        (1, float, True),
+        ("a", float, False),
+        ("a", str, True),
+        (b"a", bytes, True),
+        ("a", bytes, False),
+        (Address("a", 1), Address, True),
+        # test optional and union
+        (None, typing.Optional[int], True),
+        (1, typing.Optional[int], True),
+        ("a", typing.Optional[int], False),
+        ("a", typing.Union[int, str], True),
+        (b"a", typing.Union[int, str], False),
+        # test literal
+        ("a", typing.Literal["a", "b"], True),
+        ("c", typing.Literal["a", "b"], False),
+        (1, typing.Literal["a", "b"], False),
+        (True, typing.Literal[1], False),
+        (1, typing.Literal[True], False),
+        (0, typing.Literal[False], False),
+        (1, typing.Literal[1], True),
+        (True, typing.Literal[True], True),
+        (None, typing.Literal[1, None], True),
+        (1.0, typing.Literal[1, None], False),
+        # test collections
+        ([1, 2], typing.List[int], True),
+        ([1, "a"], typing.List[int], False),
+        ((1, 2), typing.List[int], False),
+        ([1, "a"], typing.List, True),
+        ([1, "a"], typing.List[typing.Any], True),
+        ((1, "a"), typing.Tuple[int, str], True),
+        ((1, "a", "b"), typing.Tuple[int, str], False),
+        ((1, 2, 3), typing.Tuple[int, ...], True),
+        ((1, "a"), typing.Tuple[int, ...], False),
+        ((), typing.Tuple[()], True),
+        ((1,), typing.Tuple[()], False),
+        ({1, 2}, typing.Set[int], True),
+        ({"a"}, typing.Set[int], False),
+        (frozenset({1}), typing.FrozenSet[int], True),
+        ({1}, typing.FrozenSet[int], False),
+        ({"a": 1}, typing.Dict[str, int], True),
+        ({"a": "b"}, typing.Dict[str, int], False),
+        ([1, 2], typing.Sequence[int], True),
+        ({1, 2}, typing.Sequence[int], False),
+        ({"a": 1}, typing.Mapping[str, int], True),
+        # test typed dict
+        ({"title": "a", "year": 1}, Movie, True),
+        ({"title": "a"}, Movie, False),
+        ({"title": "a", "year": "b"}, Movie, False),
+        ({"title": "a", "year": 1, "x": 2}, Movie, False),
+        ({"title": "a"}, PartialMovie, True),
+        ({"year": "b"}, PartialMovie, False),
+        # test dataclass
+        (Person("a", None, Address("b", 1), ["c"]), Person, True),
+        (Person("a", 1, Address("b", "c"), ["c"]), Person, False),
+        (Person("a", 1, Address("b", 1), [1]), Person, False),
+        (Address("a", "b"), Address, False),
+        ({"street": "a", "number": 1}, Address, False),
+        ([Address("a", 1)], typing.List[Address], True),
+        ([Address("a", "b")], typing.List[Address], False),
+        # test named tuple
+        (Point(1, 2.0), Point, True),
+        (Point(1, "a"), Point, False),
+        ((1, 2.0), Point, False),
+        # test recursive
+        (Node(1, Node(2, None)), Node, True),
+        (Node(1, Node("a", None)), Node, False),
+        # test new type and type var
+        (1, UserId, True),
+        ("a", UserId, False),
+        ("a", Bounded, True),
+        (1, Bounded, False),
+        # test annotated
+        (1, typing.Annotated[int, exp.Int(min=0)], True),
+        (-1, typing.Annotated[int, exp.Int(min=0)], False),
+        ("a", typing.Annotated[int, exp.Int(min=0)], False),
+        (-1, typing.Annotated[int, "not a matcher"], True),
+    ],
+)
+def test_from_type(value, tp, result):
+    assert (value == exp.from_type(tp)) == result
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="X | Y requires 3.10")
+def test_from_type_union_operator():
+    assert 1 == exp.from_type(eval("int | None"))
+    assert None == exp.from_type(eval("int | None"))  # noqa: E711
+    assert not "a" == exp.from_type(eval("int | None"))
+
+
+def test_from_type_cached():
+    assert exp.from_type(typing.List[Address]) is exp.from_type(typing.List[Address])
+    assert exp.from_type(Person) is exp.from_type(Person)
+
+
+def test_from_type_unsupported():
+    with pytest.raises(TypeError):
+        exp.from_type("Person")
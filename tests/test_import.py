@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+import pytest
+
+import expyct as exp
+
+
+def import_times(code: str) -> dict:
+    """Runs `code` in a fresh interpreter with `-X importtime` and returns the cumulative import
+    time in microseconds of each module that was imported."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="module __getattr__ requires 3.7")
+def test_import_is_lazy():
+    """Tests that `import expyct` does not import any of its submodules."""
+    times = import_times("import expyct")
+    assert [module for module in times if module.startswith("expyct")] == ["expyct"]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="module __getattr__ requires 3.7")
+def test_attribute_imports_only_its_submodule():
+    """Tests that accessing a matcher only imports the submodules it depends on."""
+    times = import_times("import expyct; expyct.Int")
+    imported = {module for module in times if module.startswith("expyct.")}
+    assert imported == {"expyct.base", "expyct.number"}
+
+
+@pytest.mark.parametrize("name", exp.__all__)
+def test_all_attributes_resolve(name):
+    assert hasattr(exp, name)
+    assert dir(exp).count(name) == 1
+
+
+def test_submodule_attribute():
+    assert exp.datetime.DateTime is exp.DateTime
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        exp.DoesNotExist
@@ -0,0 +1,114 @@
+import io
+import sqlite3
+
+import pytest
+
+import expyct as exp
+from expyct.io import match_jsonl, match_rows
+
+LINES = [
+    b'{"id": 1, "name": "a"}',
+    b'{"id": 2, "name": "b"}',
+    b'{"id": "3", "name": "c"}',
+    b"",
+    b'{"id": 4}',
+    b"{not json",
+    b'{"id": 6, "name": "f"}',
+]
+
+SCHEMA = exp.Dict(keys={"id", "name"}, values_any=exp.Int(min=1))
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def use_orjson(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(exp.io, "orjson", None)
+    elif exp.io.orjson is None:
+        pytest.skip("orjson is not installed")
+
+
+def test_match_jsonl_path(tmp_path, use_orjson):
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b"\n".join(LINES) + b"\n")
+    assert list(match_jsonl(path, SCHEMA)) == [3, 5, 6]
+    assert list(match_jsonl(str(path), SCHEMA)) == [3, 5, 6]
+
+
+def test_match_jsonl_file_object(use_orjson):
+    assert list(match_jsonl(io.BytesIO(b"\n".join(LINES)), SCHEMA)) == [3, 5, 6]
+    text = io.StringIO(b"\n".join(LINES).decode())
+    assert list(match_jsonl(text, SCHEMA)) == [3, 5, 6]
+
+
+def test_match_jsonl_max_failures():
+    assert list(match_jsonl(io.BytesIO(b"\n".join(LINES)), SCHEMA, max_failures=2)) == [3, 5]
+    assert list(match_jsonl(io.BytesIO(b"\n".join(LINES)), SCHEMA, max_failures=0)) == []
+
+
+def test_match_jsonl_is_lazy():
+    """Tests that lines are only read as far as needed for the failures that are consumed."""
+    file = io.BytesIO(b"\n".join(LINES))
+    failures = match_jsonl(file, SCHEMA)
+    assert next(failures) == 3
+    assert file.tell() < len(b"\n".join(LINES))
+
+
+class FetchCounter:
+    """Wraps a cursor to count the calls to `fetchmany`."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.description = cursor.description
+        self.batches = 0
+
+    def fetchmany(self, size):
+        self.batches += 1
+        return self.cursor.fetchmany(size)
+
+
+@pytest.fixture
+def cursor():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE users (id INTEGER, name TEXT)")
+    connection.executemany(
+        "INSERT INTO users VALUES (?, ?)",
+        [(1, "a"), (2, "b"), (-3, "c"), (4, None), (5, "e")],
+    )
+    cursor = connection.execute("SELECT id, name FROM users ORDER BY rowid")
+    yield cursor
+    connection.close()
+
+
+def test_match_rows_by_column_name(cursor):
+    matcher = {"name": exp.String(), "id": exp.Int(min=1)}
+    assert list(match_rows(cursor, matcher)) == [2, 3]
+
+
+def test_match_rows_by_position(cursor):
+    assert list(match_rows(cursor, [exp.Int(min=1), exp.Any(optional=True)])) == [2]
+
+
+def test_match_rows_by_position_length(cursor):
+    assert list(match_rows(cursor, [exp.Int()])) == [0, 1, 2, 3, 4]
+
+
+def test_match_rows_whole_row(cursor):
+    assert list(match_rows(cursor, exp.Tuple(length=2, all=exp.Satisfies(bool)))) == [3]
+
+
+def test_match_rows_unknown_column(cursor):
+    with pytest.raises(ValueError):
+        list(match_rows(cursor, {"email": exp.ANY}))
+
+
+def test_match_rows_batches(cursor):
+    counter = FetchCounter(cursor)
+    assert list(match_rows(counter, [exp.Int(min=1), exp.Any(optional=True)], batch_size=2)) == [2]
+    assert counter.batches == 4
+
+
+def test_match_rows_max_failures(cursor):
+    counter = FetchCounter(cursor)
+    matcher = {"id": exp.Int(min=2)}
+    assert list(match_rows(counter, matcher, batch_size=1, max_failures=2)) == [0, 2]
+    assert counter.batches == 3
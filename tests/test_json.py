@@ -0,0 +1,34 @@
+import pytest
+
+import expyct as exp
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        # test type
+        ("{}", exp.Json(exp.ANY_DICT), True),
+        (b"{}", exp.Json(exp.ANY_DICT), True),
+        (bytearray(b"{}"), exp.Json(exp.ANY_DICT), True),
+        ({}, exp.Json(exp.ANY_DICT), False),
+        (1, exp.Json(1), False),
+        # test optional
+        (None, exp.Json(exp.ANY), False),
+        (None, exp.Json(exp.ANY, optional=True), True),
+        ("null", exp.Json(None), True),
+        # test invalid
+        ("", exp.Json(exp.ANY), False),
+        ("{", exp.Json(exp.ANY), False),
+        ('{"a": 1,}', exp.Json(exp.ANY), False),
+        ('{"a": 1} x', exp.Json(exp.ANY), False),
+        (b"\xff", exp.Json(exp.ANY), False),
+        # test matcher
+        ("[1, 2]", exp.Json([1, 2]), True),
+        ("[1, 2]", exp.Json(exp.List(all=exp.Int(min=2))), False),
+        ('{"a": 1, "b": [1]}', exp.Json(exp.Dict(superset_of={"a": 1})), True),
+        ('{"a": 1, "b": [1]}', exp.Json(exp.Dict(superset_of={"a": 2})), False),
+        ('{"a": {"b": "c"}}', exp.Json({"a": {"b": exp.String(starts_with="c")}}), True),
+    ],
+)
+def test_json_eq(value, expect, result):
+    assert (value == expect) == result
@@ -130,3 +130,11 @@ def test_parse_int_string(value, expect):
 def test_parse_float_string(value, expect):
     with raises_or_result(expect):
         parse_float_string(value)
+
+
+def test_int_float_map_before_parses_strings():
+    assert "3" == exp.Int(map_before=parse_int_string, min=2)
+    assert not "1.5" == exp.Int(map_before=parse_int_string)
+    assert "1.5" == exp.Float(map_before=parse_float_string, max=2)
+    assert not 1.5 == exp.Float(map_before=parse_float_string)
+    assert None == exp.Int(optional=True)  # noqa: E711
@@ -0,0 +1,75 @@
+import pytest
+
+import expyct as exp
+
+ORDER = {
+    "id": 1,
+    "customer": {"name": "Alice", "email": "alice@example.com"},
+    "items": [{"sku": "a", "price": 3}, {"sku": "b", "price": 5}],
+    "tags": {"x.y": True},
+}
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        # test keys
+        (ORDER, exp.At("id", 1), True),
+        (ORDER, exp.At("id", 2), False),
+        (ORDER, exp.At("customer.name", exp.String(starts_with="A")), True),
+        (ORDER, exp.At("customer.age", exp.ANY), False),
+        (ORDER, exp.At("id.x", exp.ANY), False),
+        (ORDER, exp.At("tags['x.y']", True), True),
+        (ORDER, exp.At('tags["x.y"]', True), True),
+        # test indices
+        (ORDER, exp.At("items[0].sku", "a"), True),
+        (ORDER, exp.At("items[-1].sku", "b"), True),
+        (ORDER, exp.At("items[2].sku", "a"), False),
+        (ORDER, exp.At("customer[0]", exp.ANY), False),
+        ([[1, 2], [3]], exp.At("[1][0]", 3), True),
+        # test wildcards
+        (ORDER, exp.At("items[*].price", exp.Int(min=3)), True),
+        (ORDER, exp.At("items[*].price", exp.Int(min=4)), False),
+        (ORDER, exp.At("items.*.price", exp.Int(min=3)), True),
+        (ORDER, exp.At("customer[*]", exp.String()), True),
+        (ORDER, exp.At("items[*].missing", exp.ANY), False),
+        (ORDER, exp.At("id[*]", exp.ANY), False),
+        ({"a": "bc"}, exp.At("a[*]", exp.ANY), False),
+        ({"a": []}, exp.At("a[*].b", 1), True),
+        # test root
+        (ORDER, exp.At("", exp.Dict(non_empty=True)), True),
+        # test optional
+        (None, exp.At("id", 1), False),
+        (None, exp.At("id", 1, optional=True), True),
+        # test paths
+        (ORDER, exp.Paths({"id": 1, "customer.name": "Alice", "items[*].sku": exp.String()}), True),
+        (ORDER, exp.Paths({"id": 1, "customer.name": "Bob"}), False),
+        (ORDER, exp.Paths({"customer": exp.ANY_DICT, "customer.name": "Alice"}), True),
+        (ORDER, exp.Paths({}), True),
+        (None, exp.Paths({"id": 1}), False),
+    ],
+)
+def test_path_eq(value, expect, result):
+    assert (value == expect) == result
+
+
+def test_paths_share_prefix():
+    class Counting(dict):
+        lookups = 0
+
+        def __getitem__(self, key):
+            Counting.lookups += 1
+            return super().__getitem__(key)
+
+    value = Counting(user={"name": "a", "email": "b"})
+    assert value == exp.Paths({"user.name": "a", "user.email": "b"})
+    # The shared prefix is looked up once
+    assert Counting.lookups == 1
+
+
+@pytest.mark.parametrize("path", ["a..b", ".a", "a[x]", "a[", "a]b", "a[*"])
+def test_path_invalid(path):
+    with pytest.raises(ValueError):
+        exp.At(path, exp.ANY)
+    with pytest.raises(ValueError):
+        exp.Paths({"a": 1, path: exp.ANY})
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+import expyct as exp
+from expyct import polling
+from tests.utils import run
+
+
+class FakeClock:
+    """Replaces the clock and the sleep functions of `Eventually`, so that no real time passes."""
+
+    def __init__(self, monkeypatch):
+        self.now = 0.0
+        self.sleeps = []
+        monkeypatch.setattr(polling, "_monotonic", lambda: self.now)
+        monkeypatch.setattr(polling, "_sleep", self.sleep)
+        monkeypatch.setattr(polling, "_async_sleep", self.async_sleep)
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds):
+        self.sleep(seconds)
+
+
+def counter():
+    """Returns a source that returns 1, 2, 3, ..."""
+    values = iter(range(1, 1000))
+    return lambda: next(values)
+
+
+def test_eventually(monkeypatch):
+    clock = FakeClock(monkeypatch)
+    assert counter() == exp.Eventually(exp.Int(min=3))
+    assert len(clock.sleeps) == 2
+
+
+def test_eventually_timeout(monkeypatch):
+    FakeClock(monkeypatch)
+    assert not counter() == exp.Eventually(exp.Int(min=1000), timeout=1)
+
+
+def test_eventually_source_returns_same_object(monkeypatch):
+    """Tests that every round is matched afresh, even if the source returns the same object."""
+    FakeClock(monkeypatch)
+    values = []
+
+    def source():
+        values.append(1)
+        return values
+
+    assert source == exp.Eventually(exp.Number(map_before=len, min=3), timeout=1)
+
+    values.clear()
+    assert run(exp.Eventually(exp.Number(map_before=len, min=3), timeout=1).amatch(source))
+
+
+def test_eventually_not_callable():
+    assert not 3 == exp.Eventually(3)
+
+
+def test_poll_returns_last_mismatch(monkeypatch):
+    clock = FakeClock(monkeypatch)
+    assert exp.Eventually(exp.Int(min=1000), source=counter(), timeout=1).poll() == 6
+    assert clock.now == 1
+
+
+def test_poll_without_source():
+    with pytest.raises(ValueError):
+        exp.Eventually(1).poll()
+
+
+def test_backoff(monkeypatch):
+    clock = FakeClock(monkeypatch)
+    expect = exp.Eventually(exp.Int(min=7), backoff=0.1, max_backoff=0.5, jitter=0)
+    assert expect.poll(counter()) == 7
+    assert clock.sleeps == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5, 0.5])
+
+
+def test_backoff_jitter(monkeypatch):
+    clock = FakeClock(monkeypatch)
+    exp.Eventually(exp.Int(min=50), backoff=1, max_backoff=1, jitter=0.1, timeout=100).poll(
+        counter()
+    )
+    assert all(0.9 <= s <= 1.1 for s in clock.sleeps)
+    assert len(set(clock.sleeps)) > 1
+
+
+def test_apoll(monkeypatch):
+    clock = FakeClock(monkeypatch)
+    values = counter()
+
+    async def source():
+        return values()
+
+    assert run(exp.Eventually(exp.Int(min=3), source=source).apoll()) == 3
+    assert len(clock.sleeps) == 2
+    assert run(exp.Eventually(exp.Int(min=1000), timeout=1).amatch(source)) is False
+
+
+def test_amatch_does_not_block_event_loop():
+    """Tests that other tasks keep running while polling."""
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.001)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        matched = await exp.Eventually(exp.Int(min=1000), backoff=0.01, timeout=0.05).amatch(
+            counter()
+        )
+        task.cancel()
+        return matched
+
+    assert run(main()) is False
+    assert len(ticks) > 5
@@ -68,6 +68,8 @@ import expyct as exp
         ("abc", exp.String(regex="ABCD?", ignore_case=True), True),
         ("abc", exp.String(regex=re.compile("ABCD?")), False),
         ("abc", exp.String(regex=re.compile("ABCD?", re.IGNORECASE)), True),
+        ("ABC", exp.String(regex=re.compile("[a-z]+"), ignore_case=True), True),
+        ("ABC", exp.String(regex=re.compile("[a-z]+")), False),
     ],
 )
 def test_string_eq(value, expect, result):
@@ -77,3 +79,83 @@ def test_string_eq(value, expect, result):
 def test_string_instance():
     obj: str = exp.String()
     assert isinstance(obj, str)
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        ("abc_XYZ_019", exp.ANY_ALPHANUMERIC_STRING, True),
+        ("", exp.ANY_ALPHANUMERIC_STRING, True),
+        ("abc-def", exp.ANY_ALPHANUMERIC_STRING, False),
+        ("é", exp.ANY_ALPHANUMERIC_STRING, False),
+        ("2f8b1a9e-6c1d-4b7e-9a3f-0c5d2e4f6a7b", exp.ANY_UUID, True),
+        ("2F8B1A9E-6C1D-4B7E-9A3F-0C5D2E4F6A7B", exp.ANY_UUID, True),
+        ("6ba7b810-9dad-11d1-80b4-00c04fd430c8", exp.ANY_UUID, False),
+    ],
+)
+def test_any_constants(value, expect, result):
+    assert (value == expect) == result
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        ("b", exp.String(one_of=["a", "b", "c"]), True),
+        ("d", exp.String(one_of=["a", "b", "c"]), False),
+        ("B", exp.String(one_of=["a", "b", "c"]), False),
+        ("B", exp.String(one_of=["a", "b", "c"], ignore_case=True), True),
+        ("STRASSE", exp.String(one_of=["straße"], ignore_case=True), True),
+        ("b", exp.String(one_of=[]), False),
+        ("https://example.com", exp.String(starts_with=["http://", "https://"]), True),
+        ("ftp://example.com", exp.String(starts_with=["http://", "https://"]), False),
+        ("HTTP://example.com", exp.String(starts_with={"http://"}, ignore_case=True), True),
+        ("ab", exp.String(starts_with=["abc"]), False),
+        ("anything", exp.String(starts_with=["", "x"]), True),
+        ("report.csv", exp.String(ends_with=("csv", ".json")), True),
+        ("report.CSV", exp.String(ends_with=("csv", ".json")), False),
+        ("report.CSV", exp.String(ends_with=("csv", ".json"), ignore_case=True), True),
+        ("report.txt", exp.String(ends_with=("csv", ".json")), False),
+        ("v", exp.String(ends_with=["json"]), False),
+        (b"abc", exp.String(starts_with=[b"ab"], ends_with=[b"bc"], one_of=[b"abc"]), True),
+        (1, exp.String(one_of=["1"], ignore_case=True), False),
+    ],
+)
+def test_string_one_of_and_affixes(value, expect, result):
+    assert (value == expect) == result
+
+
+def test_string_ignore_case_does_not_change_arguments():
+    matcher = exp.String(equals="ABC", starts_with="AB", ends_with="BC", ignore_case=True)
+    assert "abc" == matcher
+    assert matcher.equals == "ABC"
+    assert matcher.starts_with == "AB"
+    assert matcher.ends_with == "BC"
+
+
+def test_string_lookups_rebuilt_on_change():
+    matcher = exp.String(one_of=["a"])
+    assert not "b" == matcher
+    matcher.one_of = ["a", "b"]
+    assert "b" == matcher
+
+
+@pytest.mark.parametrize(
+    ["value", "expect", "result"],
+    [
+        ("Amsterdam", exp.String(close_to="Amsterdam"), True),
+        ("Amsterdan", exp.String(close_to="Amsterdam"), True),
+        ("Amstredam", exp.String(close_to="Amsterdam"), False),
+        ("Amstredam", exp.String(close_to="Amsterdam", max_distance=2), True),
+        ("Amstredam", exp.String(close_to="Amsterdam", transpositions=True), True),
+        ("AMSTERDAN", exp.String(close_to="Amsterdam"), False),
+        ("AMSTERDAN", exp.String(close_to="Amsterdam", ignore_case=True), True),
+        ("Rotterdam", exp.String(close_to="Amsterdam", max_distance=2), False),
+        ("Total amount: 1O0 EUR", exp.String(contains_approx="100 EUR"), True),
+        ("Total amount: 1O0 USD", exp.String(contains_approx="100 EUR"), False),
+        ("Total amount: 1O0 USD", exp.String(contains_approx="100 EUR", max_distance=3), True),
+        ("", exp.String(contains_approx="x"), True),
+        ("", exp.String(contains_approx="xy"), False),
+    ],
+)
+def test_string_approximate(value, expect, result):
+    assert (value == expect) == result
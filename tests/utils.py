@@ -1,6 +1,7 @@
+import asyncio
 import contextlib
 import sys
-from typing import ContextManager, Any
+from typing import Any, Awaitable, ContextManager
 
 import pytest
 
@@ -14,3 +15,12 @@ def raises_or_result(expect: Any) -> ContextManager:
     if type(expect) == type and issubclass(expect, Exception):
         return pytest.raises(expect)
     return contextlib.nullcontext()
+
+
+def run(coroutine: Awaitable) -> Any:
+    """Runs a coroutine to completion in a new event loop and returns its result."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()